@@ -5,7 +5,17 @@ __email__ = "denironyx@gmail.com"
 __version__ = "0.2.0"
 
 from .core import GraphFaker
+from .csr import CSRGraph
 from .fetchers.wiki import WikiFetcher
 from .logger import configure_logging, logger
+from .snapshot import load_graph, save_graph
 
-__all__ = ["GraphFaker", "logger", "configure_logging", "add_file_logging"]
+__all__ = [
+    "GraphFaker",
+    "CSRGraph",
+    "load_graph",
+    "save_graph",
+    "logger",
+    "configure_logging",
+    "add_file_logging",
+]
@@ -0,0 +1,402 @@
+"""
+Content-addressed on-disk caches for generated graphs and downloads.
+
+Graphs are stored as pickles named by a SHA-256 of the source, every
+generation parameter, the seed and the graphfaker version, so a repeated
+generate_graph(..., cache=True) call with the same arguments loads the graph
+instead of regenerating it.
+
+Downloaded source files (the BTS on-time zips and lookup table, OpenFlights
+airports) are stored by a SHA-256 of their URL next to the response's ETag
+and Last-Modified headers. A cached file is revalidated with a conditional
+request and reused on "304 Not Modified", on network errors, and without any
+request at all when offline (GRAPHFAKER_OFFLINE=1).
+
+Both caches live under one directory and are bounded in size; when they grow
+past max_bytes the least recently used entries are evicted.
+
+Usage:
+    from graphfaker import GraphFaker
+    gf = GraphFaker(seed=1)
+    G = gf.generate_graph(total_nodes=100_000, total_edges=500_000, cache=True)
+
+    from graphfaker.cache import DownloadCache
+    path = DownloadCache().fetch("https://example.org/data.zip")
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import Counter
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import Optional
+
+import requests
+from tqdm.auto import tqdm
+
+from graphfaker.logger import logger
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "graphfaker")
+DEFAULT_MAX_BYTES = 2 * 1024**3  # 2 GiB
+DEFAULT_DOWNLOAD_MAX_BYTES = 8 * 1024**3  # 8 GiB, a few years of BTS months
+
+CACHE_SUFFIX = ".graph.pkl"
+DOWNLOAD_SUFFIX = ".download"
+DOWNLOAD_META_SUFFIX = ".json"
+
+# Seconds to connect / between bytes of a download
+DOWNLOAD_TIMEOUT = 60
+DOWNLOAD_CHUNK = 1 << 20
+
+
+def library_version() -> str:
+    try:
+        return metadata.version("graphfaker")
+    except metadata.PackageNotFoundError:
+        import graphfaker
+
+        return graphfaker.__version__
+
+
+def _canonical(value):
+    """JSON-friendly form of nested params; dict keys may be tuples."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def default_cache_dir() -> str:
+    """GRAPHFAKER_CACHE_DIR if set, else ~/.cache/graphfaker."""
+    return os.path.expanduser(
+        os.environ.get("GRAPHFAKER_CACHE_DIR", DEFAULT_CACHE_DIR)
+    )
+
+
+def offline_default() -> bool:
+    """True when GRAPHFAKER_OFFLINE is set to 1, true or yes."""
+    return os.environ.get("GRAPHFAKER_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def copy_response(resp, f, progress=None, desc: Optional[str] = None):
+    """
+    Stream the body of a requests response into the binary file f.
+
+    Bytes are counted on progress, a tqdm bar shared by concurrent downloads
+    whose total grows by each Content-Length, or on a bar of their own.
+    """
+    # Undo any Content-Encoding, the body is stored as served
+    resp.raw.decode_content = True
+    total = int(resp.headers.get("content-length", 0))
+    own = progress is None
+    if own:
+        progress = tqdm(
+            total=total, unit="B", unit_scale=True, desc=desc, leave=False
+        )
+    else:
+        with progress.get_lock():
+            progress.total = (progress.total or 0) + total
+            progress.refresh()
+    try:
+        while True:
+            chunk = resp.raw.read(DOWNLOAD_CHUNK)
+            if not chunk:
+                break
+            f.write(chunk)
+            progress.update(len(chunk))
+    finally:
+        if own:
+            progress.close()
+
+
+class _LRUFiles:
+    """Files with one suffix in a directory, evicted least recently used first."""
+
+    suffix = ""
+
+    def __init__(self, directory: Optional[str], subdirectory: str, max_bytes: int):
+        base = os.path.expanduser(directory) if directory else default_cache_dir()
+        self.directory = os.path.join(base, subdirectory)
+        self.max_bytes = max_bytes
+        # key -> pin count of entries evict must not remove, see pin
+        self._pins: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Pins belong to the threads of this process
+        return {**self.__dict__, "_pins": Counter(), "_lock": None}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, _lock=threading.Lock())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _remove(self, path: str):
+        # Concurrent evictions may both pick the least recently used entry
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def pin(self, key: str):
+        """Protect the entry of key from eviction until a matching unpin."""
+        with self._lock:
+            self._pins[key] += 1
+
+    def unpin(self, key: str):
+        """Release a pin, evicting entries beyond max_bytes once key is unpinned."""
+        with self._lock:
+            self._pins[key] -= 1
+            if self._pins[key] > 0:
+                return
+            del self._pins[key]
+        self.evict()
+
+    def entries(self) -> list:
+        """(path, size, last_used) of every entry, least recently used first."""
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                path = os.path.join(self.directory, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue  # evicted since listdir
+                entries.append((path, st.st_size, st.st_mtime))
+        return sorted(entries, key=lambda e: e[2])
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Remove least recently used entries until the cache fits in max_bytes,
+        sparing keep and pinned entries.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        with self._lock:
+            kept = {self._path(key) for key in self._pins}
+        if keep:
+            kept.add(self._path(keep))
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path in kept:
+                continue
+            self._remove(path)
+            total -= size
+            logger.debug(f"Evicted cache entry {path}")
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            self._remove(path)
+
+
+class GraphCache(_LRUFiles):
+    """
+    Size-bounded LRU cache of graphs keyed by their generation parameters.
+
+    Args:
+        directory: where cached graphs are stored; defaults to default_cache_dir().
+            Graphs live in a "graphs" subdirectory.
+        max_bytes: total size above which least recently used graphs are evicted.
+    """
+
+    suffix = CACHE_SUFFIX
+
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        super().__init__(directory, "graphs", max_bytes)
+
+    @staticmethod
+    def key(source: str, params: dict, seed=None) -> str:
+        """Hash of (source, params, seed, library version)."""
+        payload = json.dumps(
+            {
+                "source": source,
+                "params": _canonical(params),
+                "seed": seed,
+                "version": library_version(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached graph for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                G = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            os.remove(path)
+            return None
+        # Reads refresh the entry's position in the LRU order
+        os.utime(path)
+        logger.info(f"Loaded graph from cache: {path}")
+        return G
+
+    def put(self, key: str, G):
+        """Store G under key, then evict old entries beyond max_bytes."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.evict(keep=key)
+
+
+class DownloadCache(_LRUFiles):
+    """
+    Size-bounded LRU cache of downloaded files keyed by their URL.
+
+    Args:
+        directory: cache base directory; defaults to default_cache_dir().
+            Files live in a "downloads" subdirectory.
+        max_bytes: total size above which least recently used files are evicted.
+        offline: serve cached files without any request and fail on misses;
+            defaults to the GRAPHFAKER_OFFLINE environment variable.
+    """
+
+    suffix = DOWNLOAD_SUFFIX
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = DEFAULT_DOWNLOAD_MAX_BYTES,
+        offline: Optional[bool] = None,
+    ):
+        super().__init__(directory, "downloads", max_bytes)
+        self.offline = offline_default() if offline is None else offline
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, path: str) -> str:
+        return path[: -len(self.suffix)] + DOWNLOAD_META_SUFFIX
+
+    def _remove(self, path: str):
+        super()._remove(path)
+        super()._remove(self._meta_path(path))
+
+    def _meta(self, path: str) -> Optional[dict]:
+        """Validators of a cached file, None when it is not cached."""
+        try:
+            with open(self._meta_path(path), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return meta if os.path.exists(path) else None
+
+    def encoding(self, url: str) -> Optional[str]:
+        """Charset the cached copy of url was served with, if it declared one."""
+        meta = self._meta(self._path(self.key(url)))
+        return None if meta is None else meta.get("encoding")
+
+    def _hit(self, path: str, reason: str) -> str:
+        # Reads refresh the entry's position in the LRU order
+        os.utime(path)
+        logger.info(f"Using cached download {path} ({reason})")
+        return path
+
+    def fetch(
+        self,
+        url: str,
+        verify: bool = True,
+        desc: Optional[str] = None,
+        progress=None,
+    ) -> str:
+        """
+        Path of the cached copy of url, downloaded or refreshed when needed.
+
+        Args:
+            url: file to download.
+            verify: verify the server's TLS certificate.
+            desc: label of the download progress bar.
+            progress: shared tqdm bar counting the downloaded bytes instead,
+                see copy_response.
+
+        Raises:
+            FileNotFoundError: offline and url is not cached.
+            requests.RequestException: the download failed and url is not cached.
+        """
+        path = self._path(self.key(url))
+        meta = self._meta(path)
+        if self.offline:
+            if meta is None:
+                raise FileNotFoundError(
+                    f"{url} is not in the download cache {self.directory} "
+                    "and downloads are disabled (offline)."
+                )
+            return self._hit(path, "offline")
+
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        try:
+            resp = requests.get(
+                url,
+                headers=headers,
+                stream=True,
+                verify=verify,
+                timeout=DOWNLOAD_TIMEOUT,
+            )
+            if meta is not None and resp.status_code == 304:
+                resp.close()
+                return self._hit(path, "not modified")
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            if meta is None:
+                raise
+            logger.warning(f"Could not revalidate {url} ({e}), using the cached copy.")
+            return self._hit(path, "stale")
+
+        with resp:
+            self._store(path, url, resp, desc, progress)
+        self.evict(keep=self.key(url))
+        return path
+
+    def _store(self, path: str, url: str, resp, desc: Optional[str], progress):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                copy_response(resp, f, progress, desc or os.path.basename(url))
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        meta = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            # Charset of the response, for reading text files as resp.text would
+            "encoding": resp.encoding,
+            "fetched": datetime.now(UTC).isoformat(timespec="seconds"),
+        }
+        with open(self._meta_path(path), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
@@ -20,6 +20,33 @@ def gen(
     # for FetcherType.FAKER source
     total_nodes: int = typer.Option(100, help="Total nodes for random mode."),
     total_edges: int = typer.Option(1000, help="Total edges for random mode."),
+    batched: bool = typer.Option(
+        False, help="Use vectorized batch generation for large faker graphs."
+    ),
+    seed: int = typer.Option(None, help="Random seed for batched faker generation."),
+    backend: str = typer.Option(
+        "networkx", help="Graph backend for faker mode: networkx | csr."
+    ),
+    workers: int = typer.Option(
+        1, help="Worker processes for batched faker generation."
+    ),
+    topology: str = typer.Option(
+        None,
+        help="Faker edge model: uniform | chung_lu | preferential | sbm.",
+    ),
+    exact_edges: bool = typer.Option(
+        False, help="Generate exactly --total-edges distinct faker edges."
+    ),
+    lazy_attributes: bool = typer.Option(
+        False, help="Compute faker node attributes on access instead of storing them."
+    ),
+    cache: bool = typer.Option(
+        False, help="Reuse a cached faker graph generated with the same options (needs --seed and --batched)."
+    ),
+    cache_dir: str = typer.Option(
+        None,
+        help="Cache directory of faker graphs and flight downloads (default: $GRAPHFAKER_CACHE_DIR or ~/.cache/graphfaker).",
+    ),
     # for FetcherType.OSM source
     place: str = typer.Option(
         None, help="OSM place name (e.g., 'Soho Square, London, UK')."
@@ -54,13 +81,35 @@ def gen(
 
     # common
     export: str = typer.Option("graph.graphml", help="File path to export GraphML"),
+    export_format: str = typer.Option(
+        None,
+        help="Export format: graphml | parquet | arrow | neo4j | kuzu | snapshot | sqlite | edgelist | mtx | metis | ntriples | jsonld (directory formats write into the --export directory).",
+    ),
+    compression: str = typer.Option(
+        None,
+        help="Compress the export: gzip | zstd for graphml, neo4j, RDF and the integer-id formats (compressed on background threads); snappy | gzip | brotli | zstd | lz4 for parquet and kuzu; lz4 | zstd for arrow.",
+    ),
+    compression_level: int = typer.Option(None, help="Compression level of --compression."),
+    append: bool = typer.Option(
+        False,
+        help="Add only new nodes and edges to an earlier parquet | arrow | neo4j export, as a new part.",
+    ),
 ):
     """Generate a graph using GraphFaker."""
-    gf = GraphFaker()
+    gf = GraphFaker(seed=seed, backend=backend, lazy_attributes=lazy_attributes)
 
     if fetcher == FetcherType.FAKER:
 
-        g = gf.generate_graph(total_nodes=total_nodes, total_edges=total_edges)
+        g = gf.generate_graph(
+            total_nodes=total_nodes,
+            total_edges=total_edges,
+            batched=batched,
+            workers=workers,
+            topology=topology,
+            exact_edges=exact_edges,
+            cache=cache,
+            cache_dir=cache_dir,
+        )
         logger.info(
             f"Generated random graph with {g.number_of_nodes()} nodes and {g.number_of_edges()} edges."
         )
@@ -93,12 +142,14 @@ def gen(
         if not (1900 <= year <= 2100):
             raise ValueError("Year must be between 1900 and 2100.")
 
-        airlines_df = FlightGraphFetcher.fetch_airlines()
+        airlines_df = FlightGraphFetcher.fetch_airlines(cache_dir=cache_dir)
 
-        airports_df = FlightGraphFetcher.fetch_airports(country=country)
+        airports_df = FlightGraphFetcher.fetch_airports(
+            country=country, cache_dir=cache_dir
+        )
 
         flights_df = FlightGraphFetcher.fetch_flights(
-            year=year, month=month, date_range=parsed_date_range
+            year=year, month=month, date_range=parsed_date_range, cache_dir=cache_dir
         )
         logger.info(
             f"Fetched {len(airlines_df)} airlines, "
@@ -115,7 +166,15 @@ def gen(
     abs_export_path = os.path.abspath(export)
     os.makedirs(os.path.dirname(abs_export_path) or ".", exist_ok=True)
     
-    gf.export_graph(g, source=fetcher, path=abs_export_path)
+    gf.export_graph(
+        g,
+        source=fetcher,
+        path=abs_export_path,
+        format=export_format,
+        compression=compression,
+        compression_level=compression_level,
+        append=append,
+    )
     logger.info(f"exported graph to {abs_export_path}, with {g.number_of_nodes()} nodes and {g.number_of_edges()} edges.")
 
 
@@ -3,13 +3,32 @@ A multi-domain network connecting entities across social, geographical, and comm
 """
 
 import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
+
 import networkx as nx
-import random
+import numpy as np
 from faker import Faker
-from graphfaker.fetchers.osm import OSMGraphFetcher
+
+from graphfaker.cache import GraphCache
+from graphfaker.csr import Column, CSRGraphBuilder, StringTable
+from graphfaker.exporters.columnar import ARROW_CODECS, write_columnar
+from graphfaker.exporters.compression import compressed_path
+from graphfaker.exporters.graphml import write_graphml
+from graphfaker.exporters.hpc import HPC_FORMATS, write_hpc
+from graphfaker.exporters.kuzu import write_kuzu
+from graphfaker.exporters.neo4j import write_neo4j_csv
+from graphfaker.exporters.rdf import RDF_FORMATS, write_rdf
+from graphfaker.exporters.sqlite import write_sqlite
 from graphfaker.fetchers.flights import FlightGraphFetcher
+from graphfaker.fetchers.osm import OSMGraphFetcher
+from graphfaker.lazy import LazyAttributes, LazyNodeAttributes
 from graphfaker.logger import logger
+from graphfaker.pools import DEFAULT_POOL_SIZE, FakerPools, PoolSample
+from graphfaker.snapshot import SNAPSHOT_SUFFIX, save_graph
+from graphfaker.topology import Communities, model_spec, sample_edges
 
 fake = Faker()
 
@@ -19,6 +38,15 @@ PLACE_SUBTYPES = ["City", "Park", "Restaurant", "Airport", "University"]
 ORG_SUBTYPES = ["TechCompany", "Hospital", "NGO", "University", "RetailChain"]
 EVENT_SUBTYPES = ["Concert", "Conference", "Protest", "SportsGame"]
 PRODUCT_SUBTYPES = ["Electronics", "Apparel", "Book", "Vehicle"]
+EDUCATION_LEVELS = ["High School", "Bachelor", "Master", "PhD"]
+
+# Node type proportions; the remainder of total_nodes becomes Products
+NODE_DISTRIBUTION = {
+    "Person": 0.50,
+    "Place": 0.20,
+    "Organization": 0.15,
+    "Event": 0.10,
+}
 
 # Define relationship possibilities
 REL_PERSON_PERSON = ["FRIENDS_WITH", "COLLEAGUES", "MENTORS"]
@@ -40,13 +68,465 @@ EDGE_DISTRIBUTION = {
     ("Person", "Product"): (REL_PERSON_PRODUCT, 0.02),
 }
 
+# Person-Person relationships that are added in both directions
+BIDIRECTIONAL_RELS = ["FRIENDS_WITH", "COLLEAGUES"]
+
+# Attribute holding each node type's subtype, used as communities by sbm
+SUBTYPE_ATTRS = {
+    "Person": ("subtype", PERSON_SUBTYPES),
+    "Place": ("place_type", PLACE_SUBTYPES),
+    "Organization": ("subtype", ORG_SUBTYPES),
+    "Event": ("event_type", EVENT_SUBTYPES),
+    "Product": ("category", PRODUCT_SUBTYPES),
+}
+
+
+def node_counts(total_nodes: int) -> dict:
+    """Split total_nodes across node types following NODE_DISTRIBUTION."""
+    counts = {t: int(total_nodes * share) for t, share in NODE_DISTRIBUTION.items()}
+    # Remaining nodes will be Products
+    counts["Product"] = total_nodes - sum(counts.values())
+    return counts
+
+
+# Last day batched dates are drawn up to. Fixed rather than today, so a seed
+# gives the same graph on every day
+DATE_END = np.datetime64("2025-01-01")
+
+
+def _random_dates(rng: np.random.Generator, size: int) -> np.ndarray:
+    """ISO dates drawn uniformly from 1970-01-01 to DATE_END, like ``fake.date()``."""
+    days = rng.integers(0, DATE_END.astype(np.int64) + 1, size=size)
+    return np.datetime_as_string(days.astype("datetime64[D]"), unit="D")
+
+
+def _choice(rng: np.random.Generator, options: list, size: int) -> np.ndarray:
+    """Vectorized ``random.choice`` over a small list of options."""
+    return np.asarray(options, dtype=object)[rng.integers(0, len(options), size=size)]
+
+
+def person_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    """Attribute columns for n Person nodes."""
+    return {
+        "name": pools.draw("name", rng, n),
+        "age": rng.integers(18, 81, size=n),
+        "occupation": pools.draw("job", rng, n),
+        "email": pools.draw("email", rng, n),
+        "education_level": _choice(rng, EDUCATION_LEVELS, n),
+        "skills": pools.draw("skills", rng, n),
+        "subtype": _choice(rng, PERSON_SUBTYPES, n),
+    }
+
+
+def place_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    """Attribute columns for n Place nodes."""
+    lat = np.round(rng.uniform(-90, 90, size=n), 6).tolist()
+    lon = np.round(rng.uniform(-180, 180, size=n), 6).tolist()
+    return {
+        "name": pools.draw("city", rng, n),
+        "place_type": _choice(rng, PLACE_SUBTYPES, n),
+        "population": rng.integers(10000, 1000001, size=n),
+        "coordinates": list(zip(lat, lon)),
+    }
+
+
+def organization_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    """Attribute columns for n Organization nodes."""
+    return {
+        "name": pools.draw("company", rng, n),
+        "industry": pools.draw("job", rng, n),
+        "revenue": np.round(rng.uniform(1e6, 1e9, size=n), 2),
+        "employee_count": rng.integers(50, 5001, size=n),
+        "subtype": _choice(rng, ORG_SUBTYPES, n),
+    }
+
+
+def event_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    """Attribute columns for n Event nodes."""
+    return {
+        "name": pools.draw("catch_phrase", rng, n),
+        "event_type": _choice(rng, EVENT_SUBTYPES, n),
+        "start_date": _random_dates(rng, n),
+        "duration": rng.integers(1, 6, size=n),  # days
+    }
+
+
+def product_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    """Attribute columns for n Product nodes."""
+    return {
+        "name": pools.draw("product_name", rng, n),
+        "category": _choice(rng, PRODUCT_SUBTYPES, n),
+        "price": np.round(rng.uniform(10, 1000, size=n), 2),
+        "release_date": _random_dates(rng, n),
+    }
+
+
+# Column builder and node id prefix for each node type
+NODE_COLUMNS = {
+    "Person": (person_columns, "person"),
+    "Place": (place_columns, "place"),
+    "Organization": (organization_columns, "org"),
+    "Event": (event_columns, "event"),
+    "Product": (product_columns, "product"),
+}
+
+
+class _DrawnProviders:
+    """Stand-in for FakerPools recording the providers a column builder draws."""
 
-class GraphFaker:
     def __init__(self):
+        self.providers = set()
+
+    def draw(self, provider: str, rng: np.random.Generator, n: int) -> PoolSample:
+        self.providers.add(provider)
+        return PoolSample(provider, np.zeros(n, dtype=np.int32))
+
+
+def pool_rows(counts: dict) -> dict:
+    """
+    Number of nodes drawing from each pool provider, for node counts as
+    returned by node_counts(). Pools are capped at these sizes; relationship
+    attributes sample the same pools.
+    """
+    rows: dict = {}
+    for node_type, n in counts.items():
+        drawn = _DrawnProviders()
+        NODE_COLUMNS[node_type][0](np.random.default_rng(0), drawn, 0)
+        for provider in drawn.providers:
+            rows[provider] = rows.get(provider, 0) + n
+    return rows
+
+
+def visited_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    return {"visit_count": rng.integers(1, 21, size=n)}
+
+
+def works_at_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    return {"position": pools.draw("job", rng, n)}
+
+
+def purchased_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    return {
+        "date": _random_dates(rng, n),
+        "amount": np.round(rng.uniform(1, 500, size=n), 2),
+    }
+
+
+def reviewed_columns(rng: np.random.Generator, pools: FakerPools, n: int) -> dict:
+    return {"rating": rng.integers(1, 6, size=n)}
+
+
+# Column builders for relationships that carry extra attributes
+RELATIONSHIP_COLUMNS = {
+    "VISITED": visited_columns,
+    "WORKS_AT": works_at_columns,
+    "PURCHASED": purchased_columns,
+    "REVIEWED": reviewed_columns,
+}
+
+
+def column_rows(columns: dict):
+    """Turn a dict of equal-length columns into per-row attribute dicts."""
+    keys = list(columns)
+    values = [
+        col.tolist() if isinstance(col, np.ndarray) else col
+        for col in columns.values()
+    ]
+    return (dict(zip(keys, row)) for row in zip(*values))
+
+
+# Batched generation works in blocks of this many nodes or edges. Every block
+# is seeded from (master seed, block key) alone, so the output for a seed is
+# the same no matter how blocks are spread across worker processes.
+BLOCK_SIZE = 100_000
+
+EDGE_CATEGORIES = list(EDGE_DISTRIBUTION.items())
+
+# Formats accepted by GraphFaker.export_graph
+EXPORT_FORMATS = (
+    "graphml",
+    "parquet",
+    "arrow",
+    "neo4j",
+    "kuzu",
+    "snapshot",
+    "sqlite",
+    *HPC_FORMATS,
+    *RDF_FORMATS,
+)
+# Formats export_graph can append to (see exporters.manifest)
+APPEND_FORMATS = ("parquet", "arrow", "neo4j")
+# Path extension -> export format, when no format is given
+EXPORT_EXTENSIONS = {
+    **{name: name for name in EXPORT_FORMATS},
+    SNAPSHOT_SUFFIX.lstrip("."): "snapshot",
+    "db": "sqlite",
+    **{suffix.lstrip("."): name for name, suffix in RDF_FORMATS.items()},
+}
+
+
+def _block_rng(entropy: int, *key: int) -> np.random.Generator:
+    """Random generator of one block, derived from the master entropy and block key."""
+    return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=key))
+
+
+def node_blocks(counts: dict):
+    """Yield (node_type, start, count) for every block of every node type."""
+    for node_type, n in counts.items():
+        for start in range(0, n, BLOCK_SIZE):
+            yield node_type, start, min(BLOCK_SIZE, n - start)
+
+
+def node_block(task: tuple, entropy: int, pools: FakerPools) -> dict:
+    """Attribute columns of one node block."""
+    node_type, start, count = task
+    type_index = list(NODE_COLUMNS).index(node_type)
+    rng = _block_rng(entropy, 0, type_index, start // BLOCK_SIZE)
+    build_columns, _ = NODE_COLUMNS[node_type]
+    return build_columns(rng, pools, count)
+
+
+def edge_blocks(total_edges: int, sizes: dict):
+    """
+    Yield (category, start, count, n_src, n_tgt) for every block of every
+    EDGE_DISTRIBUTION category; sizes holds the number of nodes per type.
+    """
+    for c, ((src_type, tgt_type), (_, weight)) in enumerate(EDGE_CATEGORIES):
+        num_edges = int(total_edges * weight)
+        n_src, n_tgt = sizes.get(src_type, 0), sizes.get(tgt_type, 0)
+        if not n_src or not n_tgt:
+            continue
+        for start in range(0, num_edges, BLOCK_SIZE):
+            yield c, start, min(BLOCK_SIZE, num_edges - start), n_src, n_tgt
+
+
+def edge_block(
+    task: tuple, entropy: int, pools: FakerPools, topology: Optional[list] = None
+) -> list:
+    """
+    Draw one block of edges.
+
+    Args:
+        topology: (model, params, communities) per EDGE_CATEGORIES entry, see
+            graphfaker.topology; None draws endpoints uniformly.
+
+    Returns:
+        list of (relationship, src_idx, tgt_idx, columns), where the indices
+        point into the source and target node lists of the category.
+    """
+    c, start, count, n_src, n_tgt = task
+    (src_type, tgt_type), (possible_rels, _) = EDGE_CATEGORIES[c]
+    rng = _block_rng(entropy, 1, c, start // BLOCK_SIZE)
+
+    model, params, communities = topology[c] if topology else ("uniform", {}, None)
+    src_idx, tgt_idx = sample_edges(
+        model, params, rng, count, n_src, n_tgt, communities
+    )
+    # Avoid self-loop in same category
+    if src_type == tgt_type:
+        keep = src_idx != tgt_idx
+        src_idx, tgt_idx = src_idx[keep], tgt_idx[keep]
+    rel_idx = rng.integers(0, len(possible_rels), size=len(src_idx))
+
+    out = []
+    for r, rel in enumerate(possible_rels):
+        mask = rel_idx == r
+        build_columns = RELATIONSHIP_COLUMNS.get(rel)
+        columns = build_columns(rng, pools, int(mask.sum())) if build_columns else {}
+        out.append((rel, src_idx[mask], tgt_idx[mask], columns))
+    return out
+
+
+def is_bidirectional(src_type: str, tgt_type: str, rel: str) -> bool:
+    """For Person-Person FRIENDS_WITH and COLLEAGUES, treat as bidirectional."""
+    return src_type == tgt_type == "Person" and rel in BIDIRECTIONAL_RELS
+
+
+# Exact edge counts: give up when a category still misses edges after this many
+# resample rounds; each round oversamples the deficit by RESAMPLE_FACTOR and
+# draws at least RESAMPLE_MIN edges, so tiny deficits settle in one round
+MAX_RESAMPLE_ROUNDS = 100
+RESAMPLE_FACTOR = 1.25
+RESAMPLE_MIN = 256
+
+
+def edge_quotas(total_edges: int, sizes: dict) -> dict:
+    """
+    Split total_edges exactly across the EDGE_DISTRIBUTION categories whose
+    node types exist, by largest remainder. Returns category index -> edges.
+    """
+    weights = {
+        c: weight
+        for c, ((src_type, tgt_type), (_, weight)) in enumerate(EDGE_CATEGORIES)
+        if sizes.get(src_type, 0) and sizes.get(tgt_type, 0)
+    }
+    if not weights:
+        return {}
+    scale = total_edges / sum(weights.values())
+    shares = {c: w * scale for c, w in weights.items()}
+    quotas = {c: int(share) for c, share in shares.items()}
+    by_remainder = sorted(shares, key=lambda c: quotas[c] - shares[c])
+    for c in by_remainder[: total_edges - sum(quotas.values())]:
+        quotas[c] += 1
+    return quotas
+
+
+def _take_columns(columns: dict, mask: np.ndarray) -> dict:
+    """Rows of a set of edge columns where mask is True."""
+    taken = {}
+    for name, col in columns.items():
+        if isinstance(col, PoolSample):
+            taken[name] = PoolSample(col.provider, col.codes[mask])
+        elif isinstance(col, np.ndarray):
+            taken[name] = col[mask]
+        else:
+            taken[name] = [v for v, keep in zip(col, mask) if keep]
+    return taken
+
+
+def accept_edges(
+    groups: list, category: tuple, n_tgt: int, taken: np.ndarray, remaining: int
+):
+    """
+    Keep the edge draws that only add new (source, target) pairs, up to
+    `remaining` edges. A bidirectional draw adds two edges and is kept only if
+    both directions are new. Pairs are packed into int64 keys src * n_tgt + tgt
+    and checked with vectorized sorts instead of per-edge set lookups.
+
+    Args:
+        groups: (relationship, src_idx, tgt_idx, columns) tuples of edge_block.
+        category: (src_type, tgt_type) of the draws.
+        n_tgt: number of target nodes, for packing keys.
+        taken: sorted keys of the edges accepted so far.
+        remaining: number of edges still needed.
+
+    Returns:
+        (kept groups, keys of the kept edges)
+    """
+    if not groups:
+        return [], np.zeros(0, dtype=np.int64)
+    lengths = [len(src) for _, src, _, _ in groups]
+    src = np.concatenate([g[1] for g in groups]).astype(np.int64)
+    tgt = np.concatenate([g[2] for g in groups]).astype(np.int64)
+    bidir = np.repeat([is_bidirectional(*category, g[0]) for g in groups], lengths)
+    n = len(src)
+
+    # Every key a draw adds, and the draw it belongs to
+    forward = src * n_tgt + tgt
+    reverse = tgt[bidir] * n_tgt + src[bidir]
+    keys = np.concatenate([forward, reverse])
+    owner = np.concatenate([np.arange(n), np.flatnonzero(bidir)])
+
+    ok = np.ones(n, dtype=bool)
+    # A key drawn several times belongs to its first draw only
+    order = np.lexsort((owner, keys))
+    keys_sorted, owner_sorted = keys[order], owner[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys_sorted[1:] != keys_sorted[:-1]
+    first_pos = np.maximum.accumulate(np.where(first, np.arange(len(keys)), 0))
+    ok[owner_sorted[owner_sorted != owner_sorted[first_pos]]] = False
+    # Keys accepted in earlier rounds
+    if len(taken):
+        pos = np.minimum(np.searchsorted(taken, keys), len(taken) - 1)
+        ok[owner[taken[pos] == keys]] = False
+
+    weight = 1 + bidir.astype(np.int64)
+    ok &= weight <= remaining
+    ok &= np.cumsum(weight * ok) <= remaining
+
+    kept = []
+    bounds = np.cumsum([0] + lengths)
+    for (rel, g_src, g_tgt, columns), lo, hi in zip(groups, bounds[:-1], bounds[1:]):
+        mask = ok[lo:hi]
+        if mask.any():
+            kept.append((rel, g_src[mask], g_tgt[mask], _take_columns(columns, mask)))
+    return kept, np.concatenate([forward[ok], reverse[ok[bidir]]])
+
+
+def edge_records(sources: list, targets: list, rel: str, columns: dict, bidir: bool):
+    """(source, target, attributes) tuples of one relationship, plus reverse edges."""
+    if columns:
+        rows = [{"relationship": rel, **row} for row in column_rows(columns)]
+    else:
+        rows = [{"relationship": rel}] * len(sources)
+    records = list(zip(sources, targets, rows))
+    if bidir:
+        records.extend(zip(targets, sources, rows))
+    return records
+
+
+def _rebatch(chunks, batch_size: int):
+    """Regroup an iterable of lists into lists of batch_size (the last may be short)."""
+    batch: list = []
+    for chunk in chunks:
+        pos = 0
+        while pos < len(chunk):
+            take = min(batch_size - len(batch), len(chunk) - pos)
+            batch.extend(chunk[pos : pos + take])
+            pos += take
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+_WORKER_STATE: tuple = ()
+
+
+def _init_worker(entropy: int, pools: FakerPools, *args):
+    global _WORKER_STATE
+    _WORKER_STATE = (entropy, pools, *args)
+
+
+def _run_in_worker(job: tuple):
+    func, task = job
+    return func(task, *_WORKER_STATE)
+
+
+class GraphFaker:
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        pool_size=DEFAULT_POOL_SIZE,
+        unique_pools: bool = True,
+        pool_cache_dir: Optional[str] = None,
+        backend: str = "networkx",
+        lazy_attributes: bool = False,
+    ):
+        """
+        Args:
+            seed: seed for batched generation.
+            pool_size: number of pre-generated Faker values per provider used by
+                batched generation (int, or dict of provider -> size). Larger pools
+                are more realistic, smaller ones are faster to build. A pool is
+                never larger than the number of nodes drawing from it.
+            unique_pools: keep only distinct values in each pool.
+            pool_cache_dir: optional directory to cache pools on disk.
+            backend: "networkx" builds an nx.DiGraph; "csr" builds a compact
+                array-backed CSRGraph (faker source only, always batched).
+            lazy_attributes: store only node ids and types, and compute the other
+                node attributes on access from (seed, node id). Values are stable
+                but differ from the ones eager generation draws.
+        """
+        if backend not in ("networkx", "csr"):
+            raise ValueError(f"Unknown backend '{backend}'. Use 'networkx' or 'csr'.")
+        self.backend = backend
         # We'll use a directed graph for directional relationships.
-        self.G = nx.DiGraph()
+        if backend == "csr":
+            self._builder = CSRGraphBuilder()
+            self.G = self._builder.build()
+        else:
+            self.G = nx.DiGraph()
+        # Batched generation derives every block's generator from this entropy
+        self.seed = seed
+        self.entropy = seed if seed is not None else np.random.SeedSequence().entropy
+        self.pools = FakerPools(
+            size=pool_size, unique=unique_pools, seed=seed, cache_dir=pool_cache_dir
+        )
+        self.lazy_attributes = lazy_attributes
 
-    def generate_nodes(self, total_nodes=100):
+    def generate_nodes(self, total_nodes=100, batched=False, workers=1):
         """
         Generates nodes split into:
          - People (50%)
@@ -54,15 +534,16 @@ class GraphFaker:
          - Organizations (15%)
          - Events (10%)
          - Products (5%)
+
+        With batched=True each node type is generated as NumPy columns and
+        inserted with a single add_nodes_from call, see generate_nodes_batched.
+        The csr backend, lazy attributes and workers > 1 always generate in
+        batches.
         """
-        counts = {
-            "Person": int(total_nodes * 0.50),
-            "Place": int(total_nodes * 0.20),
-            "Organization": int(total_nodes * 0.15),
-            "Event": int(total_nodes * 0.10),
-        }
-        # Remaining nodes will be Products
-        counts["Product"] = total_nodes - sum(counts.values())
+        counts = node_counts(total_nodes)
+        if self._batched(batched, workers):
+            self.generate_nodes_batched(counts, workers=workers)
+            return
 
         # Generate People
         for i in range(counts["Person"]):
@@ -131,6 +612,181 @@ class GraphFaker:
                 release_date=fake.date(),
             )
 
+    def _batched(self, batched: bool, workers: int) -> bool:
+        """Whether faker generation takes the seeded, batched path."""
+        return batched or self.backend == "csr" or self.lazy_attributes or workers > 1
+
+    def generate_nodes_batched(self, counts: dict, workers: int = 1):
+        """
+        Generates nodes column-wise: every attribute of a node type is drawn in
+        vectorized blocks and each block is inserted with one add_nodes_from.
+        The attribute schema matches generate_nodes.
+
+        Args:
+            counts: number of nodes per type, as returned by node_counts().
+            workers: number of processes generating blocks in parallel.
+        """
+        self.pools = self.pools.for_rows(pool_rows(counts))
+        if self.lazy_attributes:
+            self._add_lazy_nodes(counts)
+            return
+        tasks = list(node_blocks(counts))
+        for (node_type, start, n), columns in zip(
+            tasks, self._map_blocks(node_block, tasks, workers)
+        ):
+            _, prefix = NODE_COLUMNS[node_type]
+            columns = self._resolve_columns(columns)
+            if self.backend == "csr":
+                ids = StringTable.from_prefix(prefix, n, start)
+                self._builder.add_nodes(node_type, ids, columns)
+            else:
+                ids = [f"{prefix}_{i}" for i in range(start, start + n)]
+                self.G.add_nodes_from(zip(ids, column_rows(columns)), type=node_type)
+        logger.debug(f"Generated {sum(counts.values())} nodes in batch mode.")
+        if self.backend == "csr":
+            self.G = self._builder.build()
+
+    def _add_lazy_nodes(self, counts: dict):
+        """Add nodes whose attributes are computed on access, see graphfaker.lazy."""
+        for node_type, start, n in node_blocks(counts):
+            builder, prefix = NODE_COLUMNS[node_type]
+            attributes = LazyAttributes(node_type, builder, self.entropy, self.pools)
+            if self.backend == "csr":
+                ids = StringTable.from_prefix(prefix, n, start)
+                self._builder.add_nodes(node_type, ids, {}, lazy=attributes)
+                continue
+            G = self.G
+            ids = [f"{prefix}_{i}" for i in range(start, start + n)]
+            # add_nodes_from takes the attribute dict of every new node from
+            # node_attr_dict_factory, in order; nodes already in G keep theirs
+            lazy = (
+                LazyNodeAttributes(attributes, node) for node in ids if node not in G
+            )
+            G.node_attr_dict_factory = lambda: next(lazy)
+            try:
+                G.add_nodes_from(ids)
+            finally:
+                del G.node_attr_dict_factory
+        logger.debug(f"Added {sum(counts.values())} nodes with lazy attributes.")
+        if self.backend == "csr":
+            self.G = self._builder.build()
+
+    def _map_blocks(self, func, tasks: list, workers: int = 1, *args):
+        """
+        Run func(task, entropy, pools, *args) for every task and yield the
+        results in task order, in this process or across a pool of worker
+        processes. args are sent to each worker once.
+        """
+        if workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                yield func(task, self.entropy, self.pools, *args)
+            return
+        # Workers must share the parent's pools, unseeded pools differ per build
+        self.pools.preload()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.entropy, self.pools, *args),
+        ) as executor:
+            # Keep a bounded number of blocks in flight so memory stays flat
+            # when the consumer is slower than the workers
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(_run_in_worker, (func, task)))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _resolve_columns(self, columns: dict, as_values: bool = False) -> dict:
+        """Turn PoolSamples into values (networkx) or pool-coded Columns (csr)."""
+        resolved = {}
+        for name, col in columns.items():
+            if isinstance(col, PoolSample):
+                pool = self.pools.get(col.provider)
+                if self.backend == "csr" and not as_values:
+                    col = Column("str", col.codes, pool.values)
+                else:
+                    col = pool.values[col.codes]
+            resolved[name] = col
+        return resolved
+
+    def iter_node_batches(self, total_nodes=100, batch_size=10_000, workers=1):
+        """
+        Stream the nodes of a faker graph without building it.
+
+        Yields lists of batch_size (node_id, attributes) records, following
+        the same node type proportions and attribute schema as generate_nodes.
+        For a given seed the records match generate_graph(batched=True).
+
+        Example:
+            gf = GraphFaker(seed=1)
+            for batch in gf.iter_node_batches(total_nodes=10_000_000):
+                writer.write(batch)
+        """
+        counts = node_counts(total_nodes)
+        self.pools = self.pools.for_rows(pool_rows(counts))
+        tasks = list(node_blocks(counts))
+
+        def blocks():
+            for (node_type, start, n), columns in zip(
+                tasks, self._map_blocks(node_block, tasks, workers)
+            ):
+                _, prefix = NODE_COLUMNS[node_type]
+                rows = column_rows(self._resolve_columns(columns, as_values=True))
+                yield [
+                    (f"{prefix}_{i}", {"type": node_type, **row})
+                    for i, row in zip(range(start, start + n), rows)
+                ]
+
+        return _rebatch(blocks(), batch_size)
+
+    def iter_edge_batches(
+        self,
+        total_nodes=100,
+        total_edges=1000,
+        batch_size=10_000,
+        workers=1,
+        topology=None,
+    ):
+        """
+        Stream the edges of a faker graph without building it.
+
+        Yields lists of batch_size (source, target, attributes) records drawn
+        per EDGE_DISTRIBUTION category between the node ids that
+        iter_node_batches(total_nodes) produces. Unlike generate_graph, which
+        stores a DiGraph, repeated (source, target) draws are all emitted.
+        topology selects the edge models, see generate_edges.
+        """
+        counts = node_counts(total_nodes)
+        self.pools = self.pools.for_rows(pool_rows(counts))
+        tasks = list(edge_blocks(total_edges, counts))
+        plan = self._topology_plan(
+            topology, lambda node_type: self._stream_communities(node_type, counts)
+        )
+
+        def blocks():
+            results = self._map_blocks(edge_block, tasks, workers, plan)
+            for task, block in zip(tasks, results):
+                (src_type, tgt_type), _ = EDGE_CATEGORIES[task[0]]
+                src_prefix = NODE_COLUMNS[src_type][1]
+                tgt_prefix = NODE_COLUMNS[tgt_type][1]
+                records = []
+                for rel, src_idx, tgt_idx, columns in block:
+                    bidir = is_bidirectional(src_type, tgt_type, rel)
+                    records.extend(
+                        edge_records(
+                            [f"{src_prefix}_{i}" for i in src_idx.tolist()],
+                            [f"{tgt_prefix}_{i}" for i in tgt_idx.tolist()],
+                            rel,
+                            self._resolve_columns(columns, as_values=True),
+                            bidir,
+                        )
+                    )
+                yield records
+
+        return _rebatch(blocks(), batch_size)
+
     def add_relationship(
         self, source, target, rel_type, attributes=None, bidirectional=False
     ):
@@ -144,23 +800,55 @@ class GraphFaker:
         if bidirectional:
             self.G.add_edge(target, source, relationship=rel_type, **attributes)
 
-    def generate_edges(self, total_edges=1000):
-        """
-        Generate edges based on the EDGE_DISTRIBUTION probabilities.
-        The number of edges for each relationship category is determined by the weight.
-        """
-        # Get node lists by type
-        nodes_by_type = {
-            "Person": [],
-            "Place": [],
-            "Organization": [],
-            "Event": [],
-            "Product": [],
-        }
+    def _nodes_by_type(self) -> dict:
+        """Get node lists by type. On the csr backend these are node indices."""
+        if self.backend == "csr":
+            ranges = {t: [] for t in NODE_COLUMNS}
+            for table in self._builder.tables:
+                if table.label in ranges:
+                    ranges[table.label].append(np.arange(table.start, table.stop))
+            return {
+                t: np.concatenate(r) if r else np.zeros(0, dtype=np.int64)
+                for t, r in ranges.items()
+            }
+        nodes_by_type = {t: [] for t in NODE_COLUMNS}
         for node, data in self.G.nodes(data=True):
             t = data.get("type")
             if t in nodes_by_type:
                 nodes_by_type[t].append(node)
+        return nodes_by_type
+
+    def generate_edges(
+        self, total_edges=1000, batched=False, workers=1, topology=None, exact=False
+    ):
+        """
+        Generate edges based on the EDGE_DISTRIBUTION probabilities.
+        The number of edges for each relationship category is determined by the weight.
+
+        With batched=True endpoints and attributes are drawn as NumPy arrays,
+        see generate_edges_batched. The csr backend, lazy attributes,
+        workers > 1, topology models and exact counts always generate in
+        batches.
+
+        Repeated (source, target) draws overwrite each other and same-type
+        self-loops are skipped, so the graph usually ends up with fewer than
+        total_edges edges. exact=True rejects and redraws those until every
+        category has exactly its share and the graph gains exactly total_edges
+        edges; the resample rounds needed are stored in self.resample_rounds.
+
+        Args:
+            topology: how endpoints are drawn, see graphfaker.topology. A model
+                name ("uniform", "chung_lu", "preferential", "sbm") for every
+                category, or a dict of (src_type, tgt_type) -> name or
+                (name, params); categories not in the dict stay uniform.
+        """
+        if self._batched(batched, workers) or topology is not None or exact:
+            self.generate_edges_batched(
+                total_edges, workers=workers, topology=topology, exact=exact
+            )
+            return
+
+        nodes_by_type = self._nodes_by_type()
 
         # For each category in EDGE_DISTRIBUTION, calculate the number of edges
         for (src_type, tgt_type), (possible_rels, weight) in EDGE_DISTRIBUTION.items():
@@ -203,6 +891,155 @@ class GraphFaker:
                     source, target, rel, attributes=attr, bidirectional=bidir
                 )
 
+    def generate_edges_batched(
+        self, total_edges=1000, workers: int = 1, topology=None, exact=False
+    ):
+        """
+        Generate edges column-wise. For every EDGE_DISTRIBUTION category the
+        source/target indices and relationship labels are drawn as integer
+        arrays in blocks, relationship attributes are built as columns, and the
+        category is inserted with a single add_edges_from call.
+
+        Args:
+            total_edges: number of edge draws across all categories.
+            workers: number of processes generating blocks in parallel.
+            topology: edge models per category, see generate_edges.
+            exact: add exactly total_edges distinct edges, see exact_edge_blocks.
+        """
+        dtype = np.int64 if self.backend == "csr" else object
+        nodes_by_type = {
+            t: np.asarray(n, dtype=dtype) for t, n in self._nodes_by_type().items()
+        }
+        sizes = {t: len(n) for t, n in nodes_by_type.items()}
+        plan = self._topology_plan(
+            topology, lambda t: self._communities(t, nodes_by_type[t])
+        )
+
+        if exact:
+            blocks = self.exact_edge_blocks(total_edges, sizes, workers, plan)
+        else:
+            tasks = list(edge_blocks(total_edges, sizes))
+            results = self._map_blocks(edge_block, tasks, workers, plan)
+            blocks = ((task[0], block) for task, block in zip(tasks, results))
+
+        edges, previous = [], None
+        for category, block in blocks:
+            # Insert the previous category in one call once it is complete
+            if edges and category != previous:
+                self.G.add_edges_from(edges)
+                edges = []
+            previous = category
+            (src_type, tgt_type), _ = EDGE_CATEGORIES[category]
+            src_nodes, tgt_nodes = nodes_by_type[src_type], nodes_by_type[tgt_type]
+            for rel, src_idx, tgt_idx, columns in block:
+                sources, targets = src_nodes[src_idx], tgt_nodes[tgt_idx]
+                columns = self._resolve_columns(columns)
+                bidir = is_bidirectional(src_type, tgt_type, rel)
+
+                if self.backend == "csr":
+                    columns = {"relationship": rel, **columns}
+                    self._builder.add_edges(sources, targets, columns)
+                    if bidir:
+                        self._builder.add_edges(targets, sources, columns)
+                    continue
+
+                sources, targets = sources.tolist(), targets.tolist()
+                edges.extend(edge_records(sources, targets, rel, columns, bidir))
+
+        if edges:
+            self.G.add_edges_from(edges)
+        logger.debug("Generated edges in batch mode.")
+        if self.backend == "csr":
+            self.G = self._builder.build()
+
+    def exact_edge_blocks(
+        self, total_edges: int, sizes: dict, workers: int = 1, plan=None
+    ):
+        """
+        Yield (category, groups) edge blocks adding up to exactly total_edges
+        distinct directed edges without self-loops.
+
+        Each category gets an exact quota (see edge_quotas). Its blocks are
+        drawn as usual, then duplicates, self-loops and pairs beyond the quota
+        are rejected with accept_edges, and the deficit is drawn again in new
+        blocks until the quota is met. Resample blocks are seeded by their
+        position like all other blocks, so the result does not depend on the
+        number of workers. The number of resample rounds per category is
+        stored in self.resample_rounds.
+        """
+        quotas = edge_quotas(total_edges, sizes)
+        tasks = []
+        for c, quota in quotas.items():
+            (src_type, tgt_type), (possible_rels, _) = EDGE_CATEGORIES[c]
+            n_src, n_tgt = sizes[src_type], sizes[tgt_type]
+            capacity = n_src * n_tgt - (n_src if src_type == tgt_type else 0)
+            if quota > capacity:
+                raise ValueError(
+                    f"Cannot place {quota} distinct {src_type}->{tgt_type} edges "
+                    f"between {n_src} and {n_tgt} nodes."
+                )
+            draws = self._draws_for(quota, (src_type, tgt_type), possible_rels)
+            for start in range(0, draws, BLOCK_SIZE):
+                tasks.append((c, start, min(BLOCK_SIZE, draws - start), n_src, n_tgt))
+
+        self.resample_rounds = {}
+        results = self._map_blocks(edge_block, tasks, workers, plan)
+        pending = []
+        for task, block in zip(tasks, results):
+            if pending and task[0] != pending[0][0][0]:
+                yield from self._fill_quota(pending, quotas, plan)
+                pending = []
+            pending.append((task, block))
+        if pending:
+            yield from self._fill_quota(pending, quotas, plan)
+
+        total_rounds = sum(self.resample_rounds.values())
+        logger.info(
+            f"Placed {sum(quotas.values())} distinct edges with "
+            f"{total_rounds} resample round(s)."
+        )
+
+    @staticmethod
+    def _draws_for(edges: int, category: tuple, possible_rels: list) -> int:
+        """Draws expected to yield `edges` edges, counting bidirectional ones twice."""
+        per_draw = np.mean([1 + is_bidirectional(*category, r) for r in possible_rels])
+        return max(1, int(np.ceil(edges / per_draw)))
+
+    def _fill_quota(self, pending: list, quotas: dict, plan):
+        """Accept the drawn blocks of one category, then resample the deficit."""
+        c, _, _, n_src, n_tgt = pending[0][0]
+        category, (possible_rels, _) = EDGE_CATEGORIES[c]
+        groups = [group for _, block in pending for group in block]
+        next_block = pending[-1][0][1] // BLOCK_SIZE + 1
+
+        remaining = quotas[c]
+        taken = np.zeros(0, dtype=np.int64)
+        rounds = 0
+        while True:
+            kept, keys = accept_edges(groups, category, n_tgt, taken, remaining)
+            remaining -= len(keys)
+            if kept:
+                yield c, kept
+            if not remaining:
+                break
+            if rounds == MAX_RESAMPLE_ROUNDS:
+                raise RuntimeError(
+                    f"{category[0]}->{category[1]} edges still miss {remaining} "
+                    f"after {rounds} resample rounds."
+                )
+            rounds += 1
+            taken = np.sort(np.concatenate([taken, keys]))
+            deficit = max(int(np.ceil(remaining * RESAMPLE_FACTOR)), RESAMPLE_MIN)
+            draws = self._draws_for(deficit, category, possible_rels)
+            groups = []
+            for start in range(0, draws, BLOCK_SIZE):
+                task = (c, next_block * BLOCK_SIZE, min(BLOCK_SIZE, draws - start))
+                groups.extend(
+                    edge_block((*task, n_src, n_tgt), self.entropy, self.pools, plan)
+                )
+                next_block += 1
+        self.resample_rounds[category] = rounds
+
     def _generate_osm(
         self,
         place: Optional[str] = None,
@@ -262,10 +1099,83 @@ class GraphFaker:
             logger.info(f"Flight data for {year}-{month:02d}")
         return G
 
-    def _generate_faker(self, total_nodes=100, total_edges=1000):
+    def _topology_plan(self, topology, communities_of) -> Optional[list]:
+        """
+        Resolve a topology argument to the (model, params, communities) list
+        edge_block expects; communities_of(node_type) is only called for sbm.
+        """
+        if topology is None:
+            return None
+        if not isinstance(topology, dict):
+            topology = {category: topology for category in EDGE_DISTRIBUTION}
+        unknown = set(topology) - set(EDGE_DISTRIBUTION)
+        if unknown:
+            raise ValueError(
+                f"Unknown edge categories {sorted(unknown)}. "
+                f"Use keys of EDGE_DISTRIBUTION."
+            )
+        cache = {}
+        plan = []
+        for category, _ in EDGE_CATEGORIES:
+            model, params = model_spec(topology.get(category, "uniform"))
+            communities = None
+            if model == "sbm":
+                for node_type in category:
+                    if node_type not in cache:
+                        cache[node_type] = communities_of(node_type)
+                communities = tuple(cache[t] for t in category)
+            plan.append((model, params, communities))
+        return plan
+
+    def _communities(self, node_type: str, nodes) -> Communities:
+        """Subtype communities of generated nodes, in nodes order."""
+        attr, subtypes = SUBTYPE_ATTRS[node_type]
+        if self.backend != "csr":
+            labels = (self.G.nodes[n].get(attr) for n in nodes)
+            return Communities.from_labels(labels, subtypes)
+        chunks = []
+        for table in self._builder.tables:
+            if table.label != node_type:
+                continue
+            if attr in table.columns:
+                chunks.append(table.columns[attr].values_at(np.arange(len(table))))
+            elif table.lazy is not None:
+                ids = self.G.node_ids.slice(table.start, table.stop)
+                chunks.append([table.lazy(n).get(attr) for n in ids])
+            else:
+                chunks.append([None] * len(table))
+        labels = (label for chunk in chunks for label in chunk)
+        return Communities.from_labels(labels, subtypes)
+
+    def _stream_communities(self, node_type: str, counts: dict) -> Communities:
+        """Subtype communities of the nodes iter_node_batches(counts) yields."""
+        attr, subtypes = SUBTYPE_ATTRS[node_type]
+        tasks = [task for task in node_blocks(counts) if task[0] == node_type]
+        labels = (
+            label
+            for task in tasks
+            for label in node_block(task, self.entropy, self.pools)[attr]
+        )
+        return Communities.from_labels(labels, subtypes)
+
+    def _generate_faker(
+        self,
+        total_nodes=100,
+        total_edges=1000,
+        batched=False,
+        workers=1,
+        topology=None,
+        exact_edges=False,
+    ):
         """Generates the complete Social Knowledge Graph."""
-        self.generate_nodes(total_nodes=total_nodes)
-        self.generate_edges(total_edges=total_edges)
+        self.generate_nodes(total_nodes=total_nodes, batched=batched, workers=workers)
+        self.generate_edges(
+            total_edges=total_edges,
+            batched=batched,
+            workers=workers,
+            topology=topology,
+            exact=exact_edges,
+        )
         return self.G
 
     def generate_graph(
@@ -284,15 +1194,56 @@ class GraphFaker:
         year: int = 2024,
         month: int = 1,
         date_range: Optional[tuple] = None,
+        batched: bool = False,
+        workers: int = 1,
+        topology=None,
+        exact_edges: bool = False,
+        cache=False,
+        cache_dir: Optional[str] = None,
     ) -> nx.DiGraph:
         """
         Unified entrypoint: choose 'random' or 'osm'.
         Pass kwargs depending on source.
+
+        For the faker source, batched=True switches to vectorized column-wise
+        generation, which is much faster for large graphs. workers=N spreads the
+        batched generation over N processes; for a given seed the graph is the
+        same for any number of workers. topology picks heavy-tailed or
+        community-structured edge models per category, see generate_edges.
+        exact_edges=True makes the graph have exactly total_edges edges.
+
+        cache=True (or a GraphCache instance, or a cache_dir) stores the result
+        on disk keyed by the source, parameters, seed and library version, and
+        loads it instead of regenerating on later calls with the same arguments.
+        Faker graphs are only cached when they are reproducible, that is with a
+        seed and batched generation; other calls skip the cache.
         """
+        params = {
+            k: v
+            for k, v in locals().items()
+            if k not in ("self", "workers", "cache", "cache_dir")
+        }
+        reason = self._uncacheable(source, batched, workers)
+        if (cache or cache_dir) and reason:
+            logger.warning(f"Not caching the graph: {reason}.")
+        elif cache or cache_dir:
+            store = cache if isinstance(cache, GraphCache) else GraphCache(cache_dir)
+            key = store.key(source, {**params, **self._cache_params()}, self.seed)
+            G = store.get(key)
+            if G is None:
+                G = self.generate_graph(**params, workers=workers)
+                store.put(key, G)
+            self.G = G
+            return G
 
         if source == "faker":
             return self._generate_faker(
-                total_nodes=total_nodes, total_edges=total_edges
+                total_nodes=total_nodes,
+                total_edges=total_edges,
+                batched=batched,
+                workers=workers,
+                topology=topology,
+                exact_edges=exact_edges,
             )
         elif source == "osm":
             logger.info(
@@ -320,42 +1271,139 @@ class GraphFaker:
         else:
             raise ValueError(f"Unknown source '{source}'. Use 'random' or 'osm'.")
         
-    def export_graph(self, G: nx.Graph = None, source: str = None, path: str = "graph.graphml"):
+    def _uncacheable(self, source: str, batched: bool, workers: int) -> Optional[str]:
+        """Why a generate_graph call must not be cached, None when it may."""
+        if source != "faker":
+            return None
+        if self.seed is None:
+            return "no seed is set, every run draws a different graph"
+        if not self._batched(batched, workers):
+            return "only batched faker generation is reproducible, pass batched=True"
+        return None
+
+    def _cache_params(self) -> dict:
+        """Instance settings that change the generated graph."""
+        return {
+            "backend": self.backend,
+            "pool_size": self.pools.size,
+            "unique_pools": self.pools.unique,
+            "lazy_attributes": self.lazy_attributes,
+        }
+
+    def export_graph(
+        self,
+        G: nx.Graph = None,
+        source: str = None,
+        path: str = "graph.graphml",
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        append: bool = False,
+    ):
         """
-        Export the graph to GraphML format.
+        Export the graph to GraphML or to per-type files for other tools.
 
         Args:
-            G: Optional NetworkX graph. If None, uses self.G.
-            source: Optional string, if "osm" uses osmnx for export.
-            path: Destination file path for .graphml output.
+            G: Optional NetworkX graph or CSRGraph. If None, uses self.G.
+            source: Optional string, if "osm" every attribute is written as a
+                string like osmnx.save_graphml does, so osmnx can load it back.
+            path: Destination file for GraphML, RDF, snapshot or SQLite output,
+                or an open file (GraphML, RDF). For the other formats the
+                output directory.
+            format: "graphml", "parquet", "arrow", "neo4j" (neo4j-admin
+                import CSVs), "kuzu" (DDL plus COPY-ready Parquet),
+                "snapshot" (file for graphfaker.load_graph), "sqlite" (.sqlite
+                or .db database), the integer-id "edgelist", "mtx" and
+                "metis" formats, or RDF as "ntriples" (.nt) or "jsonld".
+                Inferred from the path extension (.gfsnap for snapshots) when
+                omitted, GraphML by default.
+            compression: "gzip" or "zstd". GraphML and Neo4j CSVs are
+                compressed in blocks on background threads (a .gz / .zst
+                suffix is added to the file names); Parquet, Arrow and Kuzu
+                use it as the codec of their own column compression (Parquet
+                and Kuzu also take "snappy", "brotli" or "lz4", Arrow only
+                "lz4" or "zstd"); the integer-id formats compress every part
+                file.
+            compression_level: codec level, the codec default when omitted.
+            append: for "parquet", "arrow" and "neo4j", add the nodes and edges
+                missing from the export in path as a new part listed in its
+                manifest.json (see exporters.manifest).
 
         Notes:
             GraphML is useful for visualization in tools like Gephi or Cytoscape.
-            Node/edge attributes should be simple types (str, int, float).
+            The graph is streamed to the file and never modified; tuples such as
+            coordinates are written as "lat,lon" strings.
+            Parquet and Arrow write one typed file per node type and per
+            relationship (see exporters.columnar), for Spark, DuckDB or pandas.
+            "neo4j" writes headered CSVs for neo4j-admin database import (see
+            exporters.neo4j), "kuzu" the schema, COPY statements and files
+            load_kuzu runs against an embedded database (see exporters.kuzu).
+            A snapshot is loaded back memory-mapped, in milliseconds, by
+            graphfaker.load_graph (see snapshot). "edgelist" (binary),
+            "mtx" (Matrix Market) and "metis" renumber nodes from 0 (1) and
+            write an ids.txt mapping for external solvers (see exporters.hpc).
+            RDF output is streamed like GraphML, with IRIs under
+            http://graphfaker.org/ (see exporters.rdf). "sqlite" writes a
+            table per node type and an edges table, read back (or a subgraph
+            of some types) with exporters.sqlite.read_sqlite.
         """
         import os
 
-        abs_path = os.path.abspath(path)
-        os.makedirs(os.path.dirname(abs_path) or ".", exist_ok=True)
-
         if G is None:
             G = self.G
         if G is None:
             raise ValueError("No graph available to export.")
+        if format is None:
+            extension = os.path.splitext(str(path))[1].lstrip(".").lower()
+            format = EXPORT_EXTENSIONS.get(extension, "graphml")
+        if format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unknown export format '{format}'. Use one of {EXPORT_FORMATS}."
+            )
 
-        # Sanitize attributes that are not GraphML-friendly
-        for _, data in G.nodes(data=True):
-            if 'coordinates' in data and isinstance(data['coordinates'], tuple):
-                lat, lon = data['coordinates']
-                data['coordinates'] = f"{lat},{lon}"
+        options = {"compression": compression, "level": compression_level}
+        if append and format not in APPEND_FORMATS:
+            raise ValueError(
+                f"{format} export cannot append, use one of {APPEND_FORMATS}."
+            )
+        if hasattr(path, "write"):
+            if format == "graphml":
+                write_graphml(G, path, stringify=source == "osm", **options)
+            elif format in RDF_FORMATS:
+                write_rdf(G, path, format=format, **options)
+            else:
+                raise ValueError(f"{format} export needs a directory path.")
+            return
 
-        if source == "osm":
-            try:
-                import osmnx as ox
-                ox.io.save_graphml(G, filepath=abs_path)
-            except ImportError:
-                raise ImportError("osmnx is required to export OSM graphs.")
+        abs_path = os.path.abspath(path)
+        if format == "graphml":
+            abs_path = compressed_path(abs_path, compression)
+            os.makedirs(os.path.dirname(abs_path) or ".", exist_ok=True)
+            write_graphml(G, abs_path, stringify=source == "osm", **options)
+        elif format in RDF_FORMATS:
+            abs_path = compressed_path(abs_path, compression)
+            os.makedirs(os.path.dirname(abs_path) or ".", exist_ok=True)
+            write_rdf(G, abs_path, format=format, **options)
+        elif format == "neo4j":
+            write_neo4j_csv(G, abs_path, append=append, **options)
+        elif format == "kuzu":
+            write_kuzu(G, abs_path, **options)
+        elif format == "snapshot":
+            if compression is not None:
+                raise ValueError("Snapshots are not compressed, they are mapped.")
+            save_graph(G, abs_path)
+        elif format == "sqlite":
+            if compression is not None:
+                raise ValueError("SQLite databases are written uncompressed.")
+            write_sqlite(G, abs_path)
+        elif format in HPC_FORMATS:
+            write_hpc(G, abs_path, format=format, **options)
         else:
-            nx.write_graphml(G, abs_path)
+            if format == "arrow" and compression not in (None, *ARROW_CODECS):
+                raise ValueError(
+                    f"Arrow IPC files are compressed with {' or '.join(ARROW_CODECS)}, "
+                    f"not {compression}."
+                )
+            write_columnar(G, abs_path, format=format, append=append, **options)
 
         print(f"✅ Graph exported to: {abs_path}")
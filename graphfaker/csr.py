@@ -0,0 +1,891 @@
+"""
+Compact array-backed graph backend.
+
+CSRGraph stores topology in CSR form (an ``indptr``/``indices`` pair of
+integer arrays) and node and edge attributes as typed columns, which takes a
+fraction of the memory of NetworkX's dict-of-dicts. It implements the
+read-only part of the ``nx.DiGraph`` API used across graphfaker (node and edge
+views, has_node, has_edge, successors, ...) and converts with ``to_networkx()``
+when a full NetworkX graph is needed.
+
+Column kinds:
+  - int, float, bool: NumPy arrays (ints are stored in the smallest dtype that fits)
+  - str: dictionary encoded, integer codes into a table of distinct values
+  - pair: (n, 2) float arrays, returned as tuples (e.g. coordinates)
+
+A column with an ``index`` is sparse and only holds values at those positions,
+which keeps relationship-specific edge attributes (``visit_count``, ``rating``,
+...) proportional to the edges that carry them.
+
+Usage:
+    from graphfaker import GraphFaker
+    gf = GraphFaker(backend="csr", seed=1)
+    G = gf.generate_graph(total_nodes=1_000_000, total_edges=5_000_000)
+    G.nodes["person_0"]["name"]
+    nxG = G.to_networkx()
+"""
+
+import bisect
+from itertools import chain, repeat
+from typing import Iterable, Optional
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+# Rows materialized at a time when iterating node or edge data
+CHUNK_SIZE = 65_536
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class StringTable:
+    """Immutable sequence of strings stored as one UTF-8 buffer plus offsets."""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+        # (prefix, first number) when built by from_prefix, see CSRGraph.node_index
+        self.prefix_range = None
+        self._buf = None
+
+    def _buffer(self) -> bytes:
+        if self._buf is None:
+            self._buf = np.asarray(self.data, dtype=np.uint8).tobytes()
+        return self._buf
+
+    def __getstate__(self):
+        # The bytes buffer duplicates data; rebuild it lazily after unpickling
+        return {**self.__dict__, "_buf": None}
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "StringTable":
+        encoded = [s.encode("utf-8") for s in strings]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8))
+
+    @classmethod
+    def from_prefix(cls, prefix: str, count: int, start: int = 0) -> "StringTable":
+        """Vectorized build of the ids f"{prefix}_{i}" for i in [start, start+count)."""
+        numbers = np.arange(start, start + count).astype(str)
+        raw = np.char.add(f"{prefix}_", numbers).astype(bytes)
+        lengths = np.char.str_len(raw).astype(np.int64)
+        width = raw.dtype.itemsize
+        grid = raw.view(np.uint8).reshape(count, width) if count else raw.view(np.uint8)
+        mask = np.arange(width) < lengths[:, None]
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        table = cls(offsets, np.ascontiguousarray(grid[mask]))
+        table.prefix_range = (prefix, start)
+        return table
+
+    @classmethod
+    def concat(cls, tables: list) -> "StringTable":
+        if not tables:
+            return cls.from_strings([])
+        offsets = [tables[0].offsets]
+        base = tables[0].offsets[-1]
+        for t in tables[1:]:
+            offsets.append(t.offsets[1:] + base)
+            base += t.offsets[-1]
+        data = np.concatenate([np.asarray(t.data, dtype=np.uint8) for t in tables])
+        return cls(np.concatenate(offsets), data)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        a, b = self.offsets[i], self.offsets[i + 1]
+        return bytes(self.data[a:b]).decode("utf-8")
+
+    def slice(self, start: int, stop: int) -> list:
+        """Decode strings [start, stop) into a list."""
+        offs = self.offsets[start : stop + 1]
+        buf = bytes(self.data[offs[0] : offs[-1]])
+        offs = (offs - offs[0]).tolist()
+        # itertools.pairwise needs Python 3.10
+        pairs = zip(offs, offs[1:])  # noqa: RUF007
+        return [buf[a:b].decode("utf-8") for a, b in pairs]
+
+    def take(self, idx: np.ndarray) -> list:
+        buf = self._buffer()
+        starts = self.offsets[idx].tolist()
+        stops = self.offsets[np.asarray(idx) + 1].tolist()
+        return [buf[a:b].decode("utf-8") for a, b in zip(starts, stops)]
+
+    def tolist(self) -> list:
+        return self.slice(0, len(self))
+
+    def __iter__(self):
+        for start in range(0, len(self), CHUNK_SIZE):
+            yield from self.slice(start, min(start + CHUNK_SIZE, len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets.nbytes + np.asarray(self.data).nbytes
+
+
+def _compact_ints(arr: np.ndarray) -> np.ndarray:
+    """Downcast an integer array to the smallest dtype that holds its range."""
+    if not len(arr):
+        return arr.astype(np.int8)
+    lo, hi = int(arr.min()), int(arr.max())
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return arr.astype(dtype)
+    return arr.astype(np.int64)
+
+
+def _infer_kind(value) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return "bool"
+    if isinstance(value, (int, np.integer)):
+        return "int"
+    if isinstance(value, (float, np.floating)):
+        return "float"
+    if isinstance(value, tuple) and len(value) == 2:
+        return "pair"
+    return "str"
+
+
+class Column:
+    """
+    A typed attribute column.
+
+    Args:
+        kind: one of "int", "float", "bool", "str", "pair".
+        data: values (or codes into `categories` for "str").
+        categories: distinct values of a "str" column.
+        index: sorted positions the values belong to, for sparse columns.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        data: np.ndarray,
+        categories: Optional[np.ndarray] = None,
+        index: Optional[np.ndarray] = None,
+    ):
+        self.kind = kind
+        self.data = data
+        self.categories = categories
+        self.index = index
+
+    @classmethod
+    def constant(cls, value, n: int) -> "Column":
+        kind = _infer_kind(value)
+        if kind == "str":
+            return cls(
+                "str", np.zeros(n, dtype=np.int8), np.asarray([value], dtype=object)
+            )
+        return cls.from_values(np.full(n, value))
+
+    @classmethod
+    def from_values(cls, values, index: Optional[np.ndarray] = None) -> "Column":
+        """
+        Build a column from an array or list of values. None entries are
+        treated as missing and make the column sparse.
+        """
+        if isinstance(values, np.ndarray) and values.dtype != object:
+            if values.dtype.kind in "iu":
+                return cls("int", _compact_ints(values), index=index)
+            if values.dtype.kind == "f":
+                if values.ndim == 2:
+                    return cls("pair", values.astype(np.float64), index=index)
+                return cls("float", values.astype(np.float64), index=index)
+            if values.dtype.kind == "b":
+                return cls("bool", values, index=index)
+            values = values.astype(object)
+
+        if not isinstance(values, np.ndarray):
+            values = np.asarray(list(values) + [None], dtype=object)[:-1]
+        present = ~pd.isna(values)
+        if not present.all():
+            positions = np.flatnonzero(present)
+            index = positions if index is None else index[positions]
+            values = values[positions]
+        if not len(values):
+            empty = np.asarray([], dtype=object)
+            return cls("str", np.zeros(0, dtype=np.int8), empty, index)
+
+        inferred = pd.api.types.infer_dtype(values, skipna=False)
+        if inferred == "integer":
+            return cls("int", _compact_ints(values.astype(np.int64)), index=index)
+        if inferred in ("floating", "mixed-integer-float"):
+            return cls("float", values.astype(np.float64), index=index)
+        if inferred == "boolean":
+            return cls("bool", values.astype(bool), index=index)
+        if inferred != "string":
+            if all(_infer_kind(v) == "pair" for v in values):
+                pairs = np.asarray(values.tolist(), dtype=np.float64)
+                return cls("pair", pairs, index=index)
+            values = np.asarray([str(v) for v in values], dtype=object)
+        codes, uniques = pd.factorize(values)
+        return cls(
+            "str",
+            _compact_ints(codes),
+            np.asarray(uniques, dtype=object),
+            index=index,
+        )
+
+    @classmethod
+    def concat(cls, columns: list) -> "Column":
+        """Concatenate dense columns of the same kind."""
+        kinds = {c.kind for c in columns}
+        if len(kinds) > 1:
+            if kinds <= {"int", "float"}:
+                return cls(
+                    "float",
+                    np.concatenate([c.data.astype(np.float64) for c in columns]),
+                )
+            return cls.from_values(
+                [v for c in columns for v in c.decode(np.arange(len(c.data)))]
+            )
+        kind = kinds.pop()
+        if kind != "str":
+            data = np.concatenate([c.data for c in columns])
+            return cls(kind, _compact_ints(data) if kind == "int" else data)
+        if all(c.categories is columns[0].categories for c in columns):
+            # Same dictionary everywhere, e.g. codes drawn from one value pool
+            data = np.concatenate([c.data for c in columns])
+            return cls("str", _compact_ints(data), columns[0].categories)
+        categories, remapped = [], []
+        lookup: dict = {}
+        for c in columns:
+            mapping = np.empty(len(c.categories), dtype=np.int64)
+            for i, value in enumerate(c.categories.tolist()):
+                mapping[i] = lookup.setdefault(value, len(lookup))
+                if mapping[i] == len(categories):
+                    categories.append(value)
+            remapped.append(mapping[c.data] if len(mapping) else c.data)
+        return cls(
+            "str",
+            _compact_ints(np.concatenate(remapped)),
+            np.asarray(categories, dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def subset(self, rows: np.ndarray, index: Optional[np.ndarray] = None) -> "Column":
+        """Column made of the stored values at `rows`, placed at `index`."""
+        return Column(self.kind, self.data[rows], self.categories, index)
+
+    def decode(self, rows: np.ndarray) -> list:
+        """Python values of the stored entries at `rows`."""
+        if self.kind == "str":
+            return self.categories[self.data[rows]].tolist()
+        if self.kind == "pair":
+            return [tuple(p) for p in self.data[rows].tolist()]
+        return self.data[rows].tolist()
+
+    def values_at(self, positions: np.ndarray) -> list:
+        """Values at the given positions, MISSING where a sparse column has none."""
+        if self.index is None:
+            return self.decode(positions)
+        out = [MISSING] * len(positions)
+        for i, v in zip(*self.hits(positions)):
+            out[i] = v
+        return out
+
+    def hits(self, positions: np.ndarray) -> tuple:
+        """(indexes into positions, values) of the entries a sparse column has."""
+        if not len(self.index):
+            return [], []
+        loc = np.searchsorted(self.index, positions)
+        found = self.index[np.minimum(loc, len(self.index) - 1)] == positions
+        hits = np.flatnonzero(found)
+        return hits.tolist(), self.decode(loc[hits])
+
+    def value(self, position: int):
+        return self.values_at(np.asarray([position]))[0]
+
+    @property
+    def nbytes(self) -> int:
+        total = self.data.nbytes
+        if self.index is not None:
+            total += self.index.nbytes
+        return total
+
+
+def _as_column(values) -> Column:
+    if isinstance(values, Column):
+        if values.kind == "str":
+            codes = _compact_ints(values.data)
+            return Column("str", codes, values.categories, values.index)
+        return values
+    return Column.from_values(values)
+
+
+class NodeTable:
+    """
+    Nodes [start, stop) of one label and their attribute columns.
+
+    lazy, when set, is a callable node_id -> attribute dict that supplies the
+    attributes not stored in columns. id_prefix is (prefix, first number) when
+    the ids are f"{prefix}_{i}" for consecutive i.
+    """
+
+    def __init__(
+        self,
+        label: Optional[str],
+        start: int,
+        stop: int,
+        columns: dict,
+        lazy=None,
+        id_prefix: Optional[tuple] = None,
+    ):
+        self.label = label
+        self.start = start
+        self.stop = stop
+        self.columns = columns
+        self.lazy = lazy
+        self.id_prefix = id_prefix
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+
+class _DataView:
+    """Re-iterable, sized view over a generator function."""
+
+    def __init__(self, make_iter, length: int):
+        self._make_iter = make_iter
+        self._length = length
+
+    def __iter__(self):
+        return self._make_iter()
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class NodeView:
+    """Read-only stand-in for ``G.nodes``."""
+
+    def __init__(self, graph: "CSRGraph"):
+        self._graph = graph
+
+    def __iter__(self):
+        return iter(self._graph.node_ids)
+
+    def __len__(self) -> int:
+        return self._graph.number_of_nodes()
+
+    def __contains__(self, n) -> bool:
+        return self._graph.has_node(n)
+
+    def __getitem__(self, n) -> dict:
+        return self._graph._node_data(self._graph.node_index(n))
+
+    def __call__(self, data=False, default=None):
+        if data is False:
+            return self
+        return _DataView(
+            lambda: self._graph._iter_node_data(data, default), len(self)
+        )
+
+    data = __call__
+
+    def items(self):
+        return self(data=True)
+
+
+class EdgeView:
+    """Read-only stand-in for ``G.edges``."""
+
+    def __init__(self, graph: "CSRGraph"):
+        self._graph = graph
+
+    def __iter__(self):
+        return self._graph._iter_edge_data(False, None)
+
+    def __len__(self) -> int:
+        return self._graph.number_of_edges()
+
+    def __contains__(self, e) -> bool:
+        return self._graph.has_edge(*e)
+
+    def __getitem__(self, e) -> dict:
+        u, v = e
+        pos = self._graph._edge_position(u, v)
+        if pos is None:
+            raise KeyError(e)
+        return self._graph._edge_data(pos)
+
+    def __call__(self, data=False, default=None):
+        return _DataView(
+            lambda: self._graph._iter_edge_data(data, default), len(self)
+        )
+
+    data = __call__
+
+
+class CSRGraph:
+    """
+    Read-only directed graph backed by CSR arrays and typed columns.
+
+    Args:
+        node_ids: node identifiers, in node index order.
+        node_tables: NodeTables covering [0, N) in order.
+        indptr: int64 array of length N + 1.
+        indices: target node index of every edge, grouped by source.
+        edge_columns: dict of attribute name -> Column over edge positions.
+        graph: graph-level attributes.
+        id_order: optional permutation sorting node_ids, used to look ids up
+            by binary search instead of building an id -> index dict.
+    """
+
+    def __init__(
+        self,
+        node_ids: StringTable,
+        node_tables: list,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        edge_columns: dict,
+        graph: Optional[dict] = None,
+        id_order: Optional[np.ndarray] = None,
+    ):
+        self.node_ids = node_ids
+        self.node_tables = node_tables
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_columns = edge_columns
+        self.graph = dict(graph or {})
+        self.id_order = id_order
+        self._index = None
+        self._table_starts = [t.start for t in node_tables]
+        # prefix -> (first numbers, tables), to resolve "prefix_i" ids without
+        # building the id -> index dict
+        self._prefixes: dict = {}
+        for table in node_tables:
+            if table.id_prefix is not None:
+                prefix, first = table.id_prefix
+                firsts, tables = self._prefixes.setdefault(prefix, ([], []))
+                firsts.append(first)
+                tables.append(table)
+        for firsts, tables in self._prefixes.values():
+            order = sorted(range(len(firsts)), key=firsts.__getitem__)
+            firsts[:] = [firsts[k] for k in order]
+            tables[:] = [tables[k] for k in order]
+        self._all_prefixed = all(t.id_prefix is not None for t in node_tables)
+
+    def __getstate__(self):
+        # The id -> index dict is rebuilt on demand and dwarfs the arrays
+        return {**self.__dict__, "_index": None}
+
+    # -- NetworkX-compatible read API ---------------------------------------
+
+    def is_directed(self) -> bool:
+        return True
+
+    def is_multigraph(self) -> bool:
+        return False
+
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def number_of_edges(self) -> int:
+        return len(self.indices)
+
+    order = number_of_nodes
+    size = number_of_edges
+
+    def __len__(self) -> int:
+        return self.number_of_nodes()
+
+    def __iter__(self):
+        return iter(self.node_ids)
+
+    def __contains__(self, n) -> bool:
+        return self.has_node(n)
+
+    def __getitem__(self, n) -> dict:
+        i = self.node_index(n)
+        lo, hi = int(self.indptr[i]), int(self.indptr[i + 1])
+        targets = self.node_ids.take(self.indices[lo:hi])
+        return {v: self._edge_data(p) for v, p in zip(targets, range(lo, hi))}
+
+    @property
+    def nodes(self) -> NodeView:
+        return NodeView(self)
+
+    @property
+    def edges(self) -> EdgeView:
+        return EdgeView(self)
+
+    def has_node(self, n) -> bool:
+        try:
+            self.node_index(n)
+        except KeyError:
+            return False
+        return True
+
+    def has_edge(self, u, v) -> bool:
+        return self._edge_position(u, v) is not None
+
+    def successors(self, n):
+        i = self.node_index(n)
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        return iter(self.node_ids.take(self.indices[lo:hi]))
+
+    neighbors = successors
+
+    def out_degree(self, n=None):
+        degrees = np.diff(self.indptr)
+        if n is not None:
+            return int(degrees[self.node_index(n)])
+        return zip(self.node_ids, degrees.tolist())
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Materialize an equivalent nx.DiGraph."""
+        G = nx.DiGraph()
+        G.graph.update(self.graph)
+        G.add_nodes_from(self.nodes(data=True))
+        G.add_edges_from(self.edges(data=True))
+        return G
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the arrays of this graph."""
+        total = self.node_ids.nbytes + self.indptr.nbytes + self.indices.nbytes
+        for table in self.node_tables:
+            total += sum(c.nbytes for c in table.columns.values())
+        total += sum(c.nbytes for c in self.edge_columns.values())
+        return total
+
+    # -- internals -----------------------------------------------------------
+
+    def node_index(self, n) -> int:
+        """Integer index of node n."""
+        i = self._prefix_index(n)
+        if i is not None:
+            return i
+        if self._all_prefixed:
+            raise KeyError(n)
+        if self.id_order is not None:
+            return self._sorted_index(n)
+        if self._index is None:
+            self._index = {node: i for i, node in enumerate(self.node_ids)}
+        return self._index[n]
+
+    def _prefix_index(self, n) -> Optional[int]:
+        if not self._prefixes or not isinstance(n, str):
+            return None
+        prefix, _, number = n.rpartition("_")
+        if prefix not in self._prefixes or not number.isdigit():
+            return None
+        k = int(number)
+        if str(k) != number:
+            return None
+        firsts, tables = self._prefixes[prefix]
+        pos = bisect.bisect_right(firsts, k) - 1
+        if pos < 0:
+            return None
+        table = tables[pos]
+        if k - firsts[pos] >= len(table):
+            return None
+        return table.start + k - firsts[pos]
+
+    def _sorted_index(self, n) -> int:
+        """Binary search of n over the ids in id_order."""
+        if not isinstance(n, str):
+            raise KeyError(n)
+        lo, hi = 0, len(self.id_order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.node_ids[self.id_order[mid]] < n:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.id_order) and self.node_ids[self.id_order[lo]] == n:
+            return int(self.id_order[lo])
+        raise KeyError(n)
+
+    def _table_of(self, i: int) -> NodeTable:
+        return self.node_tables[bisect.bisect_right(self._table_starts, i) - 1]
+
+    def _node_data(self, i: int) -> dict:
+        table = self._table_of(i)
+        data = {} if table.label is None else {"type": table.label}
+        if table.lazy is not None:
+            data.update(table.lazy(self.node_ids[i]))
+        for name, col in table.columns.items():
+            value = col.value(i - table.start)
+            if value is not MISSING:
+                data[name] = value
+        return data
+
+    def _iter_node_data(self, data, default):
+        for table in self.node_tables:
+            for start in range(0, len(table), CHUNK_SIZE):
+                stop = min(start + CHUNK_SIZE, len(table))
+                ids = self.node_ids.slice(table.start + start, table.start + stop)
+                rows = _rows(
+                    table.columns, np.arange(start, stop), table.label, "type"
+                )
+                if table.lazy is not None:
+                    rows = [{**table.lazy(n), **row} for n, row in zip(ids, rows)]
+                yield from _select(ids, rows, data, default)
+
+    def _edge_position(self, u, v) -> Optional[int]:
+        try:
+            i, j = self.node_index(u), self.node_index(v)
+        except KeyError:
+            return None
+        lo, hi = int(self.indptr[i]), int(self.indptr[i + 1])
+        k = lo + int(np.searchsorted(self.indices[lo:hi], j))
+        if k < hi and self.indices[k] == j:
+            return k
+        return None
+
+    def _edge_data(self, pos: int) -> dict:
+        data = {}
+        for name, col in self.edge_columns.items():
+            value = col.value(pos)
+            if value is not MISSING:
+                data[name] = value
+        return data
+
+    def edge_sources(self) -> np.ndarray:
+        """Source node index of every edge position."""
+        return np.repeat(
+            np.arange(self.number_of_nodes(), dtype=self.indices.dtype),
+            np.diff(self.indptr),
+        )
+
+    def _iter_edge_data(self, data, default):
+        E = self.number_of_edges()
+        for start in range(0, E, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, E)
+            positions = np.arange(start, stop)
+            src = np.searchsorted(self.indptr, positions, side="right") - 1
+            # Sources are sorted, so decode each distinct id once
+            first, counts = np.unique(src, return_counts=True)
+            sources = list(
+                chain.from_iterable(
+                    repeat(n, c)
+                    for n, c in zip(self.node_ids.take(first), counts.tolist())
+                )
+            )
+            targets = self.node_ids.take(self.indices[start:stop])
+            if data is False:
+                yield from zip(sources, targets)
+                continue
+            rows = _rows(self.edge_columns, positions)
+            if data is True:
+                yield from zip(sources, targets, rows)
+            else:
+                for u, v, d in zip(sources, targets, rows):
+                    yield u, v, d.get(data, default)
+
+
+def _rows(columns: dict, positions: np.ndarray, label=None, label_key=None) -> list:
+    """Per-row attribute dicts for the given positions of a set of columns."""
+    names = list(columns)
+    dense = [name for name in names if columns[name].index is None]
+    if names[: len(dense)] == dense:
+        # Dense columns first: zip them, then fill in the sparse hits only
+        base = {} if label is None else {label_key: label}
+        values = [columns[name].decode(positions) for name in dense]
+        if values:
+            rows = [{**base, **dict(zip(dense, row))} for row in zip(*values)]
+        else:
+            rows = [dict(base) for _ in range(len(positions))]
+        for name in names[len(dense) :]:
+            for i, v in zip(*columns[name].hits(positions)):
+                rows[i][name] = v
+        return rows
+    values = [columns[name].values_at(positions) for name in names]
+    base = {} if label is None else {label_key: label}
+    rows = []
+    for row in zip(*values) if values else ((),) * len(positions):
+        d = dict(base)
+        for name, value in zip(names, row):
+            if value is not MISSING:
+                d[name] = value
+        rows.append(d)
+    return rows
+
+
+def _select(ids: list, rows: list, data, default):
+    if data is True:
+        return zip(ids, rows)
+    return ((n, d.get(data, default)) for n, d in zip(ids, rows))
+
+
+class CSRGraphBuilder:
+    """
+    Accumulates node tables and COO edge chunks and builds a CSRGraph.
+
+    Edges are deduplicated on build. Repeated (source, target) edges merge
+    their attributes, each taking its value from the last occurrence that has
+    it, matching how repeated add_edge calls behave on an nx.DiGraph.
+    """
+
+    def __init__(self):
+        self.tables: list = []
+        self._ids: list = []
+        self._num_nodes = 0
+        self._src: list = []
+        self._dst: list = []
+        self._num_edges = 0
+        self._edge_columns: dict = {}
+        self.graph: dict = {}
+
+    @property
+    def num_nodes(self) -> int:
+        return self._num_nodes
+
+    def add_nodes(
+        self, label: Optional[str], ids, columns: dict, lazy=None
+    ) -> int:
+        """
+        Append a table of nodes.
+
+        Args:
+            label: node type, reported as the "type" attribute.
+            ids: StringTable or list of node ids.
+            columns: attribute name -> array/list of values.
+            lazy: optional callable node_id -> dict computing further
+                attributes on access instead of storing them.
+
+        Returns:
+            Index of the first added node.
+        """
+        if not isinstance(ids, StringTable):
+            ids = StringTable.from_strings(ids)
+        start = self._num_nodes
+        self._num_nodes += len(ids)
+        self._ids.append(ids)
+        self.tables.append(
+            NodeTable(
+                label,
+                start,
+                self._num_nodes,
+                {name: _as_column(values) for name, values in columns.items()},
+                lazy=lazy,
+                id_prefix=ids.prefix_range,
+            )
+        )
+        return start
+
+    def add_edges(self, src: np.ndarray, dst: np.ndarray, columns: dict):
+        """
+        Append edges given as global node indices.
+
+        Args:
+            src, dst: integer arrays of equal length.
+            columns: attribute name -> array/list of values, or a scalar that
+                applies to every edge in the chunk (e.g. the relationship).
+        """
+        m = len(src)
+        if not m:
+            return
+        offset = self._num_edges
+        self._src.append(np.asarray(src, dtype=np.int64))
+        self._dst.append(np.asarray(dst, dtype=np.int64))
+        self._num_edges += m
+        for name, values in columns.items():
+            if isinstance(values, (str, int, float, bool)):
+                col = Column.constant(values, m)
+            else:
+                col = _as_column(values)
+            if col.index is not None:
+                # Missing values inside the chunk: shift the sparse index
+                positions = col.index + offset
+                col = Column(col.kind, col.data, col.categories)
+            else:
+                positions = np.arange(offset, offset + m)
+            self._edge_columns.setdefault(name, []).append((positions, col))
+
+    def build(self) -> CSRGraph:
+        N = self._num_nodes
+        node_ids = StringTable.concat(self._ids)
+        index_dtype = np.int32 if N < 2**31 else np.int64
+
+        if self._num_edges:
+            src = np.concatenate(self._src)
+            dst = np.concatenate(self._dst)
+            keys = src * max(N, 1) + dst
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+            # Position of every added edge in the graph; repeats share one
+            new_position = np.empty(self._num_edges, dtype=np.int64)
+            new_position[order] = np.cumsum(first) - 1
+            order = order[first]
+        else:
+            src = dst = order = new_position = np.zeros(0, dtype=np.int64)
+
+        E = len(order)
+        indices = dst[order].astype(index_dtype)
+        indptr = np.zeros(N + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src[order], minlength=N), out=indptr[1:])
+
+        edge_columns = {}
+        for name, chunks in self._edge_columns.items():
+            positions = new_position[np.concatenate([p for p, _ in chunks])]
+            col = Column.concat([c for _, c in chunks])
+            # Rows are in insertion order; keep the last one of every edge
+            rows = np.argsort(positions, kind="stable")
+            last = np.ones(len(rows), dtype=bool)
+            last[:-1] = positions[rows[1:]] != positions[rows[:-1]]
+            rows = rows[last]
+            index = positions[rows]
+            edge_columns[name] = col.subset(rows, None if len(rows) == E else index)
+
+        return CSRGraph(
+            node_ids, list(self.tables), indptr, indices, edge_columns, self.graph
+        )
+
+
+def from_networkx(G: nx.DiGraph) -> CSRGraph:
+    """
+    Convert an nx.DiGraph into a CSRGraph. Nodes are grouped by their "type"
+    attribute into contiguous node tables.
+
+    CSRGraph ids are strings; graphs with other node ids (e.g. the integer
+    ids of OSM graphs) raise TypeError instead of coming back as strings.
+    Relabel them first, e.g. nx.relabel_nodes(G, str).
+    """
+    if G.is_multigraph():
+        raise ValueError("CSRGraph does not support multigraphs.")
+    for n in G:
+        if not isinstance(n, str):
+            raise TypeError(
+                f"CSRGraph node ids must be strings, got {type(n).__name__} "
+                f"id {n!r}; relabel the graph, e.g. nx.relabel_nodes(G, str)."
+            )
+
+    by_label: dict = {}
+    for n, data in G.nodes(data=True):
+        by_label.setdefault(data.get("type"), []).append((n, data))
+
+    builder = CSRGraphBuilder()
+    builder.graph.update(G.graph)
+    index = {}
+    for label, items in by_label.items():
+        keys = list(dict.fromkeys(k for _, d in items for k in d if k != "type"))
+        columns = {k: [d.get(k) for _, d in items] for k in keys}
+        ids = [n for n, _ in items]
+        start = builder.add_nodes(label, ids, columns)
+        index.update((n, start + i) for i, n in enumerate(ids))
+
+    edges = list(G.edges(data=True))
+    if edges:
+        keys = list(dict.fromkeys(k for _, _, d in edges for k in d))
+        src = np.fromiter((index[u] for u, _, _ in edges), np.int64, len(edges))
+        dst = np.fromiter((index[v] for _, v, _ in edges), np.int64, len(edges))
+        builder.add_edges(src, dst, {k: [d.get(k) for _, _, d in edges] for k in keys})
+    return builder.build()
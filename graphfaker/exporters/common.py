@@ -0,0 +1,746 @@
+# graphfaker/exporters/common.py
+"""
+Tables of nodes and edges for the columnar exporters.
+
+A graph is exported as one table per node type (the "type" attribute) and one
+per relationship (the "relationship" attribute). The graph is read twice: the
+first pass infers a typed schema per table (see graph_tables), the second
+streams the rows as pyarrow Tables of about batch_size rows (see iter_tables),
+so exporters hold at most one batch per table in memory.
+
+Column kinds are inferred from the values:
+    bool, int, float, string, timestamp, pair (2-tuples such as coordinates),
+    date (datetime.date values or ISO "YYYY-MM-DD" strings) and category
+    (strings with at most CATEGORY_LIMIT distinct values, e.g. subtypes).
+
+For a CSRGraph the tables are sliced straight out of its typed columns.
+
+Usage:
+    from graphfaker.exporters.common import graph_tables, iter_tables
+    tables = graph_tables(G)
+    for spec, table in iter_tables(G, tables):
+        ...  # spec.element is "node" or "edge", spec.label the type
+"""
+
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+
+from graphfaker.csr import MISSING, CSRGraph
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional dependency, see require_pyarrow
+    pa = None
+
+NODE_LABEL_ATTR = "type"
+EDGE_LABEL_ATTR = "relationship"
+# Tables for nodes or edges without a type / relationship
+DEFAULT_NODE_LABEL = "Node"
+DEFAULT_EDGE_LABEL = "EDGE"
+
+ID_COLUMN = "id"
+SOURCE_COLUMN = "source"
+TARGET_COLUMN = "target"
+KEY_COLUMN = "key"
+SOURCE_LABEL_COLUMN = "source_label"
+TARGET_LABEL_COLUMN = "target_label"
+
+BATCH_SIZE = 65_536
+# Writer threads of a WriterPool; pyarrow releases the GIL while encoding
+DEFAULT_WRITERS = min(4, os.cpu_count() or 1)
+# Strings with at most this many distinct values become dictionary columns
+CATEGORY_LIMIT = 256
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for columnar exports: pip install pyarrow"
+        )
+    return pa
+
+
+# Exact types checked before the isinstance chain of value_kind
+_TYPE_KINDS = {
+    str: "string",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    date: "date",
+    datetime: "timestamp",
+}
+
+
+def value_kind(value) -> Optional[str]:
+    """Column kind of a single Python value; None for missing values."""
+    kind = _TYPE_KINDS.get(type(value))
+    if kind is not None:
+        return kind
+    if value is None or value is MISSING:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return "bool"
+    if isinstance(value, (int, np.integer)):
+        return "int"
+    if isinstance(value, (float, np.floating)):
+        return "float"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, datetime):
+        return "timestamp"
+    if isinstance(value, date):
+        return "date"
+    if (
+        isinstance(value, tuple)
+        and len(value) == 2
+        and all(isinstance(v, (int, float, Decimal, np.number)) for v in value)
+    ):
+        return "pair"
+    return "other"
+
+
+class ColumnStats:
+    """Accumulates what the first pass saw of one column."""
+
+    __slots__ = ("count", "dates", "distinct", "kinds")
+
+    def __init__(self):
+        self.kinds: set = set()
+        self.distinct: Optional[set] = set()
+        self.dates = True
+        self.count = 0
+
+    def add(self, value):
+        kind = value_kind(value)
+        if kind is None:
+            return
+        self.kinds.add(kind)
+        self.count += 1
+        if kind == "string" and (self.dates or self.distinct is not None):
+            self.add_strings((value,))
+
+    def add_strings(self, values):
+        for s in values:
+            if self.distinct is not None:
+                self.distinct.add(s)
+                if len(self.distinct) > CATEGORY_LIMIT:
+                    self.distinct = None
+            if self.dates and not _ISO_DATE.match(s):
+                self.dates = False
+            if self.distinct is None and not self.dates:
+                return
+
+    def resolve(self) -> tuple:
+        """(kind, categories) of the column."""
+        kinds = self.kinds
+        if kinds <= {"int"} and kinds:
+            return "int", None
+        if kinds <= {"int", "float"} and kinds:
+            return "float", None
+        if kinds <= {"date", "timestamp"} and kinds:
+            return ("date" if kinds == {"date"} else "timestamp"), None
+        if kinds in ({"bool"}, {"pair"}):
+            return next(iter(kinds)), None
+        if kinds == {"string"} and self.dates:
+            return "date", None
+        # Repeated labels (subtypes, carriers) rather than unique values
+        repeated = self.distinct is not None and len(self.distinct) * 2 <= self.count
+        if kinds == {"string"} and repeated:
+            return "category", sorted(self.distinct)
+        return "string", None
+
+
+class TableSpec:
+    """
+    Schema of one exported table.
+
+    Attributes:
+        element: "node" or "edge".
+        label: node type or relationship name.
+        columns: list of (attribute, column name, kind, categories).
+        rows: number of rows.
+        endpoints: set of (source label, target label) pairs of an edge table.
+        id_kind: kind of the node id columns ("int" or "string").
+        multigraph: edge rows carry a key column.
+    """
+
+    def __init__(self, element: str, label: str, id_kind: str, multigraph=False):
+        self.element = element
+        self.label = label
+        self.columns: list = []
+        self.rows = 0
+        self.endpoints: set = set()
+        self.id_kind = id_kind
+        self.multigraph = multigraph
+
+    def key_fields(self, endpoint_labels: bool = False) -> list:
+        """(column name, kind) of the id / endpoint columns."""
+        if self.element == "node":
+            return [(ID_COLUMN, self.id_kind)]
+        fields = [(SOURCE_COLUMN, self.id_kind), (TARGET_COLUMN, self.id_kind)]
+        if self.multigraph:
+            fields.append((KEY_COLUMN, "string"))
+        if endpoint_labels:
+            fields += [(SOURCE_LABEL_COLUMN, "string"), (TARGET_LABEL_COLUMN, "string")]
+        return fields
+
+    def schema(self, endpoint_labels: bool = False):
+        """pyarrow schema of the table."""
+        require_pyarrow()
+        fields = [
+            pa.field(name, arrow_type(kind), nullable=name != ID_COLUMN)
+            for name, kind in self.key_fields(endpoint_labels)
+        ]
+        fields += [
+            pa.field(name, arrow_type(kind)) for _, name, kind, _ in self.columns
+        ]
+        return pa.schema(fields)
+
+
+def arrow_type(kind: str):
+    require_pyarrow()
+    return {
+        "bool": pa.bool_(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "string": pa.string(),
+        "date": pa.date32(),
+        "timestamp": pa.timestamp("us"),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "pair": pa.list_(pa.float64(), 2),
+    }[kind]
+
+
+def _finish(stats: dict, id_kind: str, multigraph: bool) -> dict:
+    """Turn (element, label) -> {"rows", "columns", "endpoints"} into TableSpecs."""
+    tables = {}
+    for (element, label), info in stats.items():
+        spec = TableSpec(element, label, id_kind, multigraph and element == "edge")
+        spec.rows = info["rows"]
+        spec.endpoints = info["endpoints"]
+        reserved = {name for name, _ in spec.key_fields(endpoint_labels=True)}
+        for attr, col_stats in info["columns"].items():
+            kind, categories = col_stats.resolve()
+            name = f"{attr}_attr" if attr in reserved else str(attr)
+            spec.columns.append((attr, name, kind, categories))
+        tables[(element, label)] = spec
+    return tables
+
+
+def _table_info(stats: dict, element: str, label: str) -> dict:
+    info = stats.get((element, label))
+    if info is None:
+        info = stats[(element, label)] = {
+            "rows": 0,
+            "columns": {},
+            "endpoints": set(),
+        }
+    return info
+
+
+def node_label(data) -> str:
+    label = data.get(NODE_LABEL_ATTR)
+    return DEFAULT_NODE_LABEL if label is None else str(label)
+
+
+def edge_label(data) -> str:
+    label = data.get(EDGE_LABEL_ATTR)
+    return DEFAULT_EDGE_LABEL if label is None else str(label)
+
+
+def graph_tables(G, exclude=None, exclude_edges=None) -> dict:
+    """
+    First pass: infer the tables of G.
+
+    Args:
+        G: graph to export.
+        exclude: node ids left out (nodes already written by an earlier
+            export, see exporters.manifest).
+        exclude_edges: (source, target, relationship) of the edges left out.
+
+    Returns:
+        dict of (element, label) -> TableSpec, nodes first.
+    """
+    if isinstance(G, CSRGraph) and not exclude and not exclude_edges:
+        return _csr_tables(G)
+    exclude = exclude or ()
+    exclude_edges = exclude_edges or ()
+    multigraph = G.is_multigraph()
+    stats: dict = {}
+    id_kinds = set()
+    labels = {}
+    for n, data in G.nodes(data=True):
+        id_kinds.add(value_kind(n))
+        label = labels[n] = node_label(data)
+        if n in exclude:
+            continue
+        info = _table_info(stats, "node", label)
+        info["rows"] += 1
+        columns = info["columns"]
+        for attr, value in data.items():
+            if attr != NODE_LABEL_ATTR:
+                if attr not in columns:
+                    columns[attr] = ColumnStats()
+                columns[attr].add(value)
+
+    edges = G.edges(keys=True, data=True) if multigraph else G.edges(data=True)
+    for edge in edges:
+        u, v, data = edge[0], edge[1], edge[-1]
+        label = edge_label(data)
+        if exclude_edges and (u, v, label) in exclude_edges:
+            continue
+        info = _table_info(stats, "edge", label)
+        info["rows"] += 1
+        info["endpoints"].add((labels[u], labels[v]))
+        columns = info["columns"]
+        for attr, value in data.items():
+            if attr != EDGE_LABEL_ATTR:
+                if attr not in columns:
+                    columns[attr] = ColumnStats()
+                columns[attr].add(value)
+
+    id_kind = "int" if id_kinds == {"int"} else "string"
+    return _finish(stats, id_kind, multigraph)
+
+
+_CSR_KINDS = {"int": "int", "float": "float", "bool": "bool", "pair": "pair"}
+
+
+def _add_csr_column(stats: ColumnStats, col, count: int):
+    if col.kind == "str":
+        stats.kinds.add("string")
+        stats.count += count
+        stats.add_strings(str(c) for c in col.categories)
+    else:
+        stats.kinds.add(_CSR_KINDS[col.kind])
+        stats.count += count
+
+
+def _csr_table_labels(G: CSRGraph) -> tuple:
+    """(label per node table, label code of every node index)."""
+    labels = [
+        DEFAULT_NODE_LABEL if t.label is None else str(t.label) for t in G.node_tables
+    ]
+    codes = np.repeat(np.arange(len(labels)), [len(t) for t in G.node_tables]).astype(
+        np.int32
+    )
+    return labels, codes
+
+
+def _csr_relationships(G: CSRGraph) -> tuple:
+    """(relationship names, relationship code of every edge position)."""
+    col = G.edge_columns.get(EDGE_LABEL_ATTR)
+    E = G.number_of_edges()
+    if col is None or col.kind != "str":
+        return [DEFAULT_EDGE_LABEL], np.zeros(E, dtype=np.int32)
+    names = [str(c) for c in col.categories] + [DEFAULT_EDGE_LABEL]
+    codes = np.full(E, len(names) - 1, dtype=np.int32)
+    if col.index is None:
+        codes[:] = col.data
+    else:
+        codes[col.index] = col.data
+    return names, codes
+
+
+def _csr_tables(G: CSRGraph) -> dict:
+    stats: dict = {}
+    for table in G.node_tables:
+        label = DEFAULT_NODE_LABEL if table.label is None else str(table.label)
+        info = _table_info(stats, "node", label)
+        info["rows"] += len(table)
+        columns = info["columns"]
+        if table.lazy is not None:
+            ids = G.node_ids.slice(table.start, table.stop)
+            for n in ids:
+                for attr, value in table.lazy(n).items():
+                    columns.setdefault(attr, ColumnStats()).add(value)
+        for attr, col in table.columns.items():
+            count = len(table) if col.index is None else len(col.index)
+            _add_csr_column(columns.setdefault(attr, ColumnStats()), col, count)
+
+    names, rel_codes = _csr_relationships(G)
+    counts = np.bincount(rel_codes, minlength=len(names))
+    labels, node_codes = _csr_table_labels(G)
+    pairs = np.unique(
+        node_codes[G.edge_sources()].astype(np.int64) * len(labels)
+        + node_codes[G.indices]
+        + rel_codes.astype(np.int64) * len(labels) ** 2
+    )
+    for r, name in enumerate(names):
+        if counts[r]:
+            info = _table_info(stats, "edge", name)
+            info["rows"] += int(counts[r])
+    for key in pairs.tolist():
+        r, rest = divmod(key, len(labels) ** 2)
+        s, t = divmod(rest, len(labels))
+        stats[("edge", names[r])]["endpoints"].add((labels[s], labels[t]))
+
+    for attr, col in G.edge_columns.items():
+        if attr == EDGE_LABEL_ATTR:
+            continue
+        if col.index is None:
+            present = counts
+        else:
+            present = np.bincount(rel_codes[col.index], minlength=len(names))
+        for r in np.flatnonzero(present).tolist():
+            columns = stats[("edge", names[r])]["columns"]
+            _add_csr_column(
+                columns.setdefault(attr, ColumnStats()), col, int(present[r])
+            )
+    return _finish(stats, "string", False)
+
+
+def python_array(values: list, kind: str, categories: Optional[list] = None):
+    """pyarrow array of a column kind from Python values (None is null)."""
+    values = [None if v is MISSING else v for v in values]
+    if kind == "string":
+        return pa.array(
+            [v if v is None or isinstance(v, str) else str(v) for v in values],
+            pa.string(),
+        )
+    if kind == "category":
+        index = {c: i for i, c in enumerate(categories)}
+        codes = pa.array([None if v is None else index[v] for v in values], pa.int32())
+        return pa.DictionaryArray.from_arrays(codes, pa.array(categories, pa.string()))
+    if kind == "date":
+        try:
+            return pa.array(values).cast(pa.date32())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            values = [
+                date.fromisoformat(v) if isinstance(v, str) else v for v in values
+            ]
+            return pa.array(values, pa.date32())
+    if kind == "pair":
+        values = [None if v is None else [float(v[0]), float(v[1])] for v in values]
+    return pa.array(values, arrow_type(kind))
+
+
+class _CSRArrays:
+    """Arrow conversions of CSRGraph columns, caching per-categories work."""
+
+    def __init__(self, G: CSRGraph):
+        self.G = G
+        self._dictionaries: dict = {}
+        self._remaps: dict = {}
+        offsets = G.node_ids.offsets
+        # 64-bit offsets over the id buffer without copying it; batches are
+        # cast down to string once they are sliced or taken
+        self._ids = pa.LargeStringArray.from_buffers(
+            len(offsets) - 1,
+            pa.py_buffer(np.ascontiguousarray(offsets, dtype=np.int64)),
+            pa.py_buffer(np.ascontiguousarray(G.node_ids.data, dtype=np.uint8)),
+        )
+
+    def node_ids(self, start: int, stop: int):
+        return self._ids.slice(start, stop - start).cast(pa.string())
+
+    def take_ids(self, idx: np.ndarray):
+        return self._ids.take(pa.array(idx)).cast(pa.string())
+
+    def _categories(self, categories, kind: str):
+        key = (id(categories), kind)
+        if key not in self._dictionaries:
+            values = pa.array([str(c) for c in categories], pa.string())
+            if kind == "date":
+                values = values.cast(pa.date32())
+            self._dictionaries[key] = (categories, values)
+        return self._dictionaries[key][1]
+
+    def _remap(self, categories, target: list) -> np.ndarray:
+        key = (id(categories), id(target))
+        if key not in self._remaps:
+            index = {c: i for i, c in enumerate(target)}
+            remap = np.asarray([index[str(c)] for c in categories], dtype=np.int32)
+            self._remaps[key] = (categories, target, remap)
+        return self._remaps[key][2]
+
+    def column(self, col, positions: np.ndarray, kind: str, categories):
+        """Arrow array of col at positions (dense positions or sparse lookups)."""
+        if kind == "string" and col.kind != "str":
+            # Mixed kinds across tables, written as strings
+            return python_array(col.values_at(positions), kind)
+        mask = None
+        if col.index is None:
+            rows = positions
+        else:
+            if len(col.index):
+                loc = np.searchsorted(col.index, positions)
+                loc = np.minimum(loc, len(col.index) - 1)
+                found = col.index[loc] == positions
+            else:
+                loc = np.zeros(len(positions), dtype=np.int64)
+                found = np.zeros(len(positions), dtype=bool)
+            rows = np.where(found, loc, 0)
+            mask = ~found
+            if not len(col.data):
+                return pa.nulls(len(positions), arrow_type(kind))
+        data = col.data[rows]
+
+        if col.kind == "str":
+            if kind == "category":
+                codes = self._remap(col.categories, categories)[data]
+                return pa.DictionaryArray.from_arrays(
+                    pa.array(codes, mask=mask),
+                    self._categories(categories, "string"),
+                )
+            values = self._categories(col.categories, kind)
+            return values.take(pa.array(data.astype(np.int64), mask=mask))
+        if col.kind == "pair":
+            flat = pa.array(np.ascontiguousarray(data, dtype=np.float64).ravel())
+            pair_mask = None if mask is None else pa.array(mask)
+            return pa.FixedSizeListArray.from_arrays(flat, 2, mask=pair_mask)
+        return pa.array(data, mask=mask).cast(arrow_type(kind))
+
+
+class _Rebatcher:
+    """Collects small batches per table and releases them as batch_size tables."""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.pending: dict = {}
+
+    def add(self, key, batch) -> list:
+        """Tables of exactly batch_size rows that are complete after adding batch."""
+        batches, rows = self.pending.get(key, ([], 0))
+        batches.append(batch)
+        rows += batch.num_rows
+        if rows < self.batch_size:
+            self.pending[key] = (batches, rows)
+            return []
+        table = pa.Table.from_batches(batches)
+        full = rows - rows % self.batch_size
+        rest = table.slice(full)
+        self.pending[key] = (rest.to_batches(), rest.num_rows)
+        return [
+            table.slice(start, self.batch_size)
+            for start in range(0, full, self.batch_size)
+        ]
+
+    def flush(self):
+        for key, (batches, rows) in self.pending.items():
+            if rows:
+                yield key, pa.Table.from_batches(batches)
+        self.pending = {}
+
+
+def _record_batch(spec: TableSpec, keys: dict, rows: list, endpoint_labels: bool):
+    """RecordBatch of spec from key column arrays and per-row attribute dicts."""
+    arrays = [keys[name] for name, _ in spec.key_fields(endpoint_labels)]
+    for attr, _, kind, categories in spec.columns:
+        arrays.append(python_array([d.get(attr) for d in rows], kind, categories))
+    return pa.RecordBatch.from_arrays(arrays, schema=spec.schema(endpoint_labels))
+
+
+def iter_tables(
+    G,
+    tables: Optional[dict] = None,
+    batch_size: int = BATCH_SIZE,
+    endpoint_labels: bool = False,
+    exclude=None,
+    exclude_edges=None,
+):
+    """
+    Second pass: yield (TableSpec, pyarrow.Table) chunks of every table.
+
+    Args:
+        G: graph to export.
+        tables: result of graph_tables(G, exclude, exclude_edges); computed
+            when omitted.
+        batch_size: rows per yielded table; the last one of a table may be shorter.
+        endpoint_labels: add source_label / target_label columns to edges.
+        exclude, exclude_edges: nodes and edges left out, as in graph_tables.
+    """
+    require_pyarrow()
+    if tables is None:
+        tables = graph_tables(G, exclude, exclude_edges)
+    rebatch = _Rebatcher(batch_size)
+    if isinstance(G, CSRGraph) and not exclude and not exclude_edges:
+        chunks = _iter_csr_batches(G, tables, batch_size, endpoint_labels)
+    else:
+        chunks = _iter_nx_batches(
+            G, tables, batch_size, endpoint_labels, exclude or (), exclude_edges or ()
+        )
+    for key, batch in chunks:
+        for table in rebatch.add(key, batch):
+            yield tables[key], table
+    for key, table in rebatch.flush():
+        yield tables[key], table
+
+
+def _iter_nx_batches(
+    G,
+    tables: dict,
+    batch_size: int,
+    endpoint_labels: bool,
+    exclude=(),
+    exclude_edges=(),
+):
+    def id_array(ids, spec):
+        return python_array(ids, spec.id_kind)
+
+    buffers: dict = {}
+    labels = {}
+
+    def node_batch(key, rows):
+        spec = tables[key]
+        ids = id_array([n for n, _ in rows], spec)
+        return key, _record_batch(spec, {ID_COLUMN: ids}, [d for _, d in rows], False)
+
+    for n, data in G.nodes(data=True):
+        label = labels[n] = node_label(data)
+        if n in exclude:
+            continue
+        key = ("node", label)
+        rows = buffers.setdefault(key, [])
+        rows.append((n, data))
+        if len(rows) >= batch_size:
+            yield node_batch(key, rows)
+            buffers[key] = []
+    for key, rows in buffers.items():
+        if rows:
+            yield node_batch(key, rows)
+
+    def edge_batch(key, rows):
+        spec = tables[key]
+        columns = {
+            SOURCE_COLUMN: id_array([r[0] for r in rows], spec),
+            TARGET_COLUMN: id_array([r[1] for r in rows], spec),
+        }
+        if spec.multigraph:
+            columns[KEY_COLUMN] = python_array([r[2] for r in rows], "string")
+        if endpoint_labels:
+            columns[SOURCE_LABEL_COLUMN] = pa.array([labels[r[0]] for r in rows])
+            columns[TARGET_LABEL_COLUMN] = pa.array([labels[r[1]] for r in rows])
+        return key, _record_batch(spec, columns, [r[3] for r in rows], endpoint_labels)
+
+    buffers = {}
+    if G.is_multigraph():
+        edges = G.edges(keys=True, data=True)
+    else:
+        edges = ((u, v, None, d) for u, v, d in G.edges(data=True))
+    for u, v, k, data in edges:
+        label = edge_label(data)
+        if exclude_edges and (u, v, label) in exclude_edges:
+            continue
+        key = ("edge", label)
+        rows = buffers.setdefault(key, [])
+        rows.append((u, v, k, data))
+        if len(rows) >= batch_size:
+            yield edge_batch(key, rows)
+            buffers[key] = []
+    for key, rows in buffers.items():
+        if rows:
+            yield edge_batch(key, rows)
+
+
+def _iter_csr_batches(G: CSRGraph, tables: dict, batch_size: int, endpoint_labels):
+    arrays = _CSRArrays(G)
+
+    for table in G.node_tables:
+        label = DEFAULT_NODE_LABEL if table.label is None else str(table.label)
+        key = ("node", label)
+        spec = tables[key]
+        for start in range(0, len(table), batch_size):
+            stop = min(start + batch_size, len(table))
+            positions = np.arange(start, stop)
+            cols = [arrays.node_ids(table.start + start, table.start + stop)]
+            lazy_rows = None
+            if table.lazy is not None:
+                ids = G.node_ids.slice(table.start + start, table.start + stop)
+                lazy_rows = [table.lazy(n) for n in ids]
+            for attr, _, kind, categories in spec.columns:
+                if attr in table.columns:
+                    col = table.columns[attr]
+                    cols.append(arrays.column(col, positions, kind, categories))
+                elif lazy_rows is not None:
+                    values = [d.get(attr) for d in lazy_rows]
+                    cols.append(python_array(values, kind, categories))
+                else:
+                    cols.append(pa.nulls(len(positions), arrow_type(kind)))
+            yield key, pa.RecordBatch.from_arrays(cols, schema=spec.schema())
+
+    names, rel_codes = _csr_relationships(G)
+    labels, node_codes = _csr_table_labels(G)
+    label_array = pa.array(labels, pa.string())
+    sources = G.edge_sources()
+    E = G.number_of_edges()
+    for start in range(0, E, batch_size):
+        stop = min(start + batch_size, E)
+        codes = rel_codes[start:stop]
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+        for r, name in enumerate(names):
+            if bounds[r] == bounds[r + 1]:
+                continue
+            positions = start + order[bounds[r] : bounds[r + 1]]
+            key = ("edge", name)
+            spec = tables[key]
+            src, dst = sources[positions], G.indices[positions]
+            cols = [arrays.take_ids(src), arrays.take_ids(dst)]
+            if endpoint_labels:
+                cols.append(label_array.take(pa.array(node_codes[src])))
+                cols.append(label_array.take(pa.array(node_codes[dst])))
+            for attr, _, kind, categories in spec.columns:
+                col = G.edge_columns[attr]
+                cols.append(arrays.column(col, positions, kind, categories))
+            yield (
+                key,
+                pa.RecordBatch.from_arrays(cols, schema=spec.schema(endpoint_labels)),
+            )
+
+
+class WriterPool:
+    """
+    Runs write jobs on background threads, in submission order per key.
+
+    Every key (an output file) is pinned to one single-threaded executor, so
+    the chunks of a file are written in order while different files are
+    written concurrently. At most max_pending jobs are queued, which bounds
+    the batches held in memory.
+
+    Usage:
+        with WriterPool(workers=4) as pool:
+            for spec, table in iter_tables(G):
+                pool.submit(spec.label, write_chunk, spec, table)
+    """
+
+    def __init__(
+        self, workers: int = DEFAULT_WRITERS, max_pending: Optional[int] = None
+    ):
+        self._executors = [
+            ThreadPoolExecutor(1, thread_name_prefix="graphfaker-writer")
+            for _ in range(max(1, workers))
+        ]
+        self._slots: dict = {}
+        self._pending: deque = deque()
+        self.max_pending = max_pending or 2 * len(self._executors)
+
+    def submit(self, key, func, *args):
+        slot = self._slots.setdefault(key, len(self._slots) % len(self._executors))
+        self._pending.append(self._executors[slot].submit(func, *args))
+        while len(self._pending) > self.max_pending:
+            self._pending.popleft().result()
+
+    def close(self):
+        """Wait for every job, re-raising the first failure."""
+        try:
+            while self._pending:
+                self._pending.popleft().result()
+        finally:
+            for executor in self._executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
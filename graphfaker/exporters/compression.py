@@ -0,0 +1,178 @@
+# graphfaker/exporters/compression.py
+"""
+Block-parallel gzip / zstd compression for export streams.
+
+BlockCompressor is a binary file object that cuts what is written to it into
+blocks of COMPRESS_BLOCK bytes and compresses every block on a thread pool as
+an independent gzip member or zstd frame. Concatenated members (frames) form
+a valid .gz (.zst) file that gzip, zcat, pandas or neo4j-admin read as one
+stream, while zlib and zstd release the GIL, so serialization continues in the
+calling thread as blocks are compressed in the background. Blocks are written
+to the underlying file in order.
+
+zstd needs the optional zstandard package.
+
+Usage:
+    from graphfaker.exporters.compression import open_output
+    with open_output("graph.graphml.gz", compression="gzip", level=6) as f:
+        f.write(b"...")
+"""
+
+import gzip
+import io
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from graphfaker.exporters.common import DEFAULT_WRITERS
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, see block_compressor
+    zstandard = None
+
+# Codec -> file suffix and default level
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+
+# Uncompressed bytes per gzip member / zstd frame
+COMPRESS_BLOCK = 1 << 20
+
+
+def check_compression(codec: Optional[str]):
+    if codec is not None and codec not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            f"Unknown compression '{codec}'. Use one of {sorted(COMPRESSION_SUFFIXES)}."
+        )
+    if codec == "zstd" and zstandard is None:
+        raise ImportError(
+            "zstandard is required for zstd compression: pip install zstandard"
+        )
+
+
+def compressed_path(path: str, codec: Optional[str]) -> str:
+    """path with the codec suffix appended unless it already ends with it."""
+    if codec is None:
+        return path
+    suffix = COMPRESSION_SUFFIXES[codec]
+    return path if str(path).endswith(suffix) else f"{path}{suffix}"
+
+
+def block_compressor(codec: str, level: int):
+    """Thread-safe callable compressing one block into a gzip member / zstd frame."""
+    if codec == "gzip":
+        return lambda block: gzip.compress(block, compresslevel=level, mtime=0)
+    local = threading.local()
+
+    def compress(block: bytes) -> bytes:
+        # ZstdCompressor instances must not be shared between threads
+        cctx = getattr(local, "cctx", None)
+        if cctx is None:
+            cctx = local.cctx = zstandard.ZstdCompressor(level=level)
+        return cctx.compress(block)
+
+    return compress
+
+
+class BlockCompressor(io.BufferedIOBase):
+    """
+    Writable binary stream compressing blocks on background threads.
+
+    Args:
+        raw: binary file the compressed blocks are written to.
+        codec: "gzip" or "zstd".
+        level: compression level, DEFAULT_LEVELS when omitted.
+        workers: compression threads, unless executor is given.
+        executor: shared ThreadPoolExecutor to compress on (not shut down).
+        block_size: uncompressed bytes per block.
+        close_raw: close raw when the stream is closed.
+    """
+
+    def __init__(
+        self,
+        raw,
+        codec: str = "gzip",
+        level: Optional[int] = None,
+        workers: int = DEFAULT_WRITERS,
+        executor: Optional[ThreadPoolExecutor] = None,
+        block_size: int = COMPRESS_BLOCK,
+        close_raw: bool = True,
+    ):
+        super().__init__()
+        check_compression(codec)
+        self.raw = raw
+        self.block_size = block_size
+        self.close_raw = close_raw
+        level = DEFAULT_LEVELS[codec] if level is None else level
+        self._compress = block_compressor(codec, level)
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max(1, workers), thread_name_prefix="graphfaker-compress"
+        )
+        self._max_pending = 2 * max(1, workers)
+        self._pending: deque = deque()
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        self._buffer += data
+        if len(self._buffer) >= self.block_size:
+            view = memoryview(self._buffer)
+            end = len(view) - len(view) % self.block_size
+            for start in range(0, end, self.block_size):
+                self._submit(bytes(view[start : start + self.block_size]))
+            view.release()
+            del self._buffer[:end]
+        return len(data)
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._executor.submit(self._compress, block))
+        while len(self._pending) > self._max_pending:
+            self.raw.write(self._pending.popleft().result())
+
+    def _drain(self):
+        while self._pending:
+            self.raw.write(self._pending.popleft().result())
+
+    def flush(self):
+        """Compress buffered data and write every pending block."""
+        if self.closed:
+            return
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        self._drain()
+        self.raw.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._own_executor:
+                self._executor.shutdown(wait=True)
+            super().close()
+            if self.close_raw:
+                self.raw.close()
+
+
+def open_output(
+    path,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    workers: int = DEFAULT_WRITERS,
+    executor: Optional[ThreadPoolExecutor] = None,
+):
+    """Binary output file at path, block compressed when compression is set."""
+    check_compression(compression)
+    raw = open(os.fspath(path), "wb")  # noqa: SIM115 - returned to the caller
+    if compression is None:
+        return raw
+    return BlockCompressor(raw, compression, level, workers=workers, executor=executor)
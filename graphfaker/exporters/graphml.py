@@ -0,0 +1,190 @@
+# graphfaker/exporters/graphml.py
+"""
+Streaming GraphML writer.
+
+Writes <key> declarations, nodes and edges straight to a file instead of
+building the XML document in memory, so it works for any graph exposing the
+NetworkX read API (nx.Graph/DiGraph/MultiDiGraph or CSRGraph) without
+converting it first. The graph is read twice, once to infer the attribute
+types and once to write, and is never modified: values GraphML has no type for
+(tuples, lists, geometries, ...) are converted to strings as they are written.
+
+With compression="gzip" or "zstd" the XML is compressed in blocks on a thread
+pool while it is being written (see exporters.compression).
+
+Usage:
+    from graphfaker.exporters.graphml import write_graphml
+    write_graphml(G, "graph.graphml")
+    write_graphml(G, "graph.graphml.gz", compression="gzip")
+    with open("graph.graphml", "w", encoding="utf-8") as f:
+        write_graphml(G, f)
+"""
+
+import io
+from contextlib import contextmanager
+from typing import Optional
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+from graphfaker.exporters.compression import BlockCompressor, open_output
+
+GRAPHML_HEADER = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+    'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n'
+)
+
+# Same attr.type names NetworkX uses for Python scalars; bool before int since
+# bool is a subclass of int
+XML_TYPES = {
+    (bool, np.bool_): "boolean",
+    (int, np.integer): "long",
+    (float, np.floating): "double",
+    (str,): "string",
+}
+
+# Elements are collected and written in chunks of this many
+WRITE_CHUNK = 10_000
+
+
+def _xml_type(value, stringify: bool = False) -> str:
+    if stringify:
+        return "string"
+    for py_types, name in XML_TYPES.items():
+        if isinstance(value, py_types):
+            return name
+    # tuples (e.g. coordinates) and other objects are written as strings
+    return "string"
+
+
+def _xml_value(value, stringify: bool = False) -> str:
+    if isinstance(value, tuple) and not stringify:
+        return ",".join(str(v) for v in value)
+    return str(value)
+
+
+def _collect_keys(rows, stringify: bool = False) -> dict:
+    """Attribute name -> GraphML type over an iterable of attribute dicts."""
+    keys: dict = {}
+    for data in rows:
+        for name, value in data.items():
+            if value is None:
+                continue
+            xml_type = _xml_type(value, stringify)
+            seen = keys.setdefault(name, xml_type)
+            if seen != xml_type:
+                numeric = {seen, xml_type} == {"long", "double"}
+                keys[name] = "double" if numeric else "string"
+    return keys
+
+
+@contextmanager
+def _text_output(dest, compression: Optional[str] = None, level: Optional[int] = None):
+    """Text stream for a path or an open text/binary file handle."""
+    if not hasattr(dest, "write"):
+        with open_output(dest, compression, level) as raw, _text_output(raw) as f:
+            yield f
+    elif isinstance(dest, io.TextIOBase):
+        if compression is not None:
+            raise ValueError("Compressed GraphML needs a path or a binary file.")
+        yield dest
+    elif compression is not None:
+        compressor = BlockCompressor(dest, compression, level, close_raw=False)
+        with compressor as raw, _text_output(raw) as f:
+            yield f
+    else:
+        # Binary handle: encode through a wrapper, but leave the handle open
+        wrapper = io.TextIOWrapper(dest, encoding="utf-8")
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            wrapper.detach()
+
+
+def _data_elements(data: dict, key_ids: dict, domain: str, indent: str, stringify):
+    return "".join(
+        f'{indent}<data key="{key_ids[(domain, name)]}">'
+        f"{escape(_xml_value(value, stringify))}</data>\n"
+        for name, value in data.items()
+        if value is not None
+    )
+
+
+def write_graphml(
+    G,
+    dest,
+    stringify: bool = False,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+):
+    """
+    Write G to GraphML.
+
+    Args:
+        G: graph exposing nodes(data=True), edges(data=True), is_directed()
+            and optionally is_multigraph() and a graph attribute dict.
+        dest: destination file path, or an open text or binary file handle.
+        stringify: write every attribute as a string, as osmnx.save_graphml
+            does, so OSM graphs load back with osmnx.load_graphml.
+        compression: "gzip" or "zstd" to compress the output (dest is used
+            as given, without adding a suffix).
+        level: compression level.
+    """
+    multigraph = getattr(G, "is_multigraph", lambda: False)()
+    graph_data = getattr(G, "graph", {})
+
+    def edges():
+        if multigraph:
+            return G.edges(keys=True, data=True)
+        return ((u, v, None, data) for u, v, data in G.edges(data=True))
+
+    keys_by_domain = (
+        ("graph", _collect_keys([graph_data], stringify)),
+        ("node", _collect_keys((d for _, d in G.nodes(data=True)), stringify)),
+        ("edge", _collect_keys((d for _, _, _, d in edges()), stringify)),
+    )
+    key_ids = {}
+
+    with _text_output(dest, compression, level) as f:
+        f.write(GRAPHML_HEADER)
+        for domain, keys in keys_by_domain:
+            for name, xml_type in keys.items():
+                key_id = f"d{len(key_ids)}"
+                key_ids[(domain, name)] = key_id
+                f.write(
+                    f'  <key id="{key_id}" for="{domain}" '
+                    f"attr.name={quoteattr(str(name))} attr.type=\"{xml_type}\" />\n"
+                )
+        edgedefault = "directed" if G.is_directed() else "undirected"
+        f.write(f'  <graph edgedefault="{edgedefault}">\n')
+        f.write(_data_elements(graph_data, key_ids, "graph", "    ", stringify))
+
+        chunk = []
+        for n, data in G.nodes(data=True):
+            chunk.append(
+                f"    <node id={quoteattr(str(n))}>\n"
+                f"{_data_elements(data, key_ids, 'node', '      ', stringify)}"
+                "    </node>\n"
+            )
+            if len(chunk) >= WRITE_CHUNK:
+                f.write("".join(chunk))
+                chunk = []
+
+        for u, v, key, data in edges():
+            edge_id = "" if key is None else f" id={quoteattr(str(key))}"
+            chunk.append(
+                f"    <edge source={quoteattr(str(u))} target={quoteattr(str(v))}"
+                f"{edge_id}>\n"
+                f"{_data_elements(data, key_ids, 'edge', '      ', stringify)}"
+                "    </edge>\n"
+            )
+            if len(chunk) >= WRITE_CHUNK:
+                f.write("".join(chunk))
+                chunk = []
+        f.write("".join(chunk))
+
+        f.write("  </graph>\n</graphml>\n")
@@ -0,0 +1,304 @@
+# graphfaker/exporters/kuzu.py
+"""
+Kuzu export: node/rel table DDL plus COPY-ready Parquet or CSV files.
+
+Node tables are derived from the "type" node attribute and rel tables from
+the "relationship" edge attribute. The export directory holds
+
+    schema.cypher                 CREATE NODE TABLE / CREATE REL TABLE statements
+    copy.cypher                   COPY ... FROM statements, in load order
+    nodes/<type>.parquet          primary key id, then the properties
+    rels/<rel>.parquet            from id, to id, then the properties
+
+A relationship connecting several pairs of node types becomes one rel table
+with a FROM ... TO ... clause per pair and one file per pair
+(rels/<rel>_<from>_<to>.parquet), copied with the from/to options. Files are
+written concurrently (see exporters.common.WriterPool) in the column order of
+the DDL, so COPY ingests them without any mapping. Requires pyarrow; loading
+with load_kuzu requires the kuzu package.
+
+Usage:
+    from graphfaker.exporters.kuzu import write_kuzu, load_kuzu
+    statements = write_kuzu(G, "kuzu_export/")
+    conn = load_kuzu("kuzu_export/", "graph.kuzu")
+"""
+
+import os
+import re
+from typing import Optional
+
+from graphfaker.exporters.columnar import DEFAULT_PARQUET_COMPRESSION, table_filename
+from graphfaker.exporters.common import (
+    BATCH_SIZE,
+    DEFAULT_WRITERS,
+    SOURCE_LABEL_COLUMN,
+    TARGET_LABEL_COLUMN,
+    WriterPool,
+    graph_tables,
+    iter_tables,
+    require_pyarrow,
+)
+
+try:
+    import kuzu
+except ImportError:  # optional dependency, see load_kuzu
+    kuzu = None
+
+# Column kind -> Kuzu data type
+KUZU_TYPES = {
+    "int": "INT64",
+    "float": "DOUBLE",
+    "bool": "BOOLEAN",
+    "string": "STRING",
+    "category": "STRING",
+    "date": "DATE",
+    "timestamp": "TIMESTAMP",
+    "pair": "DOUBLE[]",
+}
+
+KUZU_FORMATS = {"parquet": ".parquet", "csv": ".csv"}
+KUZU_FOLDERS = {"node": "nodes", "edge": "rels"}
+SCHEMA_FILE = "schema.cypher"
+COPY_FILE = "copy.cypher"
+
+
+def kuzu_name(label: str) -> str:
+    """Table name of a node type or relationship."""
+    name = re.sub(r"\W", "_", label)
+    return name if name[:1].isalpha() else f"T_{name}"
+
+
+def _quote(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _string(value: str) -> str:
+    """Cypher string literal, e.g. a path holding quotes or backslashes."""
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _properties(spec) -> list:
+    fields = [
+        f"{_quote(name)} {KUZU_TYPES[kind]}"
+        for name, kind in spec.key_fields()
+        if name == "key"
+    ]
+    fields += [
+        f"{_quote(name)} {KUZU_TYPES[kind]}" for _, name, kind, _ in spec.columns
+    ]
+    return fields
+
+
+def kuzu_schema(tables: dict) -> list:
+    """
+    CREATE statements for the TableSpecs of graph_tables, node tables first.
+
+    Raises:
+        ValueError: two tables map to the same name, e.g. node types "A-B" and
+            "A B", or a node type and a relationship both called "A".
+    """
+    names: dict = {}
+    for spec in tables.values():
+        name = kuzu_name(spec.label)
+        other = names.setdefault(name, spec)
+        if other is not spec:
+            raise ValueError(
+                f"The {other.element} {other.label!r} and {spec.element} "
+                f"{spec.label!r} both map to the Kuzu table {name!r}; rename one."
+            )
+    statements = []
+    for spec in tables.values():
+        if spec.element == "node":
+            fields = [f"id {KUZU_TYPES[spec.id_kind]}", *_properties(spec)]
+            statements.append(
+                f"CREATE NODE TABLE {_quote(kuzu_name(spec.label))}"
+                f"({', '.join(fields + ['PRIMARY KEY (id)'])});"
+            )
+    for spec in tables.values():
+        if spec.element == "edge":
+            pairs = [
+                f"FROM {_quote(kuzu_name(s))} TO {_quote(kuzu_name(t))}"
+                for s, t in sorted(spec.endpoints)
+            ]
+            statements.append(
+                f"CREATE REL TABLE {_quote(kuzu_name(spec.label))}"
+                f"({', '.join(pairs + _properties(spec))});"
+            )
+    return statements
+
+
+def _kuzu_table(table, format: str):
+    """table with Kuzu-readable column types, without endpoint label columns."""
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    labels = (SOURCE_LABEL_COLUMN, TARGET_LABEL_COLUMN)
+    table = table.select([n for n in table.column_names if n not in labels])
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if pa.types.is_dictionary(field.type):
+            column = column.cast(pa.string())
+        elif pa.types.is_fixed_size_list(field.type):
+            column = column.cast(pa.list_(pa.float64()))
+            if format == "csv":
+                strings = pc.binary_join(column.cast(pa.list_(pa.string())), ",")
+                column = pc.binary_join_element_wise("[", strings, "]", "")
+        else:
+            continue
+        table = table.set_column(i, field.name, column)
+    return table
+
+
+class _TableFile:
+    """One COPY source file, written by a single WriterPool thread."""
+
+    def __init__(self, path: str, format: str, compression=None, level=None):
+        self.path = path
+        self.format = format
+        self.compression = compression
+        self.level = level
+        self.writer = None
+
+    def write(self, table):
+        table = _kuzu_table(table, self.format)
+        if self.writer is None:
+            if self.format == "parquet":
+                import pyarrow.parquet as pq
+
+                self.writer = pq.ParquetWriter(
+                    self.path,
+                    table.schema,
+                    compression=self.compression or DEFAULT_PARQUET_COMPRESSION,
+                    compression_level=self.level,
+                )
+            else:
+                import pyarrow.csv as pacsv
+
+                self.writer = pacsv.CSVWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def _split_pairs(spec, table) -> list:
+    """(endpoint pair, rows) of an edge chunk, one entry per FROM/TO pair."""
+    if len(spec.endpoints) == 1:
+        return [(next(iter(spec.endpoints)), table)]
+    import pyarrow.compute as pc
+
+    parts = []
+    for s, t in sorted(spec.endpoints):
+        mask = pc.and_(
+            pc.equal(table[SOURCE_LABEL_COLUMN], s),
+            pc.equal(table[TARGET_LABEL_COLUMN], t),
+        )
+        rows = table.filter(mask)
+        if rows.num_rows:
+            parts.append(((s, t), rows))
+    return parts
+
+
+def write_kuzu(
+    G,
+    directory,
+    format: str = "parquet",
+    workers: int = DEFAULT_WRITERS,
+    batch_size: int = BATCH_SIZE,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+) -> list:
+    """
+    Write the Kuzu schema, COPY statements and table files of G.
+
+    Args:
+        G: networkx graph or CSRGraph.
+        directory: output directory, created if needed.
+        format: "parquet" or "csv" table files.
+        workers: writer threads.
+        batch_size: rows per record batch.
+        compression: Parquet codec ("snappy" by default, "gzip", "zstd", ...);
+            COPY does not read compressed CSV files.
+        level: compression level.
+
+    Returns:
+        The CREATE and COPY statements, in the order they must run.
+    """
+    require_pyarrow()
+    if format not in KUZU_FORMATS:
+        raise ValueError(
+            f"Unknown Kuzu file format '{format}'. Use one of {sorted(KUZU_FORMATS)}."
+        )
+    if format == "csv" and compression is not None:
+        raise ValueError("Kuzu COPY reads uncompressed CSV, use format='parquet'.")
+    directory = os.path.abspath(os.fspath(directory))
+    extension = KUZU_FORMATS[format]
+    tables = graph_tables(G)
+    schema = kuzu_schema(tables)
+
+    files = {}
+    copies = []
+    for spec in tables.values():
+        folder = os.path.join(directory, KUZU_FOLDERS[spec.element])
+        os.makedirs(folder, exist_ok=True)
+        table = _quote(kuzu_name(spec.label))
+        if spec.element == "node":
+            keys = [(spec.label,)]
+        else:
+            keys = [(spec.label, s, t) for s, t in sorted(spec.endpoints)]
+        for key in keys:
+            name = "_".join(key) if len(keys) > 1 else spec.label
+            path = os.path.join(folder, table_filename(name, extension))
+            files[(spec.element, *key)] = _TableFile(path, format, compression, level)
+            options = ["header=true"] if format == "csv" else []
+            if len(keys) > 1:
+                options += [f"from='{kuzu_name(key[1])}'", f"to='{kuzu_name(key[2])}'"]
+            suffix = f" ({', '.join(options)})" if options else ""
+            copies.append(f"COPY {table} FROM {_string(path)}{suffix};")
+
+    try:
+        with WriterPool(workers) as pool:
+            chunks = iter_tables(G, tables, batch_size, endpoint_labels=True)
+            for spec, chunk in chunks:
+                if spec.element == "node":
+                    key = ("node", spec.label)
+                    pool.submit(key, files[key].write, chunk)
+                    continue
+                for (s, t), rows in _split_pairs(spec, chunk):
+                    key = ("edge", spec.label, s, t)
+                    pool.submit(key, files[key].write, rows)
+    finally:
+        for f in files.values():
+            f.close()
+
+    for name, statements in ((SCHEMA_FILE, schema), (COPY_FILE, copies)):
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write("\n".join(statements) + "\n")
+    return schema + copies
+
+
+def load_kuzu(directory, database, statements: Optional[list] = None):
+    """
+    Load a write_kuzu export into an embedded Kuzu database.
+
+    Args:
+        directory: export directory written by write_kuzu.
+        database: path of the Kuzu database, created if needed.
+        statements: statements returned by write_kuzu; read from the
+            directory's schema.cypher and copy.cypher when omitted.
+
+    Returns:
+        kuzu.Connection to the loaded database.
+    """
+    if kuzu is None:
+        raise ImportError("kuzu is required to load exports: pip install kuzu")
+    if statements is None:
+        statements = []
+        for name in (SCHEMA_FILE, COPY_FILE):
+            with open(os.path.join(os.fspath(directory), name), encoding="utf-8") as f:
+                statements += [line for line in f.read().splitlines() if line]
+    conn = kuzu.Connection(kuzu.Database(os.fspath(database)))
+    for statement in statements:
+        conn.execute(statement)
+    return conn
@@ -0,0 +1,307 @@
+# graphfaker/exporters/manifest.py
+"""
+Append-only exports: parts and the manifest listing them.
+
+The directory exporters (Parquet, Arrow and Neo4j CSV) record what they wrote
+in <directory>/manifest.json. A regular export is part 0, in the usual layout;
+an export with append=True adds the next part in its own folder, holding only
+what earlier parts lack:
+
+    <directory>/manifest.json
+    <directory>/nodes/Person.parquet                 part 0
+    <directory>/part-00001/nodes/Person.parquet      part 1
+    <directory>/part-00001/edges/WORKS_AT.parquet
+
+Nodes whose id is already in a part are left out, and so are edges whose
+(source, target, relationship) is, so exporting a graph extended with a new
+month of flights, or a few more Faker nodes and edges, writes only the new
+ones, including new edges between nodes exported before. Every part lists its
+files with their row counts:
+
+    {"version": 1, "format": "parquet", "parts": [
+        {"part": 0, "path": ".", "created": "2026-10-17T08:00:00+00:00",
+         "nodes": 120, "edges": 410,
+         "files": [{"element": "node", "label": "Person",
+                    "path": "nodes/Person.parquet", "rows": 100}, ...]},
+        ...]}
+
+Consumers keep the last part they loaded and pick up the rest with
+part_files(directory, since=last + 1). Parquet and Arrow parts are written in
+the schema of the first file of their table (see stored_schemas), so all the
+parts of a table read as one dataset; an append whose rows cannot be cast to
+it, or that adds columns, raises ValueError. Neo4j CSV parts carry their
+types in their own headers. A regular export over a directory with a manifest
+drops the appended parts and starts again from part 0.
+
+Usage:
+    from graphfaker.exporters.columnar import write_columnar
+    from graphfaker.exporters.manifest import part_files
+    write_columnar(G, "out/")
+    write_columnar(G_next_month, "out/", append=True)
+    files = part_files("out/", since=1)    # (element, label) -> [paths]
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from datetime import UTC, datetime
+from typing import Optional
+
+import numpy as np
+
+from graphfaker.csr import CSRGraph
+from graphfaker.exporters.common import (
+    ID_COLUMN,
+    SOURCE_COLUMN,
+    TARGET_COLUMN,
+    edge_label,
+    require_pyarrow,
+)
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def part_directory(part: int) -> str:
+    """Folder of an appended part, relative to the export directory."""
+    return "." if part == 0 else f"part-{part:05d}"
+
+
+def read_manifest(directory) -> Optional[dict]:
+    """The manifest of an export directory, None when there is none."""
+    path = os.path.join(os.fspath(directory), MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(
+            f"Unsupported manifest version {manifest.get('version')} in {path}."
+        )
+    return manifest
+
+
+def _write_manifest(directory: str, manifest: dict):
+    os.makedirs(directory, exist_ok=True)
+    # Written aside and renamed, so readers never see half a manifest
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, os.path.join(directory, MANIFEST_FILENAME))
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def begin_part(directory, format: str, append: bool) -> tuple:
+    """
+    Start a part of an export.
+
+    Returns:
+        (manifest, part number, part folder path). Without append, parts
+        appended to an earlier export are removed and the manifest restarts.
+    """
+    directory = os.fspath(directory)
+    manifest = read_manifest(directory)
+    if append and manifest is not None and manifest["format"] != format:
+        raise ValueError(
+            f"Cannot append {format} files to a {manifest['format']} export."
+        )
+    if not append or manifest is None:
+        for entry in (manifest or {}).get("parts", ())[1:]:
+            shutil.rmtree(os.path.join(directory, entry["path"]), ignore_errors=True)
+        manifest = {"version": MANIFEST_VERSION, "format": format, "parts": []}
+    part = len(manifest["parts"])
+    return manifest, part, os.path.join(directory, part_directory(part))
+
+
+def _read_ids(path: str, format: str, columns=(ID_COLUMN,)) -> list:
+    """Id columns (node ids, or edge endpoints) of a file, as strings."""
+    pa = require_pyarrow()
+    columns = list(columns)
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, columns=columns)
+    elif format == "arrow":
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all().select(columns)
+    else:
+        import pyarrow.csv as pacsv
+
+        from graphfaker.exporters.neo4j import KEY_HEADERS
+
+        # Neo4j headers; ids are read as text whatever they look like
+        names = [KEY_HEADERS[c] for c in columns]
+        table = pacsv.read_csv(
+            path,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=names,
+                column_types={name: pa.string() for name in names},
+            ),
+        )
+    return [table.column(i).cast(pa.string()) for i in range(len(columns))]
+
+
+def _stored_files(directory, manifest: dict, element: str):
+    """(label, path) of the files of an element in every part of the manifest."""
+    for entry in manifest["parts"]:
+        for f in entry["files"]:
+            if f["element"] == element:
+                path = os.path.join(os.fspath(directory), entry["path"], f["path"])
+                yield f["label"], path
+
+
+def stored_schemas(directory, manifest: dict) -> dict:
+    """
+    (element, label) -> pyarrow schema of every table of a Parquet / Arrow
+    export, read from the first part holding the table.
+    """
+    pa = require_pyarrow()
+    schemas = {}
+    for element in ("node", "edge"):
+        for label, path in _stored_files(directory, manifest, element):
+            if (element, label) in schemas:
+                continue
+            if manifest["format"] == "parquet":
+                import pyarrow.parquet as pq
+
+                schema = pq.read_schema(path)
+            else:
+                with pa.memory_map(path) as source:
+                    schema = pa.ipc.open_file(source).schema
+            schemas[(element, label)] = schema
+    return schemas
+
+
+def check_columns(spec, schema):
+    """Raise ValueError when the TableSpec has columns the stored schema lacks."""
+    added = [name for name in spec.schema().names if name not in schema.names]
+    if added:
+        raise ValueError(
+            f"Cannot append {spec.element} table {spec.label!r}: columns "
+            f"{added} are not in the exported schema {schema.names}."
+        )
+
+
+def conform_table(table, schema):
+    """
+    table in a stored schema: its columns in order, cast to the stored
+    types, with nulls for the columns the table lacks.
+    """
+    pa = require_pyarrow()
+    columns = []
+    for field in schema:
+        if field.name not in table.column_names:
+            columns.append(pa.nulls(table.num_rows, field.type))
+            continue
+        column = table.column(field.name)
+        try:
+            columns.append(column.cast(field.type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f"Cannot append column {field.name!r} of type {column.type} "
+                f"to the exported {field.type} column: {e}"
+            ) from e
+    return pa.table(columns, schema=schema)
+
+
+def exported_nodes(G, directory, manifest: dict) -> set:
+    """Ids of the nodes of G already written by a part of the manifest."""
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    ids = G.node_ids.tolist() if isinstance(G, CSRGraph) else list(G)
+    if not ids or not manifest["parts"]:
+        return set()
+    # Ids are matched by their text, as ids of any kind are stored in CSVs
+    candidates = pa.array([str(n) for n in ids], pa.string())
+    found = np.zeros(len(ids), dtype=bool)
+    for _, path in _stored_files(directory, manifest, "node"):
+        (stored,) = _read_ids(path, manifest["format"])
+        found |= pc.is_in(candidates, value_set=stored).to_numpy(zero_copy_only=False)
+    return {ids[i] for i in np.flatnonzero(found)}
+
+
+def exported_edges(G, directory, manifest: dict) -> set:
+    """(source, target, relationship) of the edges of G already written by a part."""
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    stored: dict = {}
+    for label, path in _stored_files(directory, manifest, "edge"):
+        sources, targets = _read_ids(
+            path, manifest["format"], (SOURCE_COLUMN, TARGET_COLUMN)
+        )
+        pairs = pc.binary_join_element_wise(sources, targets, "\x00")
+        stored.setdefault(label, []).extend(pairs.chunks)
+    if not stored:
+        return set()
+
+    # Edges are matched per relationship by the text of their endpoints
+    candidates: dict = {}
+    for u, v, data in G.edges(data=True):
+        label = edge_label(data)
+        if label in stored:
+            candidates.setdefault(label, []).append((u, v))
+    found = set()
+    for label, edges in candidates.items():
+        keys = pa.array([f"{u}\x00{v}" for u, v in edges], pa.string())
+        value_set = pa.concat_arrays([c.cast(pa.string()) for c in stored[label]])
+        hits = pc.is_in(keys, value_set=value_set).to_numpy(zero_copy_only=False)
+        found.update((*edges[i], label) for i in np.flatnonzero(hits))
+    return found
+
+
+def record_part(directory, manifest: dict, part: int, paths: dict, tables: dict):
+    """Add the files of a finished part to the manifest and save it."""
+    if not paths and part > 0:
+        # Nothing new, no part
+        return
+    directory = os.fspath(directory)
+    root = os.path.join(directory, part_directory(part))
+    files = [
+        {
+            "element": element,
+            "label": label,
+            "path": os.path.relpath(path, root).replace(os.sep, "/"),
+            "rows": tables[(element, label)].rows,
+        }
+        for (element, label), path in paths.items()
+    ]
+    manifest["parts"].append(
+        {
+            "part": part,
+            "path": part_directory(part),
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "nodes": sum(f["rows"] for f in files if f["element"] == "node"),
+            "edges": sum(f["rows"] for f in files if f["element"] == "edge"),
+            "files": files,
+        }
+    )
+    _write_manifest(directory, manifest)
+
+
+def part_files(directory, since: int = 0) -> dict:
+    """
+    Files of the parts numbered since and later.
+
+    Returns:
+        dict of (element, label) -> list of file paths, in part order.
+    """
+    manifest = read_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(
+            f"No {MANIFEST_FILENAME} in {os.fspath(directory)}, "
+            "export it with graphfaker first."
+        )
+    files: dict = {}
+    for entry in manifest["parts"][since:]:
+        root = os.path.join(os.fspath(directory), entry["path"])
+        for f in entry["files"]:
+            path = os.path.normpath(os.path.join(root, f["path"]))
+            files.setdefault((f["element"], f["label"]), []).append(path)
+    return files
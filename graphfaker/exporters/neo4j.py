@@ -0,0 +1,241 @@
+# graphfaker/exporters/neo4j.py
+"""
+CSV export in the neo4j-admin bulk import format.
+
+One headered CSV per node type and per relationship:
+
+    <directory>/nodes/Person.csv           id:ID,name:string,age:long,...,:LABEL
+    <directory>/relationships/WORKS_AT.csv :START_ID,:END_ID,position:string,:TYPE
+
+Node ids share one global id space, so relationships may connect any labels.
+Property columns carry their Neo4j type (long, double, boolean, date,
+localdatetime, string and double[] for coordinates, with ";" as the array
+delimiter). Files are written concurrently by a pool of writer threads while
+the graph is read in record batches (see exporters.common). With
+compression="gzip" the files are written as .csv.gz, compressed in blocks on
+a shared thread pool (see exporters.compression). Requires pyarrow.
+
+The files load with `neo4j-admin database import full`, see
+neo4j_import_command for the arguments.
+
+Usage:
+    from graphfaker.exporters.neo4j import write_neo4j_csv, neo4j_import_command
+    paths = write_neo4j_csv(G, "import/")
+    print(" ".join(neo4j_import_command(paths)))
+"""
+
+import csv
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from graphfaker.exporters.columnar import table_filename
+from graphfaker.exporters.common import (
+    BATCH_SIZE,
+    DEFAULT_WRITERS,
+    ID_COLUMN,
+    KEY_COLUMN,
+    SOURCE_COLUMN,
+    TARGET_COLUMN,
+    WriterPool,
+    graph_tables,
+    iter_tables,
+    require_pyarrow,
+)
+from graphfaker.exporters.compression import (
+    BlockCompressor,
+    check_compression,
+    compressed_path,
+)
+from graphfaker.exporters.manifest import (
+    begin_part,
+    exported_edges,
+    exported_nodes,
+    record_part,
+)
+
+# Column kind -> Neo4j import type
+NEO4J_TYPES = {
+    "int": "long",
+    "float": "double",
+    "bool": "boolean",
+    "string": "string",
+    "category": "string",
+    "date": "date",
+    "timestamp": "localdatetime",
+    "pair": "double[]",
+}
+
+ARRAY_DELIMITER = ";"
+
+# Folder names, matching the --nodes / --relationships import options
+NEO4J_FOLDERS = {"node": "nodes", "edge": "relationships"}
+
+# Key columns -> import header fields
+KEY_HEADERS = {
+    ID_COLUMN: f"{ID_COLUMN}:ID",
+    SOURCE_COLUMN: ":START_ID",
+    TARGET_COLUMN: ":END_ID",
+    KEY_COLUMN: f"{KEY_COLUMN}:string",
+}
+
+
+def neo4j_header(spec) -> list:
+    """Header fields of the CSV of a TableSpec."""
+    header = [KEY_HEADERS[name] for name, _ in spec.key_fields()]
+    header += [f"{name}:{NEO4J_TYPES[kind]}" for _, name, kind, _ in spec.columns]
+    header.append(":LABEL" if spec.element == "node" else ":TYPE")
+    return header
+
+
+def _csv_table(spec, table):
+    """table with every column in the text form neo4j-admin parses."""
+    pa = require_pyarrow()
+    import pyarrow.compute as pc
+
+    columns = []
+    for column, field in zip(table.columns, table.schema):
+        if pa.types.is_dictionary(field.type):
+            column = column.cast(pa.string())
+        elif pa.types.is_fixed_size_list(field.type):
+            strings = column.cast(pa.list_(pa.string()))
+            column = pc.binary_join(strings, ARRAY_DELIMITER)
+        elif pa.types.is_timestamp(field.type):
+            column = pc.strftime(column, "%Y-%m-%dT%H:%M:%S")
+        columns.append(column)
+    columns.append(pa.repeat(pa.scalar(spec.label, pa.string()), table.num_rows))
+    names = [f"c{i}" for i in range(len(columns))]
+    return pa.table(columns, names=names)
+
+
+class _CSVFile:
+    """One import CSV, opened on the first chunk and written by one thread."""
+
+    def __init__(self, path: str, spec, compression=None, level=None, executor=None):
+        self.path = path
+        self.spec = spec
+        self.compression = compression
+        self.level = level
+        self.executor = executor
+        self.sink = None
+        self.writer = None
+
+    def write(self, table):
+        pa = require_pyarrow()
+        import pyarrow.csv as pacsv
+
+        table = _csv_table(self.spec, table)
+        if self.writer is None:
+            header = io.StringIO()
+            csv.writer(header, lineterminator="\n").writerow(neo4j_header(self.spec))
+            if self.compression is None:
+                # Native file, so the CSV encoding never needs the GIL
+                self.sink = pa.OSFile(self.path, "wb")
+            else:
+                self.sink = BlockCompressor(
+                    open(self.path, "wb"),  # noqa: SIM115 - closed by the compressor
+                    self.compression,
+                    self.level,
+                    executor=self.executor,
+                )
+            self.sink.write(header.getvalue().encode("utf-8"))
+            self.writer = pacsv.CSVWriter(
+                self.sink,
+                table.schema,
+                write_options=pacsv.WriteOptions(include_header=False),
+            )
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self.sink is not None:
+            self.sink.close()
+
+
+def write_neo4j_csv(
+    G,
+    directory,
+    workers: int = DEFAULT_WRITERS,
+    batch_size: int = BATCH_SIZE,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    append: bool = False,
+) -> dict:
+    """
+    Write G as neo4j-admin import CSVs.
+
+    Args:
+        G: networkx graph or CSRGraph; files are split by the "type" node
+            attribute and the "relationship" edge attribute.
+        directory: output directory, created if needed.
+        workers: writer threads; each file is written by one of them.
+        batch_size: rows converted to CSV at a time.
+        compression: "gzip" (read natively by neo4j-admin) or "zstd".
+        level: compression level.
+        append: write only the nodes and edges missing from the export in
+            directory as its next part (see exporters.manifest),
+            for `neo4j-admin database import incremental`.
+
+    Returns:
+        dict of (element, label) -> file path, element being "node" or "edge".
+    """
+    require_pyarrow()
+    check_compression(compression)
+    manifest, part, root = begin_part(directory, "neo4j", append)
+    exclude = exclude_edges = None
+    if append:
+        exclude = exported_nodes(G, directory, manifest)
+        exclude_edges = exported_edges(G, directory, manifest)
+    tables = graph_tables(G, exclude, exclude_edges)
+    executor = None
+    if compression is not None:
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="graphfaker-compress")
+    files = {}
+    for key, spec in tables.items():
+        folder = os.path.join(root, NEO4J_FOLDERS[spec.element])
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, table_filename(spec.label, ".csv"))
+        files[key] = _CSVFile(
+            compressed_path(path, compression), spec, compression, level, executor
+        )
+
+    try:
+        with WriterPool(workers) as pool:
+            chunks = iter_tables(
+                G, tables, batch_size, exclude=exclude, exclude_edges=exclude_edges
+            )
+            for spec, table in chunks:
+                key = (spec.element, spec.label)
+                pool.submit(key, files[key].write, table)
+    finally:
+        for f in files.values():
+            f.close()
+        if executor is not None:
+            executor.shutdown()
+    paths = {key: f.path for key, f in files.items()}
+    record_part(directory, manifest, part, paths, tables)
+    return paths
+
+
+def neo4j_import_command(paths: dict, database: str = "neo4j") -> list:
+    """
+    neo4j-admin arguments importing the files returned by write_neo4j_csv.
+
+    Multiline fields are enabled since Faker values such as addresses contain
+    newlines.
+    """
+    args = [
+        "neo4j-admin",
+        "database",
+        "import",
+        "full",
+        database,
+        f"--array-delimiter={ARRAY_DELIMITER}",
+        "--multiline-fields=true",
+    ]
+    for (element, _), path in paths.items():
+        option = "--nodes" if element == "node" else "--relationships"
+        args.append(f"{option}={path}")
+    return args
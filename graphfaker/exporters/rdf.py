@@ -0,0 +1,292 @@
+# graphfaker/exporters/rdf.py
+"""
+Streaming RDF export as N-Triples or JSON-LD.
+
+Every node becomes a resource <namespace>node/<id> typed with its "type"
+attribute as a class, and every edge a triple whose predicate is its
+"relationship" label; classes, attributes and relationships are IRIs under
+the namespace:
+
+    node/person_0  rdf:type  Person
+    node/person_0  age       "54"^^xsd:integer
+    node/person_0  LIVES_IN  node/place_3
+
+Values become typed literals (xsd:integer, double, boolean, decimal, dateTime,
+and date for ISO "YYYY-MM-DD" strings); tuples such as coordinates are
+written as "lat,lon" strings. Edge attributes (position, amount, ...) are
+kept, unless edge_properties=False, by reifying the edge as an rdf:Statement
+blank node carrying them.
+
+Both writers stream nodes, then edges, in chunks with constant memory, like
+the GraphML writer, and accept compression="gzip" or "zstd".
+
+Usage:
+    from graphfaker.exporters.rdf import write_rdf
+    write_rdf(G, "graph.nt")
+    write_rdf(G, "graph.jsonld", format="jsonld", namespace="https://example.org/")
+"""
+
+import json
+import math
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from urllib.parse import quote
+
+import numpy as np
+
+from graphfaker.exporters.common import (
+    DEFAULT_EDGE_LABEL,
+    EDGE_LABEL_ATTR,
+    NODE_LABEL_ATTR,
+)
+from graphfaker.exporters.graphml import WRITE_CHUNK, _text_output
+
+RDF_FORMATS = {"ntriples": ".nt", "jsonld": ".jsonld"}
+DEFAULT_NAMESPACE = "http://graphfaker.org/"
+# Node resources live under <namespace>node/
+NODE_PATH = "node/"
+
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+XSD_NS = "http://www.w3.org/2001/XMLSchema#"
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+_IRI_SAFE = re.compile(r"[A-Za-z0-9_.~-]+$")
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def _segment(value) -> str:
+    """value as an IRI path segment, percent-encoded when needed."""
+    s = str(value)
+    # Identifiers (person_0, JFK, ...) are the common case and always safe
+    if s.isidentifier() or _IRI_SAFE.match(s):
+        return s
+    return quote(s, safe="")
+
+
+def _double(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "INF" if value > 0 else "-INF"
+    return repr(float(value))
+
+
+def rdf_literal(value) -> tuple:
+    """(lexical form, xsd datatype or None for plain strings) of a value."""
+    if isinstance(value, str):
+        return (value, "date" if _ISO_DATE.match(value) else None)
+    if isinstance(value, (bool, np.bool_)):
+        return ("true" if value else "false", "boolean")
+    if isinstance(value, (int, np.integer)):
+        return (str(int(value)), "integer")
+    if isinstance(value, (float, np.floating)):
+        return (_double(value), "double")
+    if isinstance(value, Decimal):
+        return (str(value), "decimal")
+    if isinstance(value, datetime):
+        return (value.isoformat(), "dateTime")
+    if isinstance(value, date):
+        return (value.isoformat(), "date")
+    if isinstance(value, tuple):
+        return (",".join(str(v) for v in value), None)
+    return (str(value), None)
+
+
+class _Terms(dict):
+    """name -> <namespace><name> in N-Triples form, built on first use."""
+
+    def __init__(self, namespace: str):
+        super().__init__()
+        self.namespace = namespace
+
+    def __missing__(self, name) -> str:
+        iri = self[name] = f"<{self.namespace}{_segment(name)}>"
+        return iri
+
+
+def _properties(data: dict, label_attr: str):
+    return (
+        (name, value)
+        for name, value in data.items()
+        if name != label_attr and value is not None
+    )
+
+
+def _edge_data(data: dict) -> tuple:
+    label = data.get(EDGE_LABEL_ATTR) or DEFAULT_EDGE_LABEL
+    if len(data) == 1 and EDGE_LABEL_ATTR in data:
+        return label, ()
+    return label, list(_properties(data, EDGE_LABEL_ATTR))
+
+
+# Datatype suffixes of the literal types written without rdf_literal
+_XSD_SUFFIXES = {name: f"^^<{XSD_NS}{name}>" for name in ("integer", "double", "date")}
+
+
+def _ntriples_literal(value) -> str:
+    kind = type(value)
+    if kind is str:
+        text = f'"{value.translate(_LITERAL_ESCAPES)}"'
+        if len(value) == 10 and _ISO_DATE.match(value):
+            return text + _XSD_SUFFIXES["date"]
+        return text
+    if kind is int:
+        return f'"{value}"{_XSD_SUFFIXES["integer"]}'
+    lexical, datatype = rdf_literal(value)
+    text = f'"{lexical.translate(_LITERAL_ESCAPES)}"'
+    return text if datatype is None else f"{text}^^<{XSD_NS}{datatype}>"
+
+
+def write_ntriples(
+    G,
+    dest,
+    namespace: str = DEFAULT_NAMESPACE,
+    edge_properties: bool = True,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+):
+    """Write G as N-Triples, see write_rdf."""
+    terms = _Terms(namespace)
+    base = namespace + NODE_PATH
+    rdf_type = f"<{RDF_NS}type>"
+    reified = [f"<{RDF_NS}{name}>" for name in ("subject", "predicate", "object")]
+    statement = f"<{RDF_NS}Statement>"
+
+    with _text_output(dest, compression, level) as f:
+        chunk = []
+        for n, data in G.nodes(data=True):
+            subject = f"<{base}{_segment(n)}>"
+            label = data.get(NODE_LABEL_ATTR)
+            if label is not None:
+                chunk.append(f"{subject} {rdf_type} {terms[label]} .\n")
+            for name, value in _properties(data, NODE_LABEL_ATTR):
+                chunk.append(f"{subject} {terms[name]} {_ntriples_literal(value)} .\n")
+            if len(chunk) >= WRITE_CHUNK:
+                f.write("".join(chunk))
+                chunk = []
+
+        for i, (u, v, data) in enumerate(G.edges(data=True)):
+            label, properties = _edge_data(data)
+            subject, obj = f"<{base}{_segment(u)}>", f"<{base}{_segment(v)}>"
+            predicate = terms[label]
+            chunk.append(f"{subject} {predicate} {obj} .\n")
+            if edge_properties and properties:
+                edge = f"_:e{i}"
+                chunk.append(f"{edge} {rdf_type} {statement} .\n")
+                for term, part in zip(reified, (subject, predicate, obj)):
+                    chunk.append(f"{edge} {term} {part} .\n")
+                for name, value in properties:
+                    chunk.append(f"{edge} {terms[name]} {_ntriples_literal(value)} .\n")
+            if len(chunk) >= WRITE_CHUNK:
+                f.write("".join(chunk))
+                chunk = []
+        f.write("".join(chunk))
+
+
+def _jsonld_value(value):
+    """Native JSON for strings, integers, booleans and finite doubles."""
+    lexical, datatype = rdf_literal(value)
+    if datatype is None:
+        return lexical
+    if datatype == "integer":
+        return int(lexical)
+    if datatype == "boolean":
+        return lexical == "true"
+    if datatype == "double" and math.isfinite(value):
+        return float(value)
+    return {"@value": lexical, "@type": f"xsd:{datatype}"}
+
+
+def _jsonld_id(value) -> dict:
+    # Relative to the @base of the context
+    return {"@id": _segment(value)}
+
+
+def write_jsonld(
+    G,
+    dest,
+    namespace: str = DEFAULT_NAMESPACE,
+    edge_properties: bool = True,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+):
+    """Write G as a JSON-LD document with one @graph array, see write_rdf."""
+    context = {
+        "@vocab": namespace,
+        "@base": namespace + NODE_PATH,
+        "rdf": RDF_NS,
+        "xsd": XSD_NS,
+    }
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    separator = ""
+
+    with _text_output(dest, compression, level) as f:
+        f.write(f'{{"@context":{dumps(context)},\n"@graph":[\n')
+        chunk = []
+        for n, data in G.nodes(data=True):
+            obj = {"@id": _segment(n)}
+            label = data.get(NODE_LABEL_ATTR)
+            if label is not None:
+                obj["@type"] = str(label)
+            for name, value in _properties(data, NODE_LABEL_ATTR):
+                obj[str(name)] = _jsonld_value(value)
+            chunk.append(separator + dumps(obj))
+            separator = ",\n"
+            if len(chunk) >= WRITE_CHUNK:
+                f.write("".join(chunk))
+                chunk = []
+
+        for i, (u, v, data) in enumerate(G.edges(data=True)):
+            label, properties = _edge_data(data)
+            # Node objects sharing an @id are merged by JSON-LD processors
+            obj = {"@id": _segment(u), str(label): _jsonld_id(v)}
+            chunk.append(separator + dumps(obj))
+            separator = ",\n"
+            if edge_properties and properties:
+                reified = {
+                    "@id": f"_:e{i}",
+                    "@type": "rdf:Statement",
+                    "rdf:subject": _jsonld_id(u),
+                    "rdf:predicate": {"@id": namespace + _segment(label)},
+                    "rdf:object": _jsonld_id(v),
+                }
+                for name, value in properties:
+                    reified[str(name)] = _jsonld_value(value)
+                chunk.append(separator + dumps(reified))
+            if len(chunk) >= WRITE_CHUNK:
+                f.write("".join(chunk))
+                chunk = []
+        f.write("".join(chunk))
+        f.write("\n]}\n")
+
+
+def write_rdf(
+    G,
+    dest,
+    format: str = "ntriples",
+    namespace: str = DEFAULT_NAMESPACE,
+    edge_properties: bool = True,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+):
+    """
+    Write G as RDF.
+
+    Args:
+        G: graph exposing nodes(data=True) and edges(data=True) (NetworkX
+            graphs or CSRGraph).
+        dest: destination file path, or an open text or binary file handle.
+        format: "ntriples" or "jsonld".
+        namespace: IRI prefix of node resources (<namespace>node/<id>),
+            classes, attributes and relationships.
+        edge_properties: keep edge attributes on reified rdf:Statement blank
+            nodes; False writes only the edge triples.
+        compression: "gzip" or "zstd" to compress the output.
+        level: compression level.
+    """
+    writers = {"ntriples": write_ntriples, "jsonld": write_jsonld}
+    if format not in writers:
+        raise ValueError(f"Unknown RDF format '{format}'. Use one of {list(writers)}.")
+    writers[format](G, dest, namespace, edge_properties, compression, level)
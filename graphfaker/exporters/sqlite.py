@@ -0,0 +1,471 @@
+# graphfaker/exporters/sqlite.py
+"""
+SQLite export and import.
+
+write_sqlite stores a graph as one SQLite file for ad-hoc SQL:
+
+    "Person", "Place", ...   one table per node type: id, then one column per
+                             attribute
+    edges                    every edge: source, target, relationship,
+                             source_label, target_label (the endpoint types),
+                             key for multigraphs, then the edge attributes
+    graphfaker_tables        node type / relationship -> table
+    graphfaker_columns       column kinds, used to decode values on reading
+    graphfaker_graph         graph attributes and the directed / multigraph
+                             flags
+
+Rows are bulk-loaded with executemany in batches of batch_size, inside
+transactions of transaction_rows rows, with the journal and fsyncs disabled
+for the load. Indexes (node ids, edge endpoints, relationship and endpoint
+types) are built once the data is in, which is much faster than maintaining
+them row by row.
+
+read_sqlite rebuilds a NetworkX graph, or the subgraph of some node types
+and relationships: only the matching node tables are read, and edges are
+selected through the relationship / endpoint type indexes.
+
+Usage:
+    from graphfaker.exporters.sqlite import read_sqlite, write_sqlite
+    write_sqlite(G, "graph.sqlite")
+    H = read_sqlite("graph.sqlite", node_types=["Person", "Organization"])
+"""
+
+import json
+import os
+import sqlite3
+from datetime import date, datetime
+from typing import Optional
+
+import networkx as nx
+import numpy as np
+
+from graphfaker.csr import CSRGraph
+from graphfaker.exporters.common import (
+    BATCH_SIZE,
+    DEFAULT_NODE_LABEL,
+    EDGE_LABEL_ATTR,
+    ID_COLUMN,
+    KEY_COLUMN,
+    NODE_LABEL_ATTR,
+    SOURCE_COLUMN,
+    SOURCE_LABEL_COLUMN,
+    TARGET_COLUMN,
+    TARGET_LABEL_COLUMN,
+    _csr_relationships,
+    _csr_table_labels,
+    edge_label,
+    graph_tables,
+    node_label,
+    value_kind,
+)
+
+EDGE_TABLE = "edges"
+TABLES_TABLE = "graphfaker_tables"
+COLUMNS_TABLE = "graphfaker_columns"
+GRAPH_TABLE = "graphfaker_graph"
+
+# Rows per transaction during the load
+TRANSACTION_ROWS = 1_000_000
+
+# Set for the load only: no rollback journal, no fsync, a 256 MiB page cache
+BULK_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+    "PRAGMA locking_mode = EXCLUSIVE",
+)
+
+# Column kind -> declared SQLite type
+SQLITE_TYPES = {
+    "int": "INTEGER",
+    "float": "REAL",
+    "bool": "INTEGER",
+    "string": "TEXT",
+    "category": "TEXT",
+    "date": "TEXT",
+    "timestamp": "TEXT",
+    "pair": "TEXT",
+}
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _pair(value) -> str:
+    return json.dumps([float(value[0]), float(value[1])])
+
+
+def _sql_value(value):
+    """A value sqlite3 cannot bind as is, as int, float, ISO date, JSON or text."""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if value_kind(value) == "pair":
+        return _pair(value)
+    return str(value)
+
+
+# Column kind -> SQLite value to Python value, for kinds SQLite does not keep
+_DECODERS = {
+    "bool": bool,
+    "timestamp": datetime.fromisoformat,
+    "pair": lambda value: tuple(json.loads(value)),
+}
+
+# Types sqlite3 binds as they are
+_NATIVE = {str, int, float, bool, type(None)}
+
+
+def _row(values) -> list:
+    return [v if type(v) in _NATIVE else _sql_value(v) for v in values]
+
+
+def _insert_sql(table: str, names: list) -> str:
+    placeholders = ", ".join("?" * len(names))
+    return f"INSERT INTO {table}({', '.join(names)}) VALUES ({placeholders})"
+
+
+def _node_table_names(node_specs: list) -> dict:
+    """Node type -> table name, avoiding the edge and metadata tables."""
+    reserved = {EDGE_TABLE, TABLES_TABLE, COLUMNS_TABLE, GRAPH_TABLE}
+    names, used = {}, set()
+    for spec in node_specs:
+        name = str(spec.label)
+        while name.lower() in reserved or name.lower() in used:
+            name += "_nodes"
+        names[spec.label] = name
+        used.add(name.lower())
+    return names
+
+
+def _edge_columns(edge_specs: list) -> dict:
+    """Attribute -> column name of the edges table, in first-seen order."""
+    return {attr: name for s in edge_specs for attr, name, _, _ in s.columns}
+
+
+def _create_schema(conn, G, node_specs, edge_specs, table_names, id_kind):
+    id_type = SQLITE_TYPES[id_kind]
+    conn.execute(f"CREATE TABLE {TABLES_TABLE}(element TEXT, label TEXT, name TEXT)")
+    conn.execute(
+        f"CREATE TABLE {COLUMNS_TABLE}"
+        "(table_name TEXT, label TEXT, name TEXT, attr TEXT, kind TEXT)"
+    )
+    conn.execute(f"CREATE TABLE {GRAPH_TABLE}(name TEXT PRIMARY KEY, value TEXT)")
+    for spec in node_specs:
+        table = table_names[spec.label]
+        columns = "".join(
+            f", {_quote(name)} {SQLITE_TYPES[kind]}"
+            for _, name, kind, _ in spec.columns
+        )
+        conn.execute(f"CREATE TABLE {_quote(table)}({ID_COLUMN} {id_type}{columns})")
+    key = f", {KEY_COLUMN}" if G.is_multigraph() else ""
+    columns = "".join(
+        f", {_quote(name)}" for name in _edge_columns(edge_specs).values()
+    )
+    conn.execute(
+        f"CREATE TABLE {EDGE_TABLE}({SOURCE_COLUMN} {id_type}, "
+        f"{TARGET_COLUMN} {id_type}{key}, {EDGE_LABEL_ATTR} TEXT, "
+        f"{SOURCE_LABEL_COLUMN} TEXT, {TARGET_LABEL_COLUMN} TEXT{columns})"
+    )
+
+    conn.executemany(
+        f"INSERT INTO {TABLES_TABLE} VALUES (?, ?, ?)",
+        [("node", s.label, table_names[s.label]) for s in node_specs]
+        + [("edge", s.label, EDGE_TABLE) for s in edge_specs],
+    )
+    conn.executemany(
+        f"INSERT INTO {COLUMNS_TABLE} VALUES (?, ?, ?, ?, ?)",
+        [
+            (table_names[s.label], s.label, name, str(attr), kind)
+            for s in node_specs
+            for attr, name, kind, _ in s.columns
+        ]
+        + [
+            (EDGE_TABLE, s.label, name, str(attr), kind)
+            for s in edge_specs
+            for attr, name, kind, _ in s.columns
+        ],
+    )
+    graph = {
+        "attributes": json.dumps(getattr(G, "graph", {}), default=str),
+        "directed": json.dumps(G.is_directed()),
+        "multigraph": json.dumps(G.is_multigraph()),
+    }
+    conn.executemany(f"INSERT INTO {GRAPH_TABLE} VALUES (?, ?)", graph.items())
+
+
+def _create_indexes(conn, node_specs, table_names):
+    for spec in node_specs:
+        table = table_names[spec.label]
+        conn.execute(
+            f"CREATE UNIQUE INDEX {_quote(table + '_id')} "
+            f"ON {_quote(table)}({ID_COLUMN})"
+        )
+    for name, columns in (
+        ("source", SOURCE_COLUMN),
+        ("target", TARGET_COLUMN),
+        ("relationship", EDGE_LABEL_ATTR),
+        ("endpoint_labels", f"{SOURCE_LABEL_COLUMN}, {TARGET_LABEL_COLUMN}"),
+    ):
+        conn.execute(f"CREATE INDEX {EDGE_TABLE}_{name} ON {EDGE_TABLE}({columns})")
+    conn.execute("ANALYZE")
+
+
+def _networkx_batches(G, node_inserts: dict, edge_insert: tuple, batch_size: int):
+    """(insert statement, rows) batches of a NetworkX graph."""
+    labels = {}
+    pending: dict = {}
+    for n, data in G.nodes(data=True):
+        label = labels[n] = node_label(data)
+        sql, attrs = node_inserts[label]
+        rows = pending.setdefault(sql, [])
+        rows.append(_row([n, *map(data.get, attrs)]))
+        if len(rows) >= batch_size:
+            yield sql, pending.pop(sql)
+    yield from pending.items()
+
+    sql, attrs = edge_insert
+    multigraph = G.is_multigraph()
+    rows = []
+    for edge in G.edges(keys=True, data=True) if multigraph else G.edges(data=True):
+        u, v, data = edge[0], edge[1], edge[-1]
+        endpoints = [u, v, *edge[2:-1], edge_label(data), labels[u], labels[v]]
+        rows.append(_row([*endpoints, *map(data.get, attrs)]))
+        if len(rows) >= batch_size:
+            yield sql, rows
+            rows = []
+    if rows:
+        yield sql, rows
+
+
+def _csr_values(col, positions: np.ndarray) -> list:
+    """Values of a CSRGraph column at positions, None where missing."""
+    if col is None:
+        return [None] * len(positions)
+    if col.index is None:
+        values = col.decode(positions)
+    else:
+        values = [None] * len(positions)
+        for i, v in zip(*col.hits(positions)):
+            values[i] = v
+    if col.kind == "pair":
+        values = [None if v is None else _pair(v) for v in values]
+    return values
+
+
+def _csr_batches(G: CSRGraph, node_inserts: dict, edge_insert: tuple, batch_size):
+    """(insert statement, rows) batches of a CSRGraph, built column by column."""
+    for table in G.node_tables:
+        label = DEFAULT_NODE_LABEL if table.label is None else str(table.label)
+        sql, attrs = node_inserts[label]
+        for start in range(0, len(table), batch_size):
+            stop = min(start + batch_size, len(table))
+            ids = G.node_ids.slice(table.start + start, table.start + stop)
+            positions = np.arange(start, stop)
+            columns = [_csr_values(table.columns.get(a), positions) for a in attrs]
+            if table.lazy is None:
+                yield sql, list(zip(ids, *columns))
+                continue
+            # Attributes computed on access are filled in per row
+            rows = []
+            for n, row in zip(ids, zip(*columns) if columns else ((),) * len(ids)):
+                extra = table.lazy(n)
+                values = [extra.get(a) if v is None else v for a, v in zip(attrs, row)]
+                rows.append(_row([n, *values]))
+            yield sql, rows
+
+    sql, attrs = edge_insert
+    relationships, rel_codes = _csr_relationships(G)
+    relationships = np.asarray(relationships, dtype=object)
+    labels, node_codes = _csr_table_labels(G)
+    labels = np.asarray(labels, dtype=object)
+    edge_columns = [G.edge_columns.get(attr) for attr in attrs]
+    E = G.number_of_edges()
+    for start in range(0, E, batch_size):
+        stop = min(start + batch_size, E)
+        positions = np.arange(start, stop)
+        src = np.searchsorted(G.indptr, positions, side="right") - 1
+        dst = G.indices[start:stop]
+        columns = [
+            G.node_ids.take(src),
+            G.node_ids.take(dst),
+            relationships[rel_codes[start:stop]].tolist(),
+            labels[node_codes[src]].tolist(),
+            labels[node_codes[dst]].tolist(),
+        ]
+        columns += [_csr_values(col, positions) for col in edge_columns]
+        yield sql, list(zip(*columns))
+
+
+def write_sqlite(
+    G,
+    path,
+    batch_size: int = BATCH_SIZE,
+    transaction_rows: int = TRANSACTION_ROWS,
+) -> str:
+    """
+    Write G to a new SQLite database at path, replacing any existing file.
+
+    Args:
+        G: NetworkX graph or CSRGraph.
+        path: database file.
+        batch_size: rows per executemany call.
+        transaction_rows: rows per committed transaction.
+
+    Returns:
+        The absolute path written.
+    """
+    tables = graph_tables(G)
+    node_specs = [s for s in tables.values() if s.element == "node"]
+    edge_specs = {s.label: s for s in tables.values() if s.element == "edge"}
+    id_kind = next(iter(tables.values())).id_kind if tables else "string"
+    table_names = _node_table_names(node_specs)
+
+    path = os.path.abspath(os.fspath(path))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        for pragma in BULK_PRAGMAS:
+            conn.execute(pragma)
+        _create_schema(
+            conn, G, node_specs, list(edge_specs.values()), table_names, id_kind
+        )
+        node_inserts = {}
+        for spec in node_specs:
+            names = [ID_COLUMN] + [_quote(name) for _, name, _, _ in spec.columns]
+            sql = _insert_sql(_quote(table_names[spec.label]), names)
+            node_inserts[spec.label] = (sql, [attr for attr, _, _, _ in spec.columns])
+        key = [KEY_COLUMN] if G.is_multigraph() else []
+        attrs = _edge_columns(list(edge_specs.values()))
+        names = [SOURCE_COLUMN, TARGET_COLUMN, *key, EDGE_LABEL_ATTR]
+        names += [SOURCE_LABEL_COLUMN, TARGET_LABEL_COLUMN]
+        names += [_quote(name) for name in attrs.values()]
+        edge_insert = (_insert_sql(EDGE_TABLE, names), list(attrs))
+
+        batches = _csr_batches if isinstance(G, CSRGraph) else _networkx_batches
+        conn.execute("BEGIN")
+        uncommitted = 0
+        for sql, rows in batches(G, node_inserts, edge_insert, batch_size):
+            conn.executemany(sql, rows)
+            uncommitted += len(rows)
+            if uncommitted >= transaction_rows:
+                conn.execute("COMMIT")
+                conn.execute("BEGIN")
+                uncommitted = 0
+        conn.execute("COMMIT")
+
+        _create_indexes(conn, node_specs, table_names)
+    finally:
+        conn.close()
+    return path
+
+
+def _graph_class(directed: bool, multigraph: bool):
+    if multigraph:
+        return nx.MultiDiGraph if directed else nx.MultiGraph
+    return nx.DiGraph if directed else nx.Graph
+
+
+def _decoders(columns: list) -> list:
+    return [(attr, _DECODERS.get(kind)) for _, attr, kind in columns]
+
+
+def _decode(row, decoders: list) -> dict:
+    data = {}
+    for (attr, decode), value in zip(decoders, row):
+        if value is not None:
+            data[attr] = value if decode is None else decode(value)
+    return data
+
+
+def _in(column: str, values: list) -> str:
+    return f"{column} IN ({', '.join('?' * len(values))})"
+
+
+def read_sqlite(
+    path,
+    node_types: Optional[list] = None,
+    relationships: Optional[list] = None,
+) -> nx.Graph:
+    """
+    Read a database written by write_sqlite back into a NetworkX graph.
+
+    Args:
+        path: database file.
+        node_types: only read nodes of these types, and edges between them.
+        relationships: only read edges with these relationships.
+
+    Returns:
+        A graph of the stored class (DiGraph, MultiDiGraph, ...), with node
+        types in "type" and relationships in "relationship". Nodes that had
+        no type come back with type "Node".
+    """
+    conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+    try:
+        graph = dict(conn.execute(f"SELECT name, value FROM {GRAPH_TABLE}"))
+        G = _graph_class(
+            json.loads(graph["directed"]), json.loads(graph["multigraph"])
+        )()
+        G.graph.update(json.loads(graph["attributes"]))
+        columns: dict = {}
+        for table, label, name, attr, kind in conn.execute(
+            f"SELECT table_name, label, name, attr, kind FROM {COLUMNS_TABLE}"
+        ):
+            columns.setdefault((table, label), []).append((name, attr, kind))
+
+        for label, table in conn.execute(
+            f"SELECT label, name FROM {TABLES_TABLE} WHERE element = 'node'"
+        ).fetchall():
+            if node_types is not None and label not in node_types:
+                continue
+            cols = columns.get((table, label), [])
+            names = "".join(f", {_quote(name)}" for name, _, _ in cols)
+            decoders = _decoders(cols)
+            rows = conn.execute(f"SELECT {ID_COLUMN}{names} FROM {_quote(table)}")
+            G.add_nodes_from(
+                (row[0], {NODE_LABEL_ATTR: label, **_decode(row[1:], decoders)})
+                for row in rows
+            )
+
+        # One query per relationship, each reading its own columns through
+        # the relationship index
+        where, params = [], []
+        if node_types is not None:
+            where.append(_in(SOURCE_LABEL_COLUMN, node_types))
+            where.append(_in(TARGET_LABEL_COLUMN, node_types))
+            params += [*node_types, *node_types]
+        key = f", {KEY_COLUMN}" if G.is_multigraph() else ""
+        for (label,) in conn.execute(
+            f"SELECT label FROM {TABLES_TABLE} WHERE element = 'edge'"
+        ).fetchall():
+            if relationships is not None and label not in relationships:
+                continue
+            cols = columns.get((EDGE_TABLE, label), [])
+            names = "".join(f", {_quote(name)}" for name, _, _ in cols)
+            decoders = _decoders(cols)
+            conditions = " AND ".join([f"{EDGE_LABEL_ATTR} = ?", *where])
+            rows = conn.execute(
+                f"SELECT {SOURCE_COLUMN}, {TARGET_COLUMN}{key}{names} "
+                f"FROM {EDGE_TABLE} WHERE {conditions}",
+                [label, *params],
+            )
+            split = 3 if key else 2
+            G.add_edges_from(
+                (
+                    *row[:split],
+                    {EDGE_LABEL_ATTR: label, **_decode(row[split:], decoders)},
+                )
+                for row in rows
+            )
+    finally:
+        conn.close()
+    return G
@@ -22,15 +22,21 @@ Usage:
     flights_df  = FlightGraphFetcher.fetch_flights(year=2024, month=1)
     G = FlightGraphFetcher.build_graph(airlines_df, airports_df, flights_df)
 """
+import importlib.util
+import multiprocessing
 import os
-import io
+import itertools
+import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Tuple, Optional
-from io import StringIO
+from typing import Iterator, Tuple, Optional, Union
+from io import BytesIO
+from graphfaker.cache import DOWNLOAD_TIMEOUT, DownloadCache, copy_response
 from graphfaker.logger import logger
 import requests
 import pandas as pd
+from pandas.api.types import union_categoricals
 from tqdm.auto import tqdm
 import networkx as nx
 
@@ -48,6 +54,10 @@ AIRLINE_LOOKUP_URL = (
 AIRPORTS_URL = (
     "https://raw.githubusercontent.com/jpatokal/openflights/master/data/airports.dat"
 )
+BTS_MONTH_URL = (
+    "https://transtats.bts.gov/PREZIP/"
+    "On_Time_Reporting_Carrier_On_Time_Performance_1987_present_{year}_{month}.zip"
+)
 AIRPORT_COLS = [
     "id",
     "name",
@@ -79,6 +89,249 @@ COLUMN_MAP = {
     "Tail_Number": "tail_number",
 }
 
+# Compact dtypes of the BTS columns: codes are categoricals, date parts small
+# ints and delays (whole minutes, NaN when cancelled) float32
+FLIGHT_DTYPES = {
+    "Year": "uint16",
+    "Month": "uint8",
+    "DayofMonth": "uint8",
+    "DepDelay": "float32",
+    "ArrDelay": "float32",
+    "Reporting_Airline": "category",
+    "Flight_Number_Reporting_Airline": "int32",
+    "Origin": "category",
+    "Dest": "category",
+    "Tail_Number": "category",
+}
+CATEGORY_COLUMNS = [
+    COLUMN_MAP[name] for name, dtype in FLIGHT_DTYPES.items() if dtype == "category"
+]
+
+
+def _download_cache(
+    cache: Union[bool, DownloadCache], cache_dir: Optional[str]
+) -> Optional[DownloadCache]:
+    """The DownloadCache to use, None when caching is off."""
+    if isinstance(cache, DownloadCache):
+        return cache
+    return DownloadCache(cache_dir) if cache else None
+
+
+# BTS months downloaded at once by fetch_flights
+DOWNLOAD_WORKERS = 4
+
+# Parse processes start fresh instead of being forked while download threads
+# hold locks
+PARSE_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _month_range(date_range) -> list:
+    """(year, month) of every month from date_range[0] to date_range[1]."""
+    (y0, m0), (y1, m1) = date_range
+    cur, last = datetime(y0, m0, 1), datetime(y1, m1, 1)
+    months = []
+    while cur <= last:
+        months.append((cur.year, cur.month))
+        nxt = cur + timedelta(days=32)
+        cur = datetime(nxt.year, nxt.month, 1)
+    return months
+
+
+def _download_month(url: str, cache: Optional[DownloadCache], progress) -> tuple:
+    """
+    (path, temporary) of a BTS month zip on disk, released with _release_month.
+
+    The zip is the cached copy, pinned so that downloads of other months
+    cannot evict it before it is parsed, or without a cache a temporary file;
+    the body is spooled to disk, never held in memory.
+    """
+    if cache is not None:
+        cache.pin(cache.key(url))
+        try:
+            return cache.fetch(url, verify=False, progress=progress), False
+        except BaseException:
+            cache.unpin(cache.key(url))
+            raise
+    resp = requests.get(url, stream=True, verify=False, timeout=DOWNLOAD_TIMEOUT)
+    resp.raise_for_status()
+    fd, path = tempfile.mkstemp(prefix="graphfaker-bts-", suffix=".zip")
+    try:
+        with resp, os.fdopen(fd, "wb") as f:
+            copy_response(resp, f, progress)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path, True
+
+
+def _csv_engine() -> str:
+    """pyarrow's multithreaded CSV parser when installed, else pandas' C parser."""
+    return "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+
+def _tidy(df: pd.DataFrame) -> pd.DataFrame:
+    """COLUMN_MAP names and the derived cancelled / delayed flags."""
+    df = df[list(COLUMN_MAP)].rename(columns=COLUMN_MAP)
+    df["cancelled"] = df["dep_delay"].isna()
+    df["delayed"] = df["arr_delay"] > 15
+    return df
+
+
+def _month_chunks(path: str, chunksize: Optional[int]):
+    """
+    Flights of a BTS month zip, as one frame or frames of chunksize rows.
+
+    The CSV member is decompressed as the parser reads it, so only the
+    current chunk of the month is ever in memory. Whole months are parsed by
+    pyarrow when it is installed; chunks need pandas' own parser.
+    """
+    options = {"usecols": list(COLUMN_MAP), "dtype": FLIGHT_DTYPES}
+    with zipfile.ZipFile(path) as z:
+        name = next(f for f in z.namelist() if f.lower().endswith(".csv"))
+        with z.open(name) as f:
+            if chunksize is None:
+                yield _tidy(pd.read_csv(f, engine=_csv_engine(), **options))
+                return
+            with pd.read_csv(f, chunksize=chunksize, **options) as reader:
+                for chunk in reader:
+                    yield _tidy(chunk)
+
+
+def _read_month(path: str) -> pd.DataFrame:
+    return next(_month_chunks(path, None))
+
+
+def _concat(frames: list) -> pd.DataFrame:
+    """Frames of consecutive months as one, keeping the categorical columns."""
+    if len(frames) == 1:
+        return frames[0]
+    frames = [frame.copy(deep=False) for frame in frames]
+    for column in CATEGORY_COLUMNS:
+        # Categoricals only stay categorical when every frame has the same ones
+        categories = union_categoricals(
+            [frame[column] for frame in frames], sort_categories=True
+        ).categories
+        for frame in frames:
+            frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _release_month(url: str, cache: Optional[DownloadCache], downloaded: tuple):
+    """Unpin the cached zip of a parsed month, or remove its temporary file."""
+    path, temporary = downloaded
+    if cache is not None:
+        cache.unpin(cache.key(url))
+    if temporary and os.path.exists(path):
+        os.remove(path)
+
+
+def _release_done(futures: dict, cache: Optional[DownloadCache]):
+    """_release_month every download in futures (future -> url) that finished."""
+    for future, url in futures.items():
+        if future.done() and not future.cancelled() and not future.exception():
+            _release_month(url, cache, future.result())
+
+
+def _progress(urls: list):
+    return tqdm(
+        total=0,
+        unit="B",
+        unit_scale=True,
+        desc=f"BTS {len(urls)} month(s)",
+        leave=False,
+    )
+
+
+def _download_pool(urls: list, workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max(1, min(workers, len(urls))), thread_name_prefix="graphfaker-download"
+    )
+
+
+def _fetch_months(
+    urls: list,
+    cache: Optional[DownloadCache],
+    workers: int,
+    parse_workers: int,
+) -> list:
+    """
+    Frames of the BTS month zips at urls, in order.
+
+    Up to workers months download at once on threads; finished ones are
+    parsed in this process, or with parse_workers > 1 in a pool of that many
+    processes, while the rest are still downloading.
+    """
+    frames = [None] * len(urls)
+    progress = _progress(urls)
+    downloads = _download_pool(urls, workers)
+    parser = None
+    if parse_workers > 1:
+        parser = ProcessPoolExecutor(
+            parse_workers, mp_context=multiprocessing.get_context(PARSE_START_METHOD)
+        )
+    # Downloads whose month is not parsed yet, future -> url
+    pending = {}
+    try:
+        futures = {
+            downloads.submit(_download_month, url, cache, progress): i
+            for i, url in enumerate(urls)
+        }
+        pending = {future: urls[i] for future, i in futures.items()}
+        parsing = {}
+        for future in as_completed(futures):
+            i, path = futures[future], future.result()[0]
+            if parser is None:
+                frames[i] = _read_month(path)
+                _release_month(pending.pop(future), cache, future.result())
+            else:
+                parsing[parser.submit(_read_month, path)] = future
+        for parsed, future in parsing.items():
+            frames[futures[future]] = parsed.result()
+            _release_month(pending.pop(future), cache, future.result())
+    finally:
+        # A failed month stops the months not started yet
+        downloads.shutdown(cancel_futures=True)
+        if parser is not None:
+            parser.shutdown(cancel_futures=True)
+        _release_done(pending, cache)
+        progress.close()
+    return frames
+
+
+def _iter_months(
+    urls: list, cache: Optional[DownloadCache], workers: int, chunksize: int
+):
+    """
+    Frames of at most chunksize flights of the months at urls, in order.
+
+    Months are parsed here, one chunk at a time, while up to workers of the
+    next months download to disk, so memory is bounded by one chunk.
+    """
+    progress = _progress(urls)
+    downloads = _download_pool(urls, workers)
+    # Downloads whose month is not parsed yet, future -> url, in month order
+    pending: dict = {}
+    queued = iter(urls)
+    try:
+        for url in itertools.islice(queued, max(1, workers)):
+            pending[downloads.submit(_download_month, url, cache, progress)] = url
+        while pending:
+            future = next(iter(pending))
+            downloaded = future.result()
+            url = pending.pop(future)
+            for nxt in itertools.islice(queued, 1):
+                pending[downloads.submit(_download_month, nxt, cache, progress)] = nxt
+            try:
+                yield from _month_chunks(downloaded[0], chunksize)
+            finally:
+                _release_month(url, cache, downloaded)
+    finally:
+        downloads.shutdown(cancel_futures=True)
+        _release_done(pending, cache)
+        progress.close()
+
 
 class FlightGraphFetcher:
     """
@@ -113,26 +366,43 @@ class FlightGraphFetcher:
     """
 
     @staticmethod
-    def fetch_airlines() -> pd.DataFrame:
+    def fetch_airlines(
+        cache: Union[bool, DownloadCache] = True, cache_dir: Optional[str] = None
+    ) -> pd.DataFrame:
         """
         Download and tidy BTS airlines lookup table.
         Source:
             airline -> https://transtats.bts.gov/Download_Lookup.asp?Y11x72=Y_haVdhR_PNeeVRef
 
+        Args:
+            cache: keep the download in the on-disk DownloadCache (True, or a
+                DownloadCache instance); False always downloads.
+            cache_dir: cache directory, see graphfaker.cache.default_cache_dir.
+
         Returns:
             pd.DataFrame with columns ['carrier', 'airline_name']
         Raises:
             HTTPError if download fails.
         """
         logger.info("Fetching airlines lookup from BTS…")
-        resp = requests.get(AIRLINE_LOOKUP_URL, verify=False)
-        resp.raise_for_status()
-        df = pd.read_csv(StringIO(resp.text))
+        store = _download_cache(cache, cache_dir)
+        # Both paths decode with the charset the server declared, UTF-8 without one
+        if store is not None:
+            source = store.fetch(AIRLINE_LOOKUP_URL, verify=False)
+            encoding = store.encoding(AIRLINE_LOOKUP_URL)
+        else:
+            resp = requests.get(AIRLINE_LOOKUP_URL, verify=False)
+            resp.raise_for_status()
+            source, encoding = BytesIO(resp.content), resp.encoding
+        df = pd.read_csv(source, encoding=encoding or "utf-8", encoding_errors="replace")
         return df.rename(columns={"Code": "carrier", "Description": "airline_name"})
 
     @staticmethod
     def fetch_airports(
-        country: Optional[str] = "United States", keep_only_with_faa: bool = True
+        country: Optional[str] = "United States",
+        keep_only_with_faa: bool = True,
+        cache: Union[bool, DownloadCache] = True,
+        cache_dir: Optional[str] = None,
     ) -> pd.DataFrame:
         """
         Download and tidy the OpenFlights airports dataset:
@@ -142,13 +412,17 @@ class FlightGraphFetcher:
         Args:
             country: filter airports by country name (optional).
             keep_only_with_faa: drop records without FAA code if True.
+            cache: keep the download in the on-disk DownloadCache, see
+                fetch_airlines.
+            cache_dir: cache directory.
 
         Returns:
             pd.DataFrame with columns ['faa','name','city','country','lat','lon']
         """
         logger.info("Fetching airports dataset from OpenFlights…")
+        store = _download_cache(cache, cache_dir)
         df = pd.read_csv(
-            AIRPORTS_URL,
+            store.fetch(AIRPORTS_URL) if store is not None else AIRPORTS_URL,
             header=None,
             names=AIRPORT_COLS,
             na_values=["", "NA", r"\N"],
@@ -181,28 +455,17 @@ class FlightGraphFetcher:
             drop=True
         )
 
-    @staticmethod
-    def _download_extract_csv(url: str) -> io.BytesIO:
-        """Stream-download a BTS zip file and return CSV data as BytesIO."""
-        resp = requests.get(url, stream=True, verify=False)
-        resp.raise_for_status()
-        buf = io.BytesIO()
-        total = int(resp.headers.get("content-length", 0))
-        with tqdm.wrapattr(
-            resp.raw, "read", total=total, desc=os.path.basename(url), leave=False
-        ) as r:
-            buf.write(r.read())
-        buf.seek(0)
-        with zipfile.ZipFile(buf) as z:
-            name = next(f for f in z.namelist() if f.lower().endswith(".csv"))
-            return io.BytesIO(z.read(name))
-
     @staticmethod
     def fetch_flights(
         year: Optional[int] = None,
         month: Optional[int] = None,
         date_range: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None,
-    ) -> pd.DataFrame:
+        cache: Union[bool, DownloadCache] = True,
+        cache_dir: Optional[str] = None,
+        workers: int = DOWNLOAD_WORKERS,
+        parse_workers: int = 1,
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Fetch BTS on-time performance data for a given month or a range of months.
         source:
@@ -213,49 +476,82 @@ class FlightGraphFetcher:
             year: calendar year for single-month fetch.
             month: month (1-12) for single-month fetch.
             date_range: ((year0, month0), (year1, month1)) to fetch multiple months.
+            cache: keep the monthly zips in the on-disk DownloadCache, so
+                months fetched before are only revalidated (or read offline
+                with GRAPHFAKER_OFFLINE=1); False always downloads.
+            cache_dir: cache directory, see graphfaker.cache.default_cache_dir.
+            workers: months of a date_range downloaded concurrently.
+            parse_workers: processes parsing downloaded months while others
+                are still downloading; 1 (the default) parses in this process.
+                The processes re-import the calling script, so a script
+                passing more than 1 must do so under
+                if __name__ == "__main__":.
+            chunksize: return an iterator of frames of at most chunksize
+                flights instead, in month order. Zips are spooled to disk and
+                each month is parsed as it is read, so any range is fetched
+                in bounded memory.
 
         Returns:
-            pd.DataFrame with columns:
+            pd.DataFrame (or iterator of them with chunksize) with columns:
                 ['year','month','day','carrier','flight','origin','dest',
-                 'cancelled','delayed']
+                 'cancelled','delayed'], typed by FLIGHT_DTYPES (categorical
+                codes, uint8 / uint16 date parts, float32 delays).
 
         Raises:
             ValueError if neither valid year/month nor date_range provided.
         """
-        logger.info(
-            f"Fetching flight performance data for {year}-{month:02d} "
-            f"or date range {date_range}…"
-        )
-
-        def load_month(y, m):
-            url = f"https://transtats.bts.gov/PREZIP/On_Time_Reporting_Carrier_On_Time_Performance_1987_present_{y}_{m}.zip"
-            buf = FlightGraphFetcher._download_extract_csv(url)
-            df = pd.read_csv(buf, usecols=list(COLUMN_MAP.keys()))
-            return df.rename(columns=COLUMN_MAP)
-
         if date_range:
-            (y0, m0), (y1, m1) = date_range
-            cur, last = datetime(y0, m0, 1), datetime(y1, m1, 1)
-            dfs = []
-            while cur <= last:
-                dfs.append(load_month(cur.year, cur.month))
-                nxt = cur + timedelta(days=32)
-                cur = datetime(nxt.year, nxt.month, 1)
-            df = pd.concat(dfs, ignore_index=True)
+            months = _month_range(date_range)
+            logger.info(
+                f"Fetching flight performance data for date range {date_range} "
+                f"({len(months)} months)…"
+            )
         else:
             if year is None or month is None:
                 raise ValueError("Provide year & month or date_range.")
-            df = load_month(year, month)
-        # derive flags
-        df["cancelled"] = df["dep_delay"].isna()
-        df["delayed"] = df["arr_delay"] > 15
+            months = [(year, month)]
+            logger.info(f"Fetching flight performance data for {year}-{month:02d}…")
+
+        urls = [BTS_MONTH_URL.format(year=y, month=m) for y, m in months]
+        store = _download_cache(cache, cache_dir)
+        if chunksize is not None:
+            return _iter_months(urls, store, workers, chunksize)
+        frames = _fetch_months(urls, store, workers, parse_workers)
+        return _concat(frames)
 
-        return df
+    @staticmethod
+    def _flight_ids(flights_df: pd.DataFrame) -> pd.Series:
+        """Flight node ids, "<carrier><flight>_<origin>_<dest>_<YYYY-MM-DD>"."""
+
+        def text(column: str, width: int = 0) -> pd.Series:
+            values = flights_df[column].astype(str)
+            return values.str.zfill(width) if width else values
+
+        return (
+            text("carrier")
+            + text("flight")
+            + "_"
+            + text("origin")
+            + "_"
+            + text("dest")
+            + "_"
+            + text("year")
+            + "-"
+            + text("month", 2)
+            + "-"
+            + text("day", 2)
+        )
 
     @staticmethod
     def build_graph(
         airlines_df: pd.DataFrame, airports_df: pd.DataFrame, flights_df: pd.DataFrame
     ) -> nx.DiGraph:
+        """
+        Build the flight graph from the three frames, column by column.
+
+        Flights whose carrier, origin or destination is not a node of the
+        graph are dropped; the number dropped for each reason is logged.
+        """
         import time
 
         t0 = time.time()
@@ -263,69 +559,128 @@ class FlightGraphFetcher:
 
         # 1) Airlines
         logger.info(f"Adding {len(airlines_df)} airlines…")
-
-        for _, r in airlines_df.iterrows():
-            G.add_node(r["carrier"], type="Airline", name=r["airline_name"])
+        G.add_nodes_from(
+            (carrier, {"type": "Airline", "name": name})
+            for carrier, name in zip(
+                airlines_df["carrier"].tolist(), airlines_df["airline_name"].tolist()
+            )
+        )
 
         # 2) Airports + City relationships
         logger.info(f"Adding {len(airports_df)} airports + city nodes…")
-
-        for _, r in airports_df.iterrows():
-            code = r["faa"]
-            city = r["city"]
-
-            # Add Airport node
-            G.add_node(
-                code,
-                type="Airport",
-                name=r["name"],
-                country=r["country"],
-                coordinates=(r["lat"], r["lon"]),
+        codes = airports_df["faa"].tolist()
+        cities = airports_df["city"].tolist()
+        nodes = []
+        # City nodes follow their first airport and never replace a node
+        seen = set(G)
+        for code, name, country, lat, lon, city in zip(
+            codes,
+            airports_df["name"].tolist(),
+            airports_df["country"].tolist(),
+            airports_df["lat"].tolist(),
+            airports_df["lon"].tolist(),
+            cities,
+        ):
+            nodes.append(
+                (
+                    code,
+                    {
+                        "type": "Airport",
+                        "name": name,
+                        "country": country,
+                        "coordinates": (lat, lon),
+                    },
+                )
             )
-
-            # Add City node if missing
-            if not G.has_node(city):
-                G.add_node(city, type="City", name=city)
-
-            # Connect Airport -> City
-            G.add_edge(code, city, relationship="LOCATED_IN")
-
-        # 3) Flights + edges
-        logger.info(f"Adding {len(flights_df)} flights + edges…")
-
-        for _, r in flights_df.iterrows():
-            fn = f"{r['carrier']}{r['flight']}_{r['origin']}_{r['dest']}_{r['year']}-{r['month']:02d}-{r['day']:02d}"
-
-            # Check if required nodes exist first
-            carrier_exists = G.has_node(r["carrier"])
-            origin_exists = G.has_node(r["origin"])
-            dest_exists = G.has_node(r["dest"])
-
-            if not (carrier_exists and origin_exists and dest_exists):
-                #logger.warning(f"⚠️ Skipping flight {fn}: missing carrier or airport(s)")
-
-                continue  # Skip this flight
-
-            # Add Flight node
-            G.add_node(
+            seen.add(code)
+            if city not in seen:
+                seen.add(city)
+                nodes.append((city, {"type": "City", "name": city}))
+        G.add_nodes_from(nodes)
+        G.add_edges_from(zip(codes, cities), relationship="LOCATED_IN")
+
+        # 3) Flights + edges, only between nodes that exist
+        known = list(G)
+        missing = {
+            reason: ~flights_df[column].isin(known)
+            for reason, column in [
+                ("unknown carrier", "carrier"),
+                ("unknown origin", "origin"),
+                ("unknown destination", "dest"),
+            ]
+        }
+        dropped = pd.concat(missing, axis=1).any(axis=1)
+        if dropped.any():
+            reasons = ", ".join(
+                f"{int(mask.sum())} {reason}"
+                for reason, mask in missing.items()
+                if mask.any()
+            )
+            logger.warning(
+                f"Dropping {int(dropped.sum())} of {len(flights_df)} flights "
+                f"({reasons})."
+            )
+        flights = flights_df[~dropped]
+        logger.info(f"Adding {len(flights)} flights + edges…")
+
+        ids = FlightGraphFetcher._flight_ids(flights).tolist()
+        carriers = flights["carrier"].tolist()
+        origins = flights["origin"].tolist()
+        dests = flights["dest"].tolist()
+        if "tail_number" in flights:
+            tails = flights["tail_number"].tolist()
+        else:
+            tails = [None] * len(ids)
+        G.add_nodes_from(
+            (
                 fn,
-                type="Flight",
-                year=int(r["year"]),
-                month=int(r["month"]),
-                day=int(r["day"]),
-                carrier=r["carrier"],
-                flight_number=r["flight"],
-                tail_number=r.get("tail_number", None),
-                origin=r["origin"],
-                dest=r["dest"],
-                cancelled=bool(r["cancelled"]),
-                delayed=bool(r["delayed"]),
+                {
+                    "type": "Flight",
+                    "year": year,
+                    "month": month,
+                    "day": day,
+                    "carrier": carrier,
+                    "flight_number": flight,
+                    "tail_number": tail,
+                    "origin": origin,
+                    "dest": dest,
+                    "cancelled": cancelled,
+                    "delayed": delayed,
+                },
             )
-
-            # Now safely add edges (no missing targets)
-            G.add_edge(fn, r["carrier"], relationship="OPERATED_BY")
-            G.add_edge(fn, r["origin"], relationship="DEPARTS_FROM")
-            G.add_edge(fn, r["dest"], relationship="ARRIVES_AT")
+            for (
+                fn,
+                year,
+                month,
+                day,
+                carrier,
+                flight,
+                tail,
+                origin,
+                dest,
+                cancelled,
+                delayed,
+            ) in zip(
+                ids,
+                flights["year"].astype(int).tolist(),
+                flights["month"].astype(int).tolist(),
+                flights["day"].astype(int).tolist(),
+                carriers,
+                flights["flight"].tolist(),
+                tails,
+                origins,
+                dests,
+                flights["cancelled"].astype(bool).tolist(),
+                flights["delayed"].astype(bool).tolist(),
+            )
+        )
+        # Each flight's edges keep the OPERATED_BY, DEPARTS_FROM, ARRIVES_AT order
+        for relationship, targets in [
+            ("OPERATED_BY", carriers),
+            ("DEPARTS_FROM", origins),
+            ("ARRIVES_AT", dests),
+        ]:
+            G.add_edges_from(zip(ids, targets), relationship=relationship)
 
         elapsed = time.time() - t0
         logger.info(
@@ -0,0 +1,117 @@
+"""
+Lazy, hash-derived node attributes.
+
+In lazy mode a node stores nothing but its id and type. Its attributes are
+computed on access from (seed, node id): the id is hashed into a random
+generator that feeds the same column builders batched generation uses, so
+G.nodes[n]["name"] returns the same value on every access and in every
+process, without keeping millions of strings in memory.
+
+Usage:
+    from graphfaker import GraphFaker
+    gf = GraphFaker(seed=42, lazy_attributes=True)
+    G = gf.generate_graph(total_nodes=1_000_000, total_edges=5_000_000)
+    G.nodes["person_17"]["name"]   # computed now, not stored
+"""
+
+import hashlib
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from graphfaker.pools import FakerPools, PoolSample
+
+# SeedSequence spawn key namespace of lazy attributes; 0 and 1 are the node
+# and edge blocks of batched generation
+LAZY_KEY = 2
+
+
+class LazyAttributes:
+    """
+    Computes the attributes of nodes of one type from their ids.
+
+    Args:
+        label: node type, e.g. "Person".
+        builder: column builder (rng, pools, n) -> dict of columns.
+        entropy: master entropy of the generator (the seed).
+        pools: FakerPools the builder samples strings from.
+    """
+
+    def __init__(self, label: str, builder, entropy: int, pools: FakerPools):
+        self.label = label
+        self.builder = builder
+        self.entropy = entropy
+        self.pools = pools
+
+    def rng(self, node) -> np.random.Generator:
+        digest = hashlib.blake2b(str(node).encode("utf-8"), digest_size=8).digest()
+        key = (LAZY_KEY, int.from_bytes(digest, "little"))
+        seq = np.random.SeedSequence(self.entropy, spawn_key=key)
+        return np.random.default_rng(seq)
+
+    def __call__(self, node) -> dict:
+        """Attributes of node, excluding "type"."""
+        data = {}
+        for name, col in self.builder(self.rng(node), self.pools, 1).items():
+            if isinstance(col, PoolSample):
+                data[name] = self.pools.get(col.provider).values[col.codes[0]]
+            elif isinstance(col, np.ndarray):
+                data[name] = col[:1].tolist()[0]
+            else:
+                data[name] = col[0]
+        return data
+
+
+class LazyNodeAttributes(MutableMapping):
+    """
+    Node attribute dict whose values are computed on access.
+
+    Nothing but the node id and a shared LazyAttributes is kept until the
+    mapping is written to; the first write stores the computed attributes.
+    """
+
+    __slots__ = ("_attributes", "_data", "_node")
+
+    def __init__(self, attributes: LazyAttributes, node):
+        self._attributes = attributes
+        self._node = node
+        self._data = None
+
+    def _computed(self) -> dict:
+        if self._data is not None:
+            return self._data
+        return {"type": self._attributes.label, **self._attributes(self._node)}
+
+    def __getitem__(self, key):
+        # "type" drives edge generation, answer it without computing the rest
+        if key == "type" and self._data is None:
+            return self._attributes.label
+        return self._computed()[key]
+
+    def __setitem__(self, key, value):
+        if self._data is None:
+            self._data = self._computed()
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        if self._data is None:
+            self._data = self._computed()
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._computed())
+
+    def __len__(self) -> int:
+        return len(self._computed())
+
+    def __repr__(self) -> str:
+        return repr(self._computed())
+
+    def __reduce__(self):
+        return (_restore, (self._attributes, self._node, self._data))
+
+
+def _restore(attributes, node, data):
+    attrs = LazyNodeAttributes(attributes, node)
+    attrs._data = data
+    return attrs
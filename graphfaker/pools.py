@@ -0,0 +1,254 @@
+"""
+Faker value pools for batched generation.
+
+Calling a Faker provider is orders of magnitude slower than a list lookup, so
+batched generation builds a pool of values per provider once and then samples
+indices into it. Pool size trades realism (how many distinct names, emails,
+... appear in the graph) for generation and memory cost.
+
+Pools are cached in memory per process and, when a cache directory is given,
+as JSON files on disk so repeated runs skip the Faker calls entirely.
+
+Usage:
+    from graphfaker.pools import FakerPools
+    pools = FakerPools(size=50_000, seed=42, cache_dir="~/.cache/graphfaker")
+    names = pools.sample("name", rng, 1_000_000)
+    codes = pools.draw("name", rng, 1_000_000)   # indices only, see resolve()
+"""
+
+import json
+import os
+from typing import Optional, Union
+
+import numpy as np
+from faker import Faker
+
+from graphfaker.logger import logger
+
+DEFAULT_POOL_SIZE = 10_000
+
+# Give up on uniqueness after this many draws per requested value
+MAX_DRAWS_PER_VALUE = 10
+
+
+def _skills(fake: Faker) -> str:
+    return ", ".join(fake.words(nb=3))
+
+
+def _product_name(fake: Faker) -> str:
+    return fake.word().capitalize()
+
+
+def _provider(name: str):
+    def call(fake: Faker) -> str:
+        return getattr(fake, name)()
+
+    return call
+
+
+# Pool name -> function producing one value from a Faker instance
+PROVIDERS = {
+    "name": _provider("name"),
+    "job": _provider("job"),
+    "email": _provider("email"),
+    "company": _provider("company"),
+    "city": _provider("city"),
+    "catch_phrase": _provider("catch_phrase"),
+    "skills": _skills,
+    "product_name": _product_name,
+}
+
+_POOL_CACHE: dict = {}
+
+
+class PoolSample:
+    """
+    Indices drawn from a named pool, resolved to values later with
+    FakerPools.resolve. Worker processes return these small integer arrays
+    instead of pickling strings back to the parent.
+    """
+
+    __slots__ = ("codes", "provider")
+
+    def __init__(self, provider: str, codes: np.ndarray):
+        self.provider = provider
+        self.codes = codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class ValuePool:
+    """A fixed array of Faker values that is sampled by index."""
+
+    def __init__(self, provider: str, values: list):
+        self.provider = provider
+        self.values = np.asarray(values, dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def sample_codes(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Draw n indices into the pool."""
+        return rng.integers(0, len(self.values), size=n, dtype=np.int32)
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Draw n values from the pool."""
+        return self.values[self.sample_codes(rng, n)]
+
+    @classmethod
+    def build(
+        cls,
+        provider: str,
+        size: int,
+        unique: bool = True,
+        seed: Optional[int] = None,
+        locale: Optional[str] = None,
+    ) -> "ValuePool":
+        """
+        Generate a pool of `size` values with a Faker provider.
+
+        Args:
+            provider: key of PROVIDERS.
+            size: number of values to generate.
+            unique: drop duplicate values. Providers with a small value space
+                (e.g. cities) may then return fewer than `size` values.
+            seed: seed for the Faker instance; each provider is seeded separately
+                so pools do not depend on the order they are built in.
+            locale: Faker locale, e.g. "en_US".
+        """
+        if provider not in PROVIDERS:
+            raise ValueError(
+                f"Unknown pool provider '{provider}'. Use one of {sorted(PROVIDERS)}."
+            )
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+
+        fake = Faker(locale)
+        if seed is not None:
+            fake.seed_instance(f"{seed}:{provider}")
+        make = PROVIDERS[provider]
+
+        if not unique:
+            return cls(provider, [make(fake) for _ in range(size)])
+
+        seen = {}
+        for _ in range(size * MAX_DRAWS_PER_VALUE):
+            seen.setdefault(make(fake), None)
+            if len(seen) >= size:
+                break
+        if len(seen) < size:
+            logger.debug(
+                f"Pool '{provider}' exhausted at {len(seen)} unique values "
+                f"(requested {size})."
+            )
+        return cls(provider, list(seen))
+
+
+class FakerPools:
+    """
+    Lazily built collection of ValuePools, one per provider.
+
+    Args:
+        size: pool size for every provider, or a dict of provider -> size.
+            Providers missing from the dict use DEFAULT_POOL_SIZE.
+        unique: keep only distinct values in each pool.
+        seed: seed for reproducible pools.
+        locale: Faker locale.
+        cache_dir: directory for on-disk pool caches; None keeps pools in memory only.
+        rows: optional dict of provider -> number of values drawn from it. Pools
+            are capped at that many values, so small graphs do not pay for
+            full-size pools; see for_rows.
+    """
+
+    def __init__(
+        self,
+        size: Union[int, dict] = DEFAULT_POOL_SIZE,
+        unique: bool = True,
+        seed: Optional[int] = None,
+        locale: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        rows: Optional[dict] = None,
+    ):
+        self.size = size
+        self.unique = unique
+        self.seed = seed
+        self.locale = locale
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.rows = rows or {}
+        self._pools: dict = {}
+
+    def pool_size(self, provider: str) -> int:
+        if isinstance(self.size, dict):
+            size = self.size.get(provider, DEFAULT_POOL_SIZE)
+        else:
+            size = self.size
+        if provider in self.rows:
+            size = min(size, max(self.rows[provider], 1))
+        return size
+
+    def for_rows(self, rows: dict) -> "FakerPools":
+        """Pools with the same settings, capped at the rows drawing from them."""
+        return FakerPools(
+            size=self.size,
+            unique=self.unique,
+            seed=self.seed,
+            locale=self.locale,
+            cache_dir=self.cache_dir,
+            rows=rows,
+        )
+
+    def _cache_path(self, key: tuple) -> str:
+        provider, size, unique, seed, locale = key
+        fname = (
+            f"{provider}_{locale or 'default'}_{size}_"
+            f"{'unique' if unique else 'any'}_{'random' if seed is None else seed}.json"
+        )
+        return os.path.join(self.cache_dir, "pools", fname)
+
+    def get(self, provider: str) -> ValuePool:
+        """Return the pool for a provider, building or loading it on first use."""
+        if provider in self._pools:
+            return self._pools[provider]
+
+        key = (provider, self.pool_size(provider), self.unique, self.seed, self.locale)
+        pool = _POOL_CACHE.get(key)
+        if pool is None and self.cache_dir:
+            path = self._cache_path(key)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    pool = ValuePool(provider, json.load(f))
+        if pool is None:
+            pool = ValuePool.build(
+                provider,
+                self.pool_size(provider),
+                unique=self.unique,
+                seed=self.seed,
+                locale=self.locale,
+            )
+            if self.cache_dir:
+                path = self._cache_path(key)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(pool.values.tolist(), f)
+        _POOL_CACHE[key] = pool
+        self._pools[provider] = pool
+        return pool
+
+    def sample(self, provider: str, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Draw n values for a provider."""
+        return self.get(provider).sample(rng, n)
+
+    def draw(self, provider: str, rng: np.random.Generator, n: int) -> PoolSample:
+        """Draw n pool indices for a provider, see resolve()."""
+        return PoolSample(provider, self.get(provider).sample_codes(rng, n))
+
+    def resolve(self, sample: PoolSample) -> np.ndarray:
+        """Values of a PoolSample."""
+        return self.get(sample.provider).values[sample.codes]
+
+    def preload(self, providers=None):
+        """Build every pool up front, e.g. before handing the pools to workers."""
+        for provider in providers or PROVIDERS:
+            self.get(provider)
+        return self
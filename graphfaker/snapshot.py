@@ -0,0 +1,222 @@
+"""
+Memory-mappable binary snapshots of graphs.
+
+save_graph writes a CSRGraph (NetworkX graphs are converted first) as one
+file of page-aligned sections: the CSR indptr/indices arrays, the node id
+string table, a sorted id permutation for lookups, and the data, codes and
+sparse indexes of every attribute column. load_graph maps the file and wraps
+the sections in read-only NumPy arrays without copying or parsing them, so
+loading takes milliseconds regardless of the graph size, and processes that
+open the same snapshot share its pages through the OS page cache.
+
+Layout:
+    MAGIC | manifest offset (uint64) | manifest length (uint64) | padding
+    section 0 | padding to PAGE_SIZE | section 1 | ... | manifest (JSON)
+
+Graph attributes and lazy attribute generators are stored pickled, so only
+load snapshots from trusted sources.
+
+Usage:
+    from graphfaker import load_graph, save_graph
+    save_graph(G, "flights.gfsnap")
+    G = load_graph("flights.gfsnap")  # CSRGraph
+"""
+
+import json
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+import networkx as nx
+import numpy as np
+
+from graphfaker.csr import Column, CSRGraph, NodeTable, StringTable, from_networkx
+
+MAGIC = b"GFSNAP01"
+SNAPSHOT_SUFFIX = ".gfsnap"
+SNAPSHOT_VERSION = 1
+# Sections start on page boundaries so every array maps to whole pages
+PAGE_SIZE = 4096
+_HEADER = struct.Struct("<8sQQ")
+
+
+class _SectionWriter:
+    """Appends page-aligned arrays to a file and records where they are."""
+
+    def __init__(self, f):
+        self.f = f
+        self.arrays: list = []
+        # id(categories) -> sections, columns drawn from one pool share them
+        self._categories: dict = {}
+
+    def _pad(self):
+        pos = self.f.tell()
+        self.f.write(b"\0" * (-pos % PAGE_SIZE))
+
+    def array(self, arr: np.ndarray) -> int:
+        """Write arr, returning its section number."""
+        arr = np.ascontiguousarray(arr)
+        self._pad()
+        self.arrays.append([self.f.tell(), arr.dtype.str, list(arr.shape)])
+        self.f.write(memoryview(arr.reshape(-1).view(np.uint8)))
+        return len(self.arrays) - 1
+
+    def strings(self, table: StringTable) -> list:
+        return [
+            self.array(np.asarray(table.offsets, dtype=np.int64)),
+            self.array(np.asarray(table.data, dtype=np.uint8)),
+        ]
+
+    def column(self, col: Column) -> dict:
+        spec = {"kind": col.kind, "data": self.array(col.data)}
+        spec["index"] = None if col.index is None else self.array(col.index)
+        spec["categories"] = None
+        if col.categories is not None:
+            key = id(col.categories)
+            if key not in self._categories:
+                table = StringTable.from_strings(str(c) for c in col.categories)
+                self._categories[key] = (col.categories, self.strings(table))
+            spec["categories"] = self._categories[key][1]
+        return spec
+
+    def blob(self, data: bytes) -> list:
+        self._pad()
+        offset = self.f.tell()
+        self.f.write(data)
+        return [offset, len(data)]
+
+
+def _id_order(ids: StringTable) -> np.ndarray:
+    """Permutation sorting the node ids, for binary search lookups."""
+    order = np.argsort(np.asarray(ids.tolist(), dtype=str), kind="stable")
+    return order.astype(np.int64)
+
+
+def save_graph(G, path) -> str:
+    """
+    Write G as a snapshot file.
+
+    Args:
+        G: CSRGraph, or nx.DiGraph / nx.Graph converted with csr.from_networkx
+            (node ids must be strings).
+        path: destination file; written atomically.
+
+    Returns:
+        The absolute path written.
+    """
+    if isinstance(G, nx.Graph):
+        G = from_networkx(G)
+    if not isinstance(G, CSRGraph):
+        raise TypeError(f"Cannot snapshot a {type(G).__name__}.")
+
+    path = os.path.abspath(os.fspath(path))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, 0, 0))
+            out = _SectionWriter(f)
+            tables = []
+            lazy = []
+            for table in G.node_tables:
+                columns = table.columns.items()
+                tables.append(
+                    {
+                        "label": table.label,
+                        "start": table.start,
+                        "stop": table.stop,
+                        "id_prefix": table.id_prefix,
+                        "columns": {name: out.column(col) for name, col in columns},
+                    }
+                )
+                lazy.append(table.lazy)
+            manifest = {
+                "version": SNAPSHOT_VERSION,
+                "node_ids": out.strings(G.node_ids),
+                "id_order": out.array(_id_order(G.node_ids)),
+                "indptr": out.array(G.indptr),
+                "indices": out.array(G.indices),
+                "node_tables": tables,
+                "edge_columns": {
+                    name: out.column(col) for name, col in G.edge_columns.items()
+                },
+                "pickled": out.blob(pickle.dumps((G.graph, lazy))),
+            }
+            manifest["arrays"] = out.arrays
+            raw = json.dumps(manifest).encode("utf-8")
+            offset = f.tell()
+            f.write(raw)
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, offset, len(raw)))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+def load_graph(path) -> CSRGraph:
+    """
+    Memory-map a snapshot written by save_graph.
+
+    The arrays of the returned CSRGraph are read-only views of the file, so
+    nothing is read until it is accessed.
+    """
+    with open(os.fspath(path), "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, offset, length = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a graphfaker snapshot.")
+    manifest = json.loads(mm[offset : offset + length])
+    if manifest["version"] != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {manifest['version']} in {path}."
+        )
+
+    def array(k: int) -> np.ndarray:
+        start, dtype, shape = manifest["arrays"][k]
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape, dtype=np.int64))
+        arr = np.frombuffer(mm, dtype=dtype, count=count, offset=start)
+        return arr.reshape(shape)
+
+    def strings(spec: list) -> StringTable:
+        return StringTable(array(spec[0]), array(spec[1]))
+
+    decoded: dict = {}
+
+    def column(spec: dict) -> Column:
+        categories = None
+        if spec["categories"] is not None:
+            key = tuple(spec["categories"])
+            if key not in decoded:
+                values = strings(spec["categories"]).tolist()
+                decoded[key] = np.asarray(values + [None], dtype=object)[:-1]
+            categories = decoded[key]
+        index = None if spec["index"] is None else array(spec["index"])
+        return Column(spec["kind"], array(spec["data"]), categories, index)
+
+    start, size = manifest["pickled"]
+    graph, lazy = pickle.loads(mm[start : start + size])
+    node_tables = [
+        NodeTable(
+            t["label"],
+            t["start"],
+            t["stop"],
+            {name: column(c) for name, c in t["columns"].items()},
+            lazy=lazy_attrs,
+            id_prefix=None if t["id_prefix"] is None else tuple(t["id_prefix"]),
+        )
+        for t, lazy_attrs in zip(manifest["node_tables"], lazy)
+    ]
+    return CSRGraph(
+        strings(manifest["node_ids"]),
+        node_tables,
+        array(manifest["indptr"]),
+        array(manifest["indices"]),
+        {name: column(c) for name, c in manifest["edge_columns"].items()},
+        graph,
+        id_order=array(manifest["id_order"]),
+    )
@@ -0,0 +1,58 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _Server:
+    """Local HTTP stand-in serving files with ETags, counting full downloads."""
+
+    def __init__(self):
+        self.files = {}
+        self.content_types = {}
+        self.downloads = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = server.files.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                etag = f'"{hash(body)}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                server.downloads += 1
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                if self.path in server.content_types:
+                    self.send_header("Content-Type", server.content_types[self.path])
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+
+@pytest.fixture
+def http_server():
+    """
+    Local HTTP server; tests put path -> body entries in its files dict and
+    optional path -> Content-Type entries in content_types.
+    """
+    server = _Server()
+    yield server
+    server.stop()
@@ -0,0 +1,139 @@
+import os
+import time
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.cache import DownloadCache, GraphCache
+
+
+def test_generate_graph_cache_hit(tmp_path, monkeypatch):
+    gf = GraphFaker(seed=7, pool_size=50)
+    G = gf.generate_graph(
+        total_nodes=60, total_edges=200, batched=True, cache_dir=tmp_path
+    )
+    assert len(GraphCache(tmp_path).entries()) == 1
+
+    # A hit must not regenerate
+    def fail(*args, **kwargs):
+        raise AssertionError("graph was regenerated")
+
+    monkeypatch.setattr(GraphFaker, "_generate_faker", fail)
+    cached = GraphFaker(seed=7, pool_size=50).generate_graph(
+        total_nodes=60, total_edges=200, batched=True, cache_dir=tmp_path
+    )
+    assert nx.utils.graphs_equal(G, cached)
+
+
+
+def test_generate_graph_skips_cache_when_not_reproducible(tmp_path):
+    GraphFaker(pool_size=50).generate_graph(
+        total_nodes=30, total_edges=60, batched=True, cache_dir=tmp_path
+    )
+    GraphFaker(seed=7).generate_graph(total_nodes=30, total_edges=60, cache_dir=tmp_path)
+    assert GraphCache(tmp_path).entries() == []
+
+def test_cache_key_covers_parameters():
+    params = {"total_nodes": 10, "total_edges": 20}
+    key = GraphCache.key("faker", params, seed=1)
+    assert key == GraphCache.key("faker", dict(reversed(params.items())), seed=1)
+    assert key != GraphCache.key("faker", params, seed=2)
+    assert key != GraphCache.key("faker", {**params, "total_nodes": 11}, seed=1)
+    assert key != GraphCache.key("osm", params, seed=1)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = GraphCache(tmp_path)
+    graphs = {name: nx.path_graph(200) for name in ("a", "b", "c")}
+    for i, (name, G) in enumerate(graphs.items()):
+        cache.put(name, G)
+        os.utime(cache._path(name), (time.time() + i, time.time() + i))
+    # Reading "a" makes "b" the least recently used entry
+    os.utime(cache._path("a"), (time.time() + 10, time.time() + 10))
+
+    cache.max_bytes = cache.size() - 1
+    cache.evict()
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_download_cache_revalidates_and_works_offline(tmp_path, http_server):
+    server = http_server
+    server.files["/a.csv"] = b"x\n1\n"
+    url = server.url + "/a.csv"
+    cache = DownloadCache(tmp_path)
+    path = cache.fetch(url)
+    assert Path(path).read_bytes() == b"x\n1\n"
+    # Unchanged: answered by 304, not downloaded again
+    assert cache.fetch(url) == path
+    assert server.downloads == 1
+
+    server.files["/a.csv"] = b"x\n2\n"
+    assert Path(cache.fetch(url)).read_bytes() == b"x\n2\n"
+    assert server.downloads == 2
+    server.stop()
+
+    # The server is gone: cached copies are still served
+    assert Path(cache.fetch(url)).read_bytes() == b"x\n2\n"
+    offline = DownloadCache(tmp_path, offline=True)
+    assert offline.fetch(url) == path
+    with pytest.raises(FileNotFoundError):
+        offline.fetch(server.url + "/missing.csv")
+
+
+def test_download_cache_evicts_with_metadata(tmp_path, http_server):
+    server = http_server
+    server.files.update({f"/{name}": name.encode() * 100 for name in "abc"})
+    cache = DownloadCache(tmp_path, max_bytes=250)
+    for i, name in enumerate("abc"):
+        path = cache.fetch(f"{server.url}/{name}")
+        os.utime(path, (time.time() + i, time.time() + i))
+    names = sorted(os.listdir(cache.directory))
+    assert len(names) == 4  # two files and their validators
+    assert not os.path.exists(cache._path(cache.key(f"{server.url}/a")))
+
+
+def test_fetch_flights_uses_download_cache(tmp_path, monkeypatch, http_server):
+    import io
+    import zipfile
+
+    from graphfaker.fetchers import flights
+
+    header = ",".join(flights.COLUMN_MAP)
+    row = "2024,1,5,3.0,20.0,AA,100,JFK,LAX,N1"
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("month.csv", f"{header}\n{row}\n")
+    server = http_server
+    server.files["/2024_1.zip"] = buf.getvalue()
+    monkeypatch.setattr(flights, "BTS_MONTH_URL", server.url + "/{year}_{month}.zip")
+    df = flights.FlightGraphFetcher.fetch_flights(2024, 1, cache_dir=tmp_path)
+    server.stop()
+    monkeypatch.setenv("GRAPHFAKER_OFFLINE", "1")
+    again = flights.FlightGraphFetcher.fetch_flights(2024, 1, cache_dir=tmp_path)
+    assert df.equals(again)
+    assert df.loc[0, "carrier"] == "AA" and bool(df.loc[0, "delayed"])
+
+
+def test_fetch_airlines_decodes_cached_and_direct_downloads_alike(
+    tmp_path, monkeypatch, http_server
+):
+    from graphfaker.fetchers import flights
+
+    server = http_server
+    server.files["/airlines.csv"] = "Code,Description\nAF,Air Fran\xe7e\n".encode(
+        "latin-1"
+    )
+    server.content_types["/airlines.csv"] = "text/csv; charset=ISO-8859-1"
+    monkeypatch.setattr(flights, "AIRLINE_LOOKUP_URL", server.url + "/airlines.csv")
+    fetch = flights.FlightGraphFetcher.fetch_airlines
+    direct = fetch(cache=False)
+    cached = fetch(cache_dir=tmp_path)
+    server.stop()
+    monkeypatch.setenv("GRAPHFAKER_OFFLINE", "1")
+    offline = fetch(cache_dir=tmp_path)
+    assert direct.loc[0, "airline_name"] == "Air Fran\xe7e"
+    assert direct.equals(cached) and direct.equals(offline)
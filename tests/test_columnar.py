@@ -0,0 +1,66 @@
+from datetime import date
+
+import networkx as nx
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.columnar import write_columnar
+
+# pyarrow is an optional extra
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_export_parquet_per_type(tmp_path, backend):
+    gf = GraphFaker(seed=3, pool_size=50, backend=backend)
+    G = gf.generate_graph(total_nodes=200, total_edges=800, batched=True)
+    gf.export_graph(G, path=str(tmp_path / "out"), format="parquet")
+
+    people = pq.read_table(tmp_path / "out" / "nodes" / "Person.parquet")
+    assert people.num_rows == 100
+    assert people.schema.field("id").type == pa.string()
+    assert people.schema.field("age").type == pa.int64()
+    assert pa.types.is_dictionary(people.schema.field("subtype").type)
+    row = people.filter(pa.compute.equal(people["id"], "person_0")).to_pylist()[0]
+    expected = {k: v for k, v in G.nodes["person_0"].items() if k != "type"}
+    assert row == {"id": "person_0", **expected}
+
+    places = pq.read_table(tmp_path / "out" / "nodes" / "Place.parquet")
+    assert places.schema.field("coordinates").type == pa.list_(pa.float64(), 2)
+    products = pq.read_table(tmp_path / "out" / "nodes" / "Product.parquet")
+    assert products.schema.field("release_date").type == pa.date32()
+    assert isinstance(products["release_date"][0].as_py(), date)
+
+    edges = sum(
+        pq.read_metadata(path).num_rows
+        for path in (tmp_path / "out" / "edges").iterdir()
+    )
+    assert edges == G.number_of_edges()
+
+
+def test_write_arrow_small_batches(tmp_path):
+    G = nx.DiGraph()
+    for i in range(10):
+        G.add_node(i, type="A", score=i / 2, tag="x" if i % 2 else None)
+    G.add_edge(0, 1, relationship="R", weight=1)
+    G.add_edge(1, 2, weight=2.5)
+    paths = write_columnar(G, tmp_path, format="arrow", batch_size=4)
+
+    with pa.ipc.open_file(paths[("node", "A")]) as reader:
+        assert [reader.get_batch(i).num_rows for i in range(3)] == [4, 4, 2]
+        nodes = reader.read_all()
+    assert nodes.schema.field("id").type == pa.int64()
+    assert nodes["tag"].to_pylist()[:2] == [None, "x"]
+    default = pa.ipc.open_file(paths[("edge", "EDGE")]).read_all()
+    assert default.to_pylist() == [{"source": 1, "target": 2, "weight": 2.5}]
+
+
+def test_arrow_rejects_unsupported_codec(tmp_path):
+    with pytest.raises(ValueError, match="lz4 or zstd"):
+        GraphFaker().export_graph(
+            nx.DiGraph(), path=str(tmp_path), format="arrow", compression="gzip"
+        )
+    G = nx.DiGraph([(0, 1)])
+    GraphFaker().export_graph(G, path=str(tmp_path), format="arrow", compression="lz4")
+    assert pa.ipc.open_file(tmp_path / "nodes" / "Node.arrow").read_all().num_rows == 2
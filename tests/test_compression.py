@@ -0,0 +1,50 @@
+import csv
+import gzip
+import io
+
+import networkx as nx
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.compression import BlockCompressor
+from graphfaker.exporters.neo4j import write_neo4j_csv
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_block_compressor_round_trip(codec):
+    if codec == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+    data = bytes(range(256)) * 1000
+    out = io.BytesIO()
+    f = BlockCompressor(out, codec, workers=3, block_size=10_000, close_raw=False)
+    with f:
+        for start in range(0, len(data), 777):
+            f.write(data[start : start + 777])
+
+    raw = out.getvalue()
+    if codec == "gzip":
+        # One member per block
+        assert raw.count(b"\x1f\x8b\x08") >= len(data) // 10_000
+        assert gzip.decompress(raw) == data
+    else:
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            io.BytesIO(raw), read_across_frames=True
+        )
+        assert reader.read() == data
+
+
+def test_export_graph_gzip(tmp_path):
+    gf = GraphFaker(seed=4, pool_size=50)
+    G = gf.generate_graph(total_nodes=100, total_edges=400, batched=True)
+    gf.export_graph(G, path=str(tmp_path / "graph.graphml"), compression="gzip")
+
+    H = nx.read_graphml(tmp_path / "graph.graphml.gz")
+    assert H.number_of_edges() == G.number_of_edges()
+    assert H.nodes["person_0"] == G.nodes["person_0"]
+
+    pytest.importorskip("pyarrow")
+    paths = write_neo4j_csv(G, tmp_path / "neo4j", compression="gzip", level=1)
+    assert paths[("node", "Person")].endswith("Person.csv.gz")
+    with gzip.open(paths[("node", "Person")], "rt", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "id:ID" and len(rows) == 51
@@ -0,0 +1,75 @@
+# tests/test_csr.py
+import networkx as nx
+import numpy as np
+
+from graphfaker.core import GraphFaker
+from graphfaker.csr import CSRGraph, StringTable, from_networkx
+
+
+def test_string_table_from_prefix():
+    table = StringTable.from_prefix("person", 12)
+    assert table.tolist() == [f"person_{i}" for i in range(12)]
+    assert table.take(np.array([11, 0])) == ["person_11", "person_0"]
+
+
+def test_csr_backend_generates_graph():
+    gf = GraphFaker(seed=3, pool_size=50, backend="csr")
+    G = gf.generate_graph(source="faker", total_nodes=100, total_edges=400)
+    assert isinstance(G, CSRGraph)
+    assert G.number_of_nodes() == 100
+    assert G.is_directed()
+    person = G.nodes["person_0"]
+    assert person["type"] == "Person" and 18 <= person["age"] <= 80
+    assert isinstance(G.nodes["place_0"]["coordinates"], tuple)
+    for u, v, data in G.edges(data=True):
+        assert G.has_edge(u, v)
+        assert G.edges[u, v] == data
+        if data["relationship"] == "VISITED":
+            assert "visit_count" in data
+        else:
+            assert "visit_count" not in data
+
+
+def test_csr_roundtrip_networkx():
+    G = nx.DiGraph()
+    G.add_node("a", type="Person", age=30, name="Ann")
+    G.add_node("b", type="Person", age=41)
+    G.add_node("c", type="Place", coordinates=(1.5, 2.5))
+    G.add_edge("a", "b", relationship="FRIENDS_WITH")
+    G.add_edge("a", "c", relationship="VISITED", visit_count=3)
+    H = from_networkx(G).to_networkx()
+    assert dict(H.nodes(data=True)) == dict(G.nodes(data=True))
+    assert sorted(H.edges(data=True)) == sorted(G.edges(data=True))
+
+
+def test_csr_export_graphml(tmp_path):
+    gf = GraphFaker(seed=3, pool_size=50, backend="csr")
+    G = gf.generate_graph(source="faker", total_nodes=50, total_edges=100)
+    path = tmp_path / "csr.graphml"
+    gf.export_graph(path=str(path))
+    R = nx.read_graphml(path)
+    assert R.number_of_nodes() == G.number_of_nodes()
+    assert R.number_of_edges() == G.number_of_edges()
+    assert R.nodes["person_1"]["name"] == G.nodes["person_1"]["name"]
+
+
+def test_csr_repeated_edges_merge_like_networkx():
+    from graphfaker.csr import CSRGraphBuilder
+
+    builder = CSRGraphBuilder()
+    builder.add_nodes("Person", ["a", "b", "c"], {})
+    G = nx.DiGraph()
+    G.add_nodes_from(["a", "b", "c"], type="Person")
+    draws = [
+        ([0, 0], [1, 2], {"relationship": "WORKS_AT", "position": ["x", "y"]}),
+        ([0], [1], {"relationship": "FRIENDS_WITH"}),
+        ([1, 0], [2, 2], {"relationship": "WORKS_AT", "position": ["z", "w"]}),
+    ]
+    for src, dst, columns in draws:
+        builder.add_edges(np.array(src), np.array(dst), columns)
+        for i, (u, v) in enumerate(zip(src, dst)):
+            data = {k: c if isinstance(c, str) else c[i] for k, c in columns.items()}
+            G.add_edge("abc"[u], "abc"[v], **data)
+    H = builder.build()
+    assert H.edges["a", "b"] == {"relationship": "FRIENDS_WITH", "position": "x"}
+    assert sorted(H.edges(data=True)) == sorted(G.edges(data=True))
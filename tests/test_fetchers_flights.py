@@ -1,5 +1,6 @@
 # tests/test_fetchers_flights.py
 import pytest
+import requests
 import pandas as pd
 import networkx as nx
 from graphfaker.fetchers.flights import FlightGraphFetcher
@@ -59,3 +60,119 @@ def test_build_graph_structure(sample_airlines_df, sample_airports_df, sample_fl
     assert G.has_edge('JFK', 'New York')
     assert G.edges['JFK', 'New York']['relationship'] == 'LOCATED_IN'
     assert G.has_edge('LAX', 'Los Angeles')
+
+def test_build_graph_drops_unknown_endpoints(sample_airlines_df, sample_airports_df, caplog):
+    flights = pd.DataFrame({
+        'year': [2024, 2024, 2024],
+        'month': [1, 1, 2],
+        'day': [1, 2, 3],
+        'carrier': ['AA', 'ZZ', 'DL'],
+        'flight': [100, 200, 300],
+        'origin': ['JFK', 'JFK', 'SFO'],
+        'dest': ['LAX', 'LAX', 'JFK'],
+        'tail_number': ['N1', 'N2', 'N3'],
+        'cancelled': [False, False, True],
+        'delayed': [True, False, False]
+    })
+    with caplog.at_level("WARNING", logger="graphfaker"):
+        G = FlightGraphFetcher.build_graph(sample_airlines_df, sample_airports_df, flights)
+    flight_nodes = [n for n, t in G.nodes(data='type') if t == 'Flight']
+    assert flight_nodes == ['AA100_JFK_LAX_2024-01-01']
+    assert G.nodes['AA100_JFK_LAX_2024-01-01']['tail_number'] == 'N1'
+    assert list(G.successors('AA100_JFK_LAX_2024-01-01')) == ['AA', 'JFK', 'LAX']
+    assert "Dropping 2 of 3 flights (1 unknown carrier, 1 unknown origin)" in caplog.text
+
+def _month_zip(year, month, flights):
+    import io
+    import zipfile
+
+    from graphfaker.fetchers.flights import COLUMN_MAP
+
+    rows = [",".join(COLUMN_MAP)] + [
+        f"{year},{month},1,0.0,{delay},AA,{n},JFK,LAX,N1" for n, delay in flights
+    ]
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr(f"{year}_{month}.csv", "\n".join(rows) + "\n")
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_fetch_flights_date_range_concurrent(monkeypatch, http_server, parse_workers):
+    from graphfaker.fetchers import flights
+
+    months = [(2023, 11), (2023, 12), (2024, 1)]
+    for i, (y, m) in enumerate(months):
+        http_server.files[f"/{y}_{m}.zip"] = _month_zip(y, m, [(i, 5.0), (i + 10, 30.0)])
+    monkeypatch.setattr(flights, "BTS_MONTH_URL", http_server.url + "/{year}_{month}.zip")
+
+    df = FlightGraphFetcher.fetch_flights(
+        date_range=((2023, 11), (2024, 1)), cache=False, workers=3, parse_workers=parse_workers
+    )
+    assert df["month"].tolist() == [11, 11, 12, 12, 1, 1]
+    assert df["flight"].tolist() == [0, 10, 1, 11, 2, 12]
+    assert df["delayed"].tolist() == [False, True] * 3
+    assert df["carrier"].dtype == "category" and df["month"].dtype == "uint8"
+    assert df["dep_delay"].dtype == "float32"
+
+    del http_server.files["/2023_12.zip"]
+    with pytest.raises(requests.HTTPError):
+        FlightGraphFetcher.fetch_flights(
+            date_range=((2023, 11), (2024, 1)), cache=False, parse_workers=parse_workers
+        )
+
+
+def test_fetch_flights_parses_in_process_by_default(monkeypatch, http_server):
+    from graphfaker.fetchers import flights
+
+    for m in (1, 2):
+        http_server.files[f"/2024_{m}.zip"] = _month_zip(2024, m, [(m, 5.0)])
+    monkeypatch.setattr(flights, "BTS_MONTH_URL", http_server.url + "/{year}_{month}.zip")
+    # Worker processes would fail in scripts without a __main__ guard
+    monkeypatch.setattr(flights, "ProcessPoolExecutor", None)
+
+    df = FlightGraphFetcher.fetch_flights(date_range=((2024, 1), (2024, 2)), cache=False)
+    assert df["month"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_fetch_flights_small_cache_keeps_months_until_parsed(
+    monkeypatch, http_server, tmp_path, parse_workers
+):
+    from graphfaker.cache import DownloadCache
+    from graphfaker.fetchers import flights
+
+    for m in range(1, 7):
+        http_server.files[f"/2024_{m}.zip"] = _month_zip(2024, m, [(m, 5.0)])
+    monkeypatch.setattr(flights, "BTS_MONTH_URL", http_server.url + "/{year}_{month}.zip")
+    # Room for two months: every download evicts, but never a month in flight
+    cache = DownloadCache(tmp_path, max_bytes=2 * len(http_server.files["/2024_1.zip"]))
+
+    df = FlightGraphFetcher.fetch_flights(
+        date_range=((2024, 1), (2024, 6)), cache=cache, workers=6, parse_workers=parse_workers
+    )
+    assert df["month"].tolist() == [1, 2, 3, 4, 5, 6]
+    chunks = FlightGraphFetcher.fetch_flights(
+        date_range=((2024, 1), (2024, 6)), cache=cache, workers=6, chunksize=1
+    )
+    assert [int(c["month"].iloc[0]) for c in chunks] == [1, 2, 3, 4, 5, 6]
+    assert cache.size() <= cache.max_bytes and not cache._pins
+
+
+def test_fetch_flights_chunks_stream_from_disk(monkeypatch, http_server, tmp_path):
+    import tempfile
+
+    from graphfaker.fetchers import flights
+
+    for m in (1, 2):
+        http_server.files[f"/2024_{m}.zip"] = _month_zip(2024, m, [(1, 5.0), (2, 30.0), (3, 0.0)])
+    monkeypatch.setattr(flights, "BTS_MONTH_URL", http_server.url + "/{year}_{month}.zip")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    chunks = FlightGraphFetcher.fetch_flights(
+        date_range=((2024, 1), (2024, 2)), cache=False, chunksize=2
+    )
+    sizes = [(int(c["month"].iloc[0]), len(c)) for c in chunks]
+    assert sizes == [(1, 2), (1, 1), (2, 2), (2, 1)]
+    # Spooled zips are removed once parsed
+    assert list(tmp_path.iterdir()) == []
@@ -1,7 +1,7 @@
 # tests/test_graph_from_source_faker
 import pytest
 import networkx as nx
-from graphfaker.core import GraphFaker
+from graphfaker.core import EDGE_DISTRIBUTION, GraphFaker
 
 def test_graph_from_source_faker():
     gf = GraphFaker()
@@ -14,3 +14,111 @@ def test_graph_from_source_faker():
     # is_directed() should be True
     assert G.is_directed() == True
 
+
+def test_graph_from_source_faker_batched():
+    gf = GraphFaker(seed=42, pool_size=100)
+    G = gf.generate_graph(source="faker", total_nodes=100, total_edges=50, batched=True)
+    assert G.number_of_nodes() == 100
+    # Same attribute schema as the row-by-row generator
+    assert set(G.nodes["person_0"]) == {
+        "type", "name", "age", "occupation", "email",
+        "education_level", "skills", "subtype",
+    }
+    assert set(G.nodes["place_0"]) == {
+        "type", "name", "place_type", "population", "coordinates",
+    }
+    assert 18 <= G.nodes["person_0"]["age"] <= 80
+    assert isinstance(G.nodes["product_0"]["price"], float)
+    # Same seed, same graph
+    G2 = GraphFaker(seed=42, pool_size=100).generate_graph(
+        source="faker", total_nodes=100, total_edges=50, batched=True
+    )
+    assert dict(G.nodes(data=True)) == dict(G2.nodes(data=True))
+
+
+def test_batched_edges_follow_distribution():
+    gf = GraphFaker(seed=1, pool_size=100)
+    G = gf.generate_graph(source="faker", total_nodes=200, total_edges=1000, batched=True)
+    for u, v, data in G.edges(data=True):
+        if data["relationship"] == "VISITED":
+            assert G.nodes[u]["type"] == "Person" and G.nodes[v]["type"] == "Place"
+            assert 1 <= data["visit_count"] <= 20
+        elif data["relationship"] == "PURCHASED":
+            assert set(data) == {"relationship", "date", "amount"}
+        elif data["relationship"] == "FRIENDS_WITH":
+            assert G.has_edge(v, u)
+        assert u != v
+
+
+def test_sharded_generation_is_worker_independent(monkeypatch):
+    # Small blocks so the graph spans several shards
+    monkeypatch.setattr("graphfaker.core.BLOCK_SIZE", 50)
+    graphs = [
+        GraphFaker(seed=11, pool_size=100).generate_graph(
+            source="faker", total_nodes=300, total_edges=600, batched=True,
+            workers=workers,
+        )
+        for workers in (1, 2)
+    ]
+    assert dict(graphs[0].nodes(data=True)) == dict(graphs[1].nodes(data=True))
+    assert sorted(graphs[0].edges(data=True)) == sorted(graphs[1].edges(data=True))
+
+
+def test_streaming_batches_match_generated_graph():
+    batches = list(
+        GraphFaker(seed=4, pool_size=100).iter_node_batches(total_nodes=500, batch_size=120)
+    )
+    assert [len(b) for b in batches] == [120, 120, 120, 120, 20]
+    edge_batches = GraphFaker(seed=4, pool_size=100).iter_edge_batches(
+        total_nodes=500, total_edges=1000, batch_size=400
+    )
+    G = GraphFaker(seed=4, pool_size=100).generate_graph(
+        source="faker", total_nodes=500, total_edges=1000, batched=True
+    )
+    assert dict(r for b in batches for r in b) == dict(G.nodes(data=True))
+    streamed = {(u, v): d for batch in edge_batches for u, v, d in batch}
+    assert streamed.keys() == set(G.edges())
+    # A DiGraph merges the attributes of repeated draws, the stream keeps each draw
+    for (u, v), data in streamed.items():
+        assert data.items() <= G.edges[u, v].items()
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_exact_edge_count(backend, monkeypatch):
+    monkeypatch.setattr("graphfaker.core.BLOCK_SIZE", 500)
+    gf = GraphFaker(seed=2, pool_size=100, backend=backend)
+    G = gf.generate_graph(
+        source="faker", total_nodes=400, total_edges=3001, exact_edges=True
+    )
+    assert G.number_of_edges() == 3001
+    assert not any(u == v for u, v in G.edges())
+    assert set(gf.resample_rounds) == set(EDGE_DISTRIBUTION)
+
+
+def test_exact_edge_count_is_worker_independent(monkeypatch):
+    monkeypatch.setattr("graphfaker.core.BLOCK_SIZE", 200)
+    edges = []
+    for workers in (1, 2):
+        gf = GraphFaker(seed=8, pool_size=100, backend="csr")
+        G = gf.generate_graph(
+            total_nodes=300, total_edges=2000, exact_edges=True, workers=workers
+        )
+        edges.append(set(G.edges()))
+    assert edges[0] == edges[1]
+
+
+def test_exact_edge_count_beyond_capacity():
+    with pytest.raises(ValueError):
+        GraphFaker(seed=1).generate_graph(
+            source="faker", total_nodes=20, total_edges=1000, exact_edges=True
+        )
+
+
+def test_batched_dates_do_not_depend_on_today():
+    from graphfaker.core import DATE_END
+
+    G = GraphFaker(seed=3, pool_size=50).generate_graph(
+        source="faker", total_nodes=200, total_edges=400, batched=True
+    )
+    dates = [d["start_date"] for _, d in G.nodes(data=True) if d["type"] == "Event"]
+    assert dates and max(dates) <= str(DATE_END)
@@ -0,0 +1,42 @@
+import io
+
+import networkx as nx
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.graphml import write_graphml
+
+
+def test_export_graph_does_not_mutate_graph(tmp_path):
+    gf = GraphFaker(seed=1, pool_size=50)
+    G = gf.generate_graph(source="faker", total_nodes=50, total_edges=200, batched=True)
+    path = tmp_path / "graph.graphml"
+    gf.export_graph(G, path=str(path))
+
+    assert isinstance(G.nodes["place_0"]["coordinates"], tuple)
+    H = nx.read_graphml(path)
+    lat, lon = G.nodes["place_0"]["coordinates"]
+    assert H.nodes["place_0"]["coordinates"] == f"{lat},{lon}"
+    assert H.nodes["person_0"] == G.nodes["person_0"]
+    assert nx.utils.edges_equal(H.edges(data=True), G.edges(data=True))
+
+
+def test_write_graphml_to_binary_handle_multigraph():
+    G = nx.MultiDiGraph(crs="epsg:4326")
+    G.add_edge(1, 2, key=0, length=1.5, name=["a", "b"])
+    G.add_edge(1, 2, key=1, length=2)
+    buf = io.BytesIO()
+    write_graphml(G, buf)
+
+    H = nx.read_graphml(io.BytesIO(buf.getvalue()), force_multigraph=True)
+    assert H.graph["crs"] == "epsg:4326"
+    assert H.edges["1", "2", 0] == {"length": 1.5, "name": "['a', 'b']"}
+    assert H.edges["1", "2", 1] == {"length": 2.0}
+
+
+def test_write_graphml_stringify():
+    G = nx.DiGraph()
+    G.add_node("a", x=1.0, flag=True)
+    out = io.StringIO()
+    write_graphml(G, out, stringify=True)
+    H = nx.read_graphml(io.StringIO(out.getvalue()))
+    assert H.nodes["a"] == {"x": "1.0", "flag": "True"}
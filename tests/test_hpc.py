@@ -0,0 +1,64 @@
+import gzip
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.hpc import format_ints, write_hpc
+
+
+def small_graph():
+    G = nx.MultiDiGraph()
+    G.add_edges_from([("a", "b"), ("a", "b"), ("b", "c"), ("c", "c")])
+    G.add_node("d")
+    return G
+
+
+def test_format_ints():
+    values = np.array([0, 7, 10, -1, 123456, 2**33])
+    ends = np.array([32, 10, 32, 10, 10, 10], dtype=np.uint8)
+    assert format_ints(values, ends) == b"0 7\n10 \n123456\n8589934592\n"
+
+
+def test_edgelist_and_mtx_parts(tmp_path):
+    paths = write_hpc(small_graph(), tmp_path / "bin", part_edges=3)
+    assert (tmp_path / "bin" / "ids.txt").read_text() == "a\nb\nc\nd\n"
+    pairs = [np.fromfile(p, dtype="<i4").reshape(-1, 2) for p in paths[1:]]
+    assert np.concatenate(pairs).tolist() == [[0, 1], [0, 1], [1, 2], [2, 2]]
+
+    paths = write_hpc(small_graph(), tmp_path / "mtx", format="mtx", part_edges=3)
+    assert [p.rsplit("/", 1)[1] for p in paths] == [
+        "ids.txt",
+        "edges-00000.mtx",
+        "edges-00001.mtx",
+    ]
+    assert Path(paths[2]).read_text() == (
+        "%%MatrixMarket matrix coordinate pattern general\n4 4 1\n3 3\n"
+    )
+
+    # Undirected graphs become symmetric matrices over the lower triangle
+    paths = write_hpc(nx.path_graph(3), tmp_path / "sym", format="mtx")
+    assert Path(paths[1]).read_text().splitlines()[0].endswith("symmetric")
+    assert Path(paths[1]).read_text().splitlines()[2:] == ["2 1", "3 2"]
+
+
+def test_metis_csr_graph(tmp_path):
+    paths = write_hpc(small_graph(), tmp_path / "m", format="metis")
+    assert Path(paths[1]).read_text() == "4 2\n2\n1 3\n2\n\n"
+
+    G = GraphFaker(seed=3, pool_size=50, backend="csr").generate_graph(
+        total_nodes=200, total_edges=600, batched=True
+    )
+    paths = write_hpc(G, tmp_path / "csr", format="metis", compression="gzip")
+    with gzip.open(paths[0], "rt") as f:
+        assert f.read().splitlines() == G.node_ids.tolist()
+    with gzip.open(paths[1], "rt") as f:
+        header, *lines = f.read().split("\n")[:-1]
+
+    H = nx.Graph(G.to_networkx())
+    H.remove_edges_from(nx.selfloop_edges(H))
+    assert header == f"{G.number_of_nodes()} {H.number_of_edges()}"
+    index = {n: i + 1 for i, n in enumerate(G.node_ids)}
+    for n, line in zip(G.node_ids, lines):
+        assert sorted(map(int, line.split())) == sorted(index[v] for v in H[n])
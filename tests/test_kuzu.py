@@ -0,0 +1,100 @@
+import networkx as nx
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.common import graph_tables
+from graphfaker.exporters.kuzu import kuzu_schema, load_kuzu, write_kuzu
+
+# pyarrow is an optional extra
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def flight_style_graph():
+    G = nx.MultiDiGraph()
+    G.add_node(1, type="Airport", name="JFK", elevation=13)
+    G.add_node(2, type="City", name="New York")
+    G.add_node(3, type="Airline", name="Delta")
+    G.add_edge(1, 2, relationship="LOCATED_IN")
+    G.add_edge(3, 2, relationship="LOCATED_IN", since="2020-01-01")
+    G.add_edge(3, 1, relationship="OPERATES_AT")
+    return G
+
+
+def test_write_kuzu_schema_and_files(tmp_path):
+    statements = write_kuzu(flight_style_graph(), tmp_path)
+
+    assert statements[:4] == [
+        (
+            "CREATE NODE TABLE `Airport`(id INT64, `name` STRING, "
+            "`elevation` INT64, PRIMARY KEY (id));"
+        ),
+        "CREATE NODE TABLE `City`(id INT64, `name` STRING, PRIMARY KEY (id));",
+        "CREATE NODE TABLE `Airline`(id INT64, `name` STRING, PRIMARY KEY (id));",
+        (
+            "CREATE REL TABLE `LOCATED_IN`(FROM `Airline` TO `City`, "
+            "FROM `Airport` TO `City`, `key` STRING, `since` DATE);"
+        ),
+    ]
+    # One COPY per rel table pair, with the from/to options
+    rels = tmp_path / "rels"
+    assert (
+        f"COPY `LOCATED_IN` FROM '{rels / 'LOCATED_IN_Airline_City.parquet'}' "
+        "(from='Airline', to='City');"
+    ) in statements
+    assert f"COPY `OPERATES_AT` FROM '{rels / 'OPERATES_AT.parquet'}';" in statements
+    assert (tmp_path / "copy.cypher").read_text().splitlines() == [
+        s for s in statements if s.startswith("COPY")
+    ]
+
+    located = pq.read_table(rels / "LOCATED_IN_Airline_City.parquet")
+    assert located.column_names == ["source", "target", "key", "since"]
+    assert located.to_pylist()[0]["source"] == 3
+
+
+def test_write_kuzu_escapes_paths(tmp_path):
+    directory = tmp_path / "it's"
+    statements = write_kuzu(flight_style_graph(), directory)
+    path = str(directory / "rels" / "OPERATES_AT.parquet").replace("'", "\\'")
+    assert f"COPY `OPERATES_AT` FROM '{path}';" in statements
+
+
+def test_kuzu_schema_table_names(tmp_path):
+    G = nx.DiGraph()
+    G.add_node("a", type="Check-in")
+    G.add_node("b", type="2024 Event")
+    G.add_edge("a", "b", relationship="AT")
+    statements = kuzu_schema(graph_tables(G))
+    # Node tables are created before the rel tables that reference them
+    assert statements == [
+        "CREATE NODE TABLE `Check_in`(id STRING, PRIMARY KEY (id));",
+        "CREATE NODE TABLE `T_2024_Event`(id STRING, PRIMARY KEY (id));",
+        "CREATE REL TABLE `AT`(FROM `Check_in` TO `T_2024_Event`);",
+    ]
+
+    G.add_node("c", type="Check in")
+    with pytest.raises(ValueError, match="'Check-in' and node 'Check in'"):
+        kuzu_schema(graph_tables(G))
+    G.remove_node("c")
+    G.add_node("c", type="AT")
+    with pytest.raises(ValueError, match="both map to the Kuzu table 'AT'"):
+        write_kuzu(G, tmp_path / "kuzu")
+    # The collision is reported before any table file is written
+    assert not (tmp_path / "kuzu").exists()
+
+
+@pytest.mark.parametrize("format", ["parquet", "csv"])
+def test_load_kuzu(tmp_path, format):
+    pytest.importorskip("kuzu")
+    G = GraphFaker(seed=2, pool_size=50, backend="csr").generate_graph(
+        total_nodes=200, total_edges=800, batched=True
+    )
+    # A quote in the path must not break the COPY statements
+    write_kuzu(G, tmp_path / "it's", format=format)
+    conn = load_kuzu(tmp_path / "it's", tmp_path / "graph.kuzu")
+
+    count = conn.execute("MATCH ()-[r]->() RETURN count(r)").get_next()[0]
+    assert count == G.number_of_edges()
+    row = conn.execute(
+        "MATCH (p:Place) WHERE p.id = 'place_0' RETURN p.coordinates"
+    ).get_next()
+    assert tuple(row[0]) == G.nodes["place_0"]["coordinates"]
@@ -0,0 +1,60 @@
+import pickle
+
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.lazy import LazyNodeAttributes
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_lazy_attributes_are_stable(backend):
+    G = GraphFaker(seed=5, pool_size=50, backend=backend, lazy_attributes=True)
+    G = G.generate_graph(total_nodes=200, total_edges=500)
+    data = dict(G.nodes["person_3"])
+    assert data["type"] == "Person"
+    assert {"name", "email", "occupation", "skills"} <= set(data)
+    assert dict(G.nodes["person_3"]) == data
+
+    other = GraphFaker(seed=5, pool_size=50, lazy_attributes=True)
+    other.generate_nodes(total_nodes=200)
+    assert dict(other.G.nodes["person_3"]) == data
+    assert dict(pickle.loads(pickle.dumps(G)).nodes["person_3"]) == data
+
+
+def test_lazy_attributes_store_nothing_until_written():
+    gf = GraphFaker(seed=5, pool_size=50, lazy_attributes=True)
+    gf.generate_nodes(total_nodes=100)
+    attrs = gf.G.nodes["place_1"]
+    assert isinstance(attrs, LazyNodeAttributes)
+    assert attrs._data is None
+    assert attrs["type"] == "Place"
+    assert attrs._data is None
+
+    name = attrs["name"]
+    attrs["population"] = 7
+    assert attrs["population"] == 7
+    assert attrs["name"] == name
+
+
+def test_lazy_networkx_edges_are_reproducible():
+    graphs = [
+        GraphFaker(seed=9, pool_size=50, lazy_attributes=True).generate_graph(
+            total_nodes=200, total_edges=500
+        )
+        for _ in range(2)
+    ]
+    assert sorted(graphs[0].edges(data=True)) == sorted(graphs[1].edges(data=True))
+
+
+def test_lazy_nodes_are_visible_after_mixed_inserts():
+    gf = GraphFaker(seed=5, pool_size=50, lazy_attributes=True)
+    gf.G.add_node("person_0", type="Person", name="Kept")
+    nodes, adj = gf.G.nodes, gf.G.adj
+    gf.generate_nodes(total_nodes=20)
+    gf.G.add_edge("person_1", "extra")
+
+    assert len(gf.G) == 21 and "place_0" in nodes and "place_0" in adj
+    assert gf.G.nodes["person_0"]["name"] == "Kept"
+    assert isinstance(gf.G.nodes["place_0"], LazyNodeAttributes)
+    assert set(gf.G.adj["person_1"]) == {"extra"}
+    assert "node_attr_dict_factory" not in vars(gf.G)
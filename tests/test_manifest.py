@@ -0,0 +1,115 @@
+import json
+
+import networkx as nx
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.columnar import write_columnar
+from graphfaker.exporters.manifest import MANIFEST_FILENAME, part_files
+
+# pyarrow is an optional extra
+pa = pytest.importorskip("pyarrow")
+pacsv = pytest.importorskip("pyarrow.csv")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _month(flights: range) -> nx.DiGraph:
+    """Flight graph shape: airports repeat every month, flights are new."""
+    G = nx.DiGraph()
+    for code, city in [("JFK", "New York"), ("LAX", "Los Angeles")]:
+        G.add_node(code, type="Airport")
+        G.add_node(city, type="City")
+        G.add_edge(code, city, relationship="LOCATED_IN")
+    for i in flights:
+        G.add_node(f"F{i}", type="Flight", delay=i)
+        G.add_edge(f"F{i}", "JFK", relationship="DEPARTS_FROM")
+        G.add_edge(f"F{i}", "LAX", relationship="ARRIVES_AT")
+    return G
+
+
+def test_append_writes_only_the_delta(tmp_path):
+    write_columnar(_month(range(3)), tmp_path)
+    paths = write_columnar(_month(range(3, 5)), tmp_path, append=True)
+
+    assert set(paths) == {
+        ("node", "Flight"),
+        ("edge", "DEPARTS_FROM"),
+        ("edge", "ARRIVES_AT"),
+    }
+    manifest = json.loads((tmp_path / MANIFEST_FILENAME).read_text())
+    assert [(p["part"], p["nodes"], p["edges"]) for p in manifest["parts"]] == [
+        (0, 7, 8),
+        (1, 2, 4),
+    ]
+    delta = part_files(tmp_path, since=1)
+    flights = pq.read_table(delta[("node", "Flight")][0])
+    assert flights["id"].to_pylist() == ["F3", "F4"]
+
+    every = part_files(tmp_path)
+    rows = sum(pq.read_metadata(p).num_rows for p in every[("node", "Flight")])
+    assert rows == 5
+
+    # Nothing new, no part; a regular export starts over
+    assert write_columnar(_month(range(5)), tmp_path, append=True) == {}
+    write_columnar(_month(range(2)), tmp_path)
+    assert len(json.loads((tmp_path / MANIFEST_FILENAME).read_text())["parts"]) == 1
+    assert not (tmp_path / "part-00001").exists()
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_appended_parts_read_as_one_dataset(tmp_path, format):
+    ds = pytest.importorskip("pyarrow.dataset")
+
+    G = nx.DiGraph()
+    for i, team in enumerate(["red", "red", "blue", "blue"]):
+        G.add_node(f"p{i}", type="Person", score=i, team=team)
+    write_columnar(G, tmp_path, format=format)
+    # New rows infer float scores and, unique, string rather than category teams
+    G.add_node("p4", type="Person", score=4.0, team="green")
+    G.add_node("p5", type="Person", team="gold")
+    write_columnar(G, tmp_path, format=format, append=True)
+
+    paths = part_files(tmp_path)[("node", "Person")]
+    data = ds.dataset(paths, format="ipc" if format == "arrow" else format)
+    table = data.to_table()
+    assert table.schema == data.schema
+    assert table.schema.field("score").type == pa.int64()
+    assert table.schema.field("team").type == pa.dictionary(pa.int32(), pa.string())
+    assert table["score"].to_pylist() == [0, 1, 2, 3, 4, None]
+    assert table["team"].to_pylist()[-2:] == ["green", "gold"]
+
+    # Values that do not fit, and new columns, are rejected
+    G.add_node("p6", type="Person", score=6.5)
+    with pytest.raises(ValueError, match="'score' of type double"):
+        write_columnar(G, tmp_path, format=format, append=True)
+    assert not (tmp_path / "part-00002").exists()
+    G.nodes["p6"].update(score=6, age=30)
+    with pytest.raises(ValueError, match=r"columns \['age'\]"):
+        write_columnar(G, tmp_path, format=format, append=True)
+
+
+def test_append_neo4j_and_csr(tmp_path):
+    gf = GraphFaker(seed=1, pool_size=20, backend="csr")
+    G = gf.generate_graph(total_nodes=60, total_edges=200, batched=True)
+    gf.export_graph(G, path=str(tmp_path), format="neo4j", compression="gzip")
+    gf.export_graph(G, path=str(tmp_path), format="neo4j", append=True)
+    assert len(part_files(tmp_path, since=1)) == 0
+
+    H = nx.DiGraph()
+    H.add_node("person_0", type="Person", name="Already exported")
+    H.add_node("person_new", type="Person", name="New")
+    H.add_edge("person_new", "person_0", relationship="FRIENDS_WITH")
+    H.add_edge("person_0", "person_1", relationship="FRIENDS_WITH")
+    gf.export_graph(H, path=str(tmp_path), format="neo4j", append=True)
+    delta = part_files(tmp_path, since=1)
+    nodes = pacsv.read_csv(delta[("node", "Person")][0])
+    assert nodes["id:ID"].to_pylist() == ["person_new"]
+    # New edges count even between nodes exported before
+    edges = pacsv.read_csv(delta[("edge", "FRIENDS_WITH")][0])
+    pairs = zip(edges[":START_ID"].to_pylist(), edges[":END_ID"].to_pylist())
+    assert sorted(pairs) == [("person_0", "person_1"), ("person_new", "person_0")]
+
+    with pytest.raises(ValueError):
+        write_columnar(H, tmp_path, append=True)
+    with pytest.raises(ValueError):
+        gf.export_graph(H, path=str(tmp_path / "g.db"), append=True)
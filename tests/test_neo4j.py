@@ -0,0 +1,105 @@
+import csv
+import re
+from datetime import date
+
+import networkx as nx
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.neo4j import neo4j_import_command, write_neo4j_csv
+
+# The exporter reads the graph through pyarrow, an optional extra
+pytest.importorskip("pyarrow")
+
+# name:type property fields and the special fields of the import format
+HEADER_FIELD = re.compile(
+    r"^(\w+:ID|:LABEL|:START_ID|:END_ID|:TYPE"
+    r"|\w+:(long|double|boolean|string|date|localdatetime|double\[\]))$"
+)
+
+PARSERS = {
+    "long": int,
+    "double": float,
+    "boolean": lambda v: {"true": True, "false": False}[v],
+    "date": lambda v: date.fromisoformat(v).isoformat(),
+    "string": str,
+    "ID": str,
+    "double[]": lambda v: [float(x) for x in v.split(";")],
+}
+
+
+def read_import_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    header, rows = rows[0], rows[1:]
+    assert all(HEADER_FIELD.match(field) for field in header), header
+    return header, rows
+
+
+def typed(header, row):
+    """Property dict of a row, parsed by the header types."""
+    out = {}
+    for field, value in zip(header, row):
+        name, _, kind = field.partition(":")
+        if name and value != "" and kind in PARSERS:
+            out[name] = PARSERS[kind](value)
+    return out
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_write_neo4j_csv_faker(tmp_path, backend):
+    gf = GraphFaker(seed=5, pool_size=50, backend=backend)
+    G = gf.generate_graph(total_nodes=200, total_edges=800, batched=True)
+    paths = write_neo4j_csv(G, tmp_path, workers=3, batch_size=64)
+
+    ids = set()
+    for (element, label), path in paths.items():
+        if element != "node":
+            continue
+        header, rows = read_import_csv(path)
+        assert header.count("id:ID") == 1 and header[-1] == ":LABEL"
+        assert {row[-1] for row in rows} == {label}
+        ids.update(row[0] for row in rows)
+        node = rows[0][0]
+        expected = {k: v for k, v in G.nodes[node].items() if k != "type"}
+        if "coordinates" in expected:
+            expected["coordinates"] = list(expected["coordinates"])
+        assert typed(header, rows[0]) == {"id": node, **expected}
+    assert len(ids) == G.number_of_nodes()
+
+    edges = 0
+    for (element, rel), path in paths.items():
+        if element != "edge":
+            continue
+        header, rows = read_import_csv(path)
+        assert header[:2] == [":START_ID", ":END_ID"] and header[-1] == ":TYPE"
+        for row in rows:
+            assert row[0] in ids and row[1] in ids and row[-1] == rel
+        edges += len(rows)
+    assert edges == G.number_of_edges()
+
+
+def test_write_neo4j_csv_flight_style_graph(tmp_path):
+    G = nx.DiGraph()
+    G.add_node("JFK", type="Airport", name='John F. "Kennedy"', elevation=13)
+    G.add_node("New York", type="City")
+    G.add_node("F1", type="Flight", cancelled=False, fl_date="2024-01-01")
+    G.add_edge("JFK", "New York", relationship="LOCATED_IN")
+    G.add_edge("F1", "JFK", relationship="DEPARTS_FROM")
+    paths = write_neo4j_csv(G, tmp_path)
+
+    header, rows = read_import_csv(paths[("node", "Airport")])
+    assert header == ["id:ID", "name:string", "elevation:long", ":LABEL"]
+    assert rows == [["JFK", 'John F. "Kennedy"', "13", "Airport"]]
+    header, rows = read_import_csv(paths[("node", "Flight")])
+    assert typed(header, rows[0]) == {
+        "id": "F1",
+        "cancelled": False,
+        "fl_date": "2024-01-01",
+    }
+    header, rows = read_import_csv(paths[("edge", "DEPARTS_FROM")])
+    assert rows == [["F1", "JFK", "DEPARTS_FROM"]]
+
+    command = neo4j_import_command(paths)
+    assert command[:4] == ["neo4j-admin", "database", "import", "full"]
+    assert f"--relationships={paths[('edge', 'LOCATED_IN')]}" in command
@@ -0,0 +1,53 @@
+# tests/test_pools.py
+import numpy as np
+import pytest
+
+from graphfaker.pools import FakerPools, ValuePool
+
+
+def test_pool_values_are_unique_and_sized():
+    pool = ValuePool.build("name", 50, unique=True, seed=7)
+    assert len(pool) == 50
+    assert len(set(pool.values)) == 50
+
+
+def test_pool_is_reproducible_per_seed():
+    a = ValuePool.build("company", 20, seed=3)
+    b = ValuePool.build("company", 20, seed=3)
+    assert a.values.tolist() == b.values.tolist()
+
+
+def test_sample_draws_from_pool():
+    pools = FakerPools(size=10, seed=1)
+    values = pools.sample("job", np.random.default_rng(0), 1000)
+    assert len(values) == 1000
+    assert set(values) <= set(pools.get("job").values)
+
+
+def test_pools_disk_cache(tmp_path, monkeypatch):
+    first = FakerPools(size={"city": 15}, seed=5, cache_dir=str(tmp_path))
+    values = first.get("city").values.tolist()
+    assert list((tmp_path / "pools").glob("city_*.json"))
+    # Drop the in-memory cache; the pool must come back from disk unchanged
+    monkeypatch.setattr("graphfaker.pools._POOL_CACHE", {})
+    monkeypatch.setattr(ValuePool, "build", None)
+    second = FakerPools(size={"city": 15}, seed=5, cache_dir=str(tmp_path))
+    assert second.get("city").values.tolist() == values
+
+
+def test_unknown_provider():
+    with pytest.raises(ValueError):
+        ValuePool.build("not_a_provider", 10)
+
+
+def test_pools_capped_at_rows():
+    from graphfaker import GraphFaker
+
+    pools = FakerPools(size=100, seed=1).for_rows({"name": 7})
+    assert len(pools.get("name")) == 7
+    assert len(pools.get("job")) == 100
+
+    gf = GraphFaker(seed=1, pool_size=10_000)
+    gf.generate_graph(total_nodes=20, total_edges=40, batched=True)
+    assert len(gf.pools.get("name")) == 10
+    assert gf.pools.size == 10_000
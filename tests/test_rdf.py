@@ -0,0 +1,78 @@
+import gzip
+import io
+import json
+
+import networkx as nx
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.rdf import write_rdf
+
+NS = "http://example.org/"
+XSD = "http://www.w3.org/2001/XMLSchema#"
+RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+
+
+def small_graph():
+    G = nx.MultiDiGraph()
+    G.add_node("person_0", type="Person", name='Ann "A"\nB', age=31)
+    G.add_node("JFK:1", type="Airport", elevation=3.5)
+    G.add_edge("person_0", "JFK:1", relationship="VISITED")
+    G.add_edge("person_0", "JFK:1", relationship="VISITED", date="2024-05-01")
+    return G
+
+
+def test_ntriples(tmp_path):
+    f = io.StringIO()
+    write_rdf(small_graph(), f, namespace=NS)
+    ann, jfk = f"<{NS}node/person_0>", f"<{NS}node/JFK%3A1>"
+    assert f.getvalue().splitlines() == [
+        f"{ann} <{RDF}type> <{NS}Person> .",
+        f'{ann} <{NS}name> "Ann \\"A\\"\\nB" .',
+        f'{ann} <{NS}age> "31"^^<{XSD}integer> .',
+        f"{jfk} <{RDF}type> <{NS}Airport> .",
+        f'{jfk} <{NS}elevation> "3.5"^^<{XSD}double> .',
+        f"{ann} <{NS}VISITED> {jfk} .",
+        f"{ann} <{NS}VISITED> {jfk} .",
+        f"_:e1 <{RDF}type> <{RDF}Statement> .",
+        f"_:e1 <{RDF}subject> {ann} .",
+        f"_:e1 <{RDF}predicate> <{NS}VISITED> .",
+        f"_:e1 <{RDF}object> {jfk} .",
+        f'_:e1 <{NS}date> "2024-05-01"^^<{XSD}date> .',
+    ]
+
+    f = io.StringIO()
+    write_rdf(small_graph(), f, edge_properties=False)
+    assert len(f.getvalue().splitlines()) == 7
+
+
+def test_jsonld(tmp_path):
+    f = io.StringIO()
+    write_rdf(small_graph(), f, format="jsonld", namespace=NS)
+    doc = json.loads(f.getvalue())
+    assert doc["@context"]["@vocab"] == NS
+    assert doc["@context"]["@base"] == f"{NS}node/"
+    ann, jfk, *edges = doc["@graph"]
+    assert ann == {
+        "@id": "person_0",
+        "@type": "Person",
+        "name": 'Ann "A"\nB',
+        "age": 31,
+    }
+    assert jfk["@id"] == "JFK%3A1" and jfk["elevation"] == 3.5
+    assert edges[0] == {"@id": "person_0", "VISITED": {"@id": "JFK%3A1"}}
+    assert edges[2]["rdf:predicate"] == {"@id": f"{NS}VISITED"}
+    assert edges[2]["date"] == {"@value": "2024-05-01", "@type": "xsd:date"}
+
+
+def test_export_graph_rdf(tmp_path):
+    gf = GraphFaker(seed=7, pool_size=50, backend="csr")
+    G = gf.generate_graph(total_nodes=100, total_edges=300, batched=True)
+    gf.export_graph(G, path=str(tmp_path / "graph.nt"), compression="gzip")
+
+    with gzip.open(tmp_path / "graph.nt.gz", "rt", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    relationship = "<http://graphfaker.org/LIVES_IN>"
+    assert sum(relationship in line for line in lines) == sum(
+        d["relationship"] == "LIVES_IN" for _, _, d in G.edges(data=True)
+    )
+    assert all(line.endswith(" .") for line in lines)
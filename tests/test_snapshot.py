@@ -0,0 +1,70 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from graphfaker import GraphFaker, load_graph, save_graph
+
+
+def test_snapshot_round_trip(tmp_path):
+    gf = GraphFaker(seed=5, pool_size=50, backend="csr")
+    G = gf.generate_graph(total_nodes=300, total_edges=1200, batched=True)
+    gf.export_graph(G, path=str(tmp_path / "graph.gfsnap"))
+
+    H = load_graph(tmp_path / "graph.gfsnap")
+    assert not H.indices.flags.writeable
+    assert np.array_equal(H.indptr, G.indptr)
+    assert np.array_equal(H.indices, G.indices)
+    assert H.graph == G.graph
+    assert list(H.nodes(data=True)) == list(G.nodes(data=True))
+    assert list(H.edges(data=True)) == list(G.edges(data=True))
+
+
+def test_snapshot_networkx_ids(tmp_path):
+    G = nx.DiGraph(name="flights")
+    G.add_node("JFK", type="Airport", elevation=13)
+    G.add_node("NYC", type="City", name="New York")
+    G.add_node("DL", type="Airline", name="Delta")
+    G.add_edge("JFK", "NYC", relationship="LOCATED_IN")
+    G.add_edge("DL", "JFK", relationship="OPERATES_AT")
+    save_graph(G, tmp_path / "flights.gfsnap")
+
+    H = load_graph(tmp_path / "flights.gfsnap")
+    # Lookups binary search the stored id order instead of building a dict
+    assert H.nodes["JFK"] == {"type": "Airport", "elevation": 13}
+    assert H.has_node("DL") and not H.has_node("LAX")
+    assert H._index is None
+    assert H.graph == {"name": "flights"}
+    assert sorted(H.edges()) == [("DL", "JFK"), ("JFK", "NYC")]
+
+
+def test_snapshot_rejects_non_string_ids(tmp_path):
+    # OSM graphs use integer ids, which would load back as strings
+    G = nx.DiGraph()
+    G.add_edge(1, 2, length=3.5)
+    with pytest.raises(TypeError, match="must be strings"):
+        save_graph(G, tmp_path / "osm.gfsnap")
+    assert not list(tmp_path.iterdir())
+
+    save_graph(nx.relabel_nodes(G, str), tmp_path / "osm.gfsnap")
+    H = load_graph(tmp_path / "osm.gfsnap")
+    assert list(H.edges(data=True)) == [("1", "2", {"length": 3.5})]
+
+
+def test_snapshot_lazy_attributes(tmp_path):
+    gf = GraphFaker(seed=6, pool_size=50, backend="csr", lazy_attributes=True)
+    G = gf.generate_graph(total_nodes=100, total_edges=300)
+    save_graph(G, tmp_path / "lazy.gfsnap")
+
+    H = load_graph(tmp_path / "lazy.gfsnap")
+    assert H.nodes["person_3"] == G.nodes["person_3"]
+
+
+def test_load_graph_rejects_other_files(tmp_path):
+    path = tmp_path / "graph.graphml"
+    path.write_bytes(b"<graphml>" + b"\0" * 64)
+    with pytest.raises(ValueError, match="not a graphfaker snapshot"):
+        load_graph(path)
+    with pytest.raises(ValueError, match="not compressed"):
+        GraphFaker().export_graph(
+            nx.DiGraph(), path=str(tmp_path / "g.gfsnap"), compression="gzip"
+        )
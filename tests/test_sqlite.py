@@ -0,0 +1,67 @@
+import sqlite3
+from datetime import datetime
+
+import networkx as nx
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.exporters.sqlite import read_sqlite, write_sqlite
+
+
+def flight_style_graph():
+    G = nx.MultiDiGraph(name="flights")
+    G.add_node("JFK", type="Airport", elevation=13, hub=True, coordinates=(40.6, -73.7))
+    G.add_node("NYC", type="City", name="New York")
+    G.add_node("DL", type="Airline", name="Delta")
+    G.add_edge("JFK", "NYC", relationship="LOCATED_IN")
+    G.add_edge("DL", "JFK", relationship="OPERATES_AT", since=datetime(2020, 1, 2))
+    G.add_edge("DL", "JFK", relationship="OPERATES_AT", since=datetime(2021, 3, 4))
+    return G
+
+
+def test_sqlite_round_trip(tmp_path):
+    G = flight_style_graph()
+    write_sqlite(G, tmp_path / "graph.sqlite", batch_size=2, transaction_rows=3)
+
+    conn = sqlite3.connect(tmp_path / "graph.sqlite")
+    assert conn.execute('SELECT id, elevation FROM "Airport"').fetchall() == [
+        ("JFK", 13)
+    ]
+    indexes = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    assert {"Airport_id", "edges_relationship"} <= {name for (name,) in indexes}
+    conn.close()
+
+    H = read_sqlite(tmp_path / "graph.sqlite")
+    assert isinstance(H, nx.MultiDiGraph) and H.graph == {"name": "flights"}
+    assert dict(H.nodes(data=True)) == dict(G.nodes(data=True))
+    assert sorted(H.edges(keys=True, data="since", default=None)) == sorted(
+        G.edges(keys=True, data="since", default=None)
+    )
+
+
+def test_sqlite_subgraph(tmp_path):
+    G = GraphFaker(seed=8, pool_size=50, backend="csr").generate_graph(
+        total_nodes=300, total_edges=1000, batched=True
+    )
+    GraphFaker().export_graph(G, path=str(tmp_path / "graph.db"))
+
+    H = read_sqlite(tmp_path / "graph.db")
+    assert dict(H.nodes(data=True)) == dict(G.nodes(data=True))
+    assert sorted(H.edges(data=True)) == sorted(G.edges(data=True))
+
+    S = read_sqlite(
+        tmp_path / "graph.db",
+        node_types=["Person", "Organization"],
+        relationships=["WORKS_AT"],
+    )
+    assert {d["type"] for _, d in S.nodes(data=True)} == {"Person", "Organization"}
+    assert S.number_of_edges() == sum(
+        d["relationship"] == "WORKS_AT" for _, _, d in G.edges(data=True)
+    )
+
+
+def test_sqlite_rejects_compression(tmp_path):
+    with pytest.raises(ValueError, match="uncompressed"):
+        GraphFaker().export_graph(
+            nx.DiGraph(), path=str(tmp_path / "g.sqlite"), compression="gzip"
+        )
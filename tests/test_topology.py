@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from graphfaker import GraphFaker
+from graphfaker.topology import TOPOLOGY_MODELS, Communities, sample_edges
+
+PERSON_PERSON = ("Person", "Person")
+
+
+@pytest.mark.parametrize("model", sorted(TOPOLOGY_MODELS))
+def test_models_draw_valid_endpoints(model):
+    rng = np.random.default_rng(0)
+    communities = (
+        Communities(rng.integers(0, 3, size=50), 3),
+        Communities(rng.integers(0, 4, size=20), 4),
+    )
+    src, tgt = sample_edges(model, {}, rng, 10_000, 50, 20, communities)
+    assert len(src) == len(tgt) == 10_000
+    assert 0 <= src.min() and src.max() < 50
+    assert 0 <= tgt.min() and tgt.max() < 20
+
+
+def test_heavy_tailed_models_skew_degrees():
+    rng = np.random.default_rng(0)
+    degrees = {}
+    for model in ("uniform", "chung_lu", "preferential"):
+        _src, tgt = sample_edges(model, {}, rng, 100_000, 10_000, 10_000)
+        degrees[model] = np.bincount(tgt, minlength=10_000).max()
+    assert degrees["chung_lu"] > 10 * degrees["uniform"]
+    assert degrees["preferential"] > 5 * degrees["uniform"]
+
+
+def test_sbm_keeps_edges_within_subtypes():
+    gf = GraphFaker(seed=3, pool_size=50)
+    G = gf.generate_graph(
+        total_nodes=1000,
+        total_edges=5000,
+        topology={PERSON_PERSON: ("sbm", {"within": 1.0})},
+    )
+    for u, v in G.edges():
+        if u.startswith("person") and v.startswith("person"):
+            assert G.nodes[u]["subtype"] == G.nodes[v]["subtype"]
+
+
+def test_topology_is_worker_independent(monkeypatch):
+    monkeypatch.setattr("graphfaker.core.BLOCK_SIZE", 200)
+    edges = []
+    for workers in (1, 2):
+        gf = GraphFaker(seed=9, pool_size=50, backend="csr")
+        G = gf.generate_graph(
+            total_nodes=500, total_edges=3000, topology="sbm", workers=workers
+        )
+        edges.append(set(G.edges()))
+    assert edges[0] == edges[1]
+
+
+def test_unknown_topology_model():
+    gf = GraphFaker(seed=1)
+    with pytest.raises(ValueError):
+        gf.generate_graph(total_nodes=50, total_edges=100, topology="small_world")